@@ -0,0 +1,41 @@
+import tracemalloc
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--max-points', type=int, default=100_000,
+        help='Largest data size of the benchmark suite, by default 100000.'
+             ' Use --max-points=10000000 for the full suite.')
+
+
+def peak_memory(function):
+    """Peak memory allocated by Python while function runs, in bytes."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def measure(benchmark, request):
+    """Benchmark function and record its peak memory in extra_info.
+
+    Sizes above --max-points are skipped. Large sizes are timed once,
+    small ones as often as pytest-benchmark sees fit.
+    """
+    def run(function, group, points):
+        if points > request.config.getoption('--max-points'):
+            pytest.skip(f'{points} points is above --max-points')
+
+        benchmark.group = group
+        benchmark.extra_info['points'] = points
+        # measured in a run of its own, tracemalloc slows code down a lot
+        benchmark.extra_info['peak_bytes'] = peak_memory(function)
+        if points >= 1_000_000:
+            return benchmark.pedantic(function, rounds=1, iterations=1)
+        return benchmark(function)
+    return run
@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator.bar_chart import bar_chart
+from plotly_chart_generator.chart_styles import bar_values, chart_styles
+from plotly_chart_generator.display_chart import display_chart
+
+
+@pytest.mark.parametrize('n_annotations', [10, 1_000, 10_000])
+def test_display_chart_annotations(benchmark, n_annotations):
+    rows = n_annotations // 10
+    df = pd.DataFrame(np.random.default_rng(0).integers(1, 9, (rows, 10)))
+    traces = bar_chart(df)
+    annotations = bar_values(df, orientation='v')
+    layout = chart_styles()
+
+    benchmark.group = 'display_chart-annotations'
+    benchmark.extra_info['annotations'] = len(annotations)
+    fig = benchmark(display_chart, traces, layout, annotations=annotations,
+                    mode='stack', iplot=False)
+    assert len(fig.layout.annotations) == n_annotations
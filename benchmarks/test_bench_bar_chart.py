@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator.bar_chart import bar_chart
+
+
+@pytest.mark.parametrize('rows', [100, 1_000, 5_000])
+@pytest.mark.parametrize('orientation', ['v', 'h'])
+def test_bar_chart_scaling(benchmark, rows, orientation):
+    df = pd.DataFrame(
+        np.random.default_rng(0).random((rows, 60)),
+        index=[f'row {i}' for i in range(rows)],
+        columns=[f'col {i}' for i in range(60)])
+    if orientation == 'h':
+        df = df.T
+
+    benchmark.group = f'bar_chart-{orientation}'
+    benchmark.extra_info['rows'] = rows
+    traces = benchmark(bar_chart, df, orientation=orientation)
+    assert len(traces) == rows
@@ -0,0 +1,15 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator.chart_styles import bar_values
+
+
+@pytest.mark.parametrize('rows', [20, 200, 2_000])
+def test_bar_values(benchmark, rows):
+    df = pd.DataFrame(np.random.default_rng(0).integers(1, 9, (rows, 20)))
+
+    benchmark.group = 'bar_values'
+    benchmark.extra_info['annotations'] = df.size
+    annotations = benchmark(bar_values, df, orientation='h')
+    assert len(annotations) == df.size
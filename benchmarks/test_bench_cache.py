@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import FigureCache, display_chart, line_chart
+from plotly_chart_generator import to_json
+from plotly_chart_generator.cache import figure_key
+
+ROWS, POINTS = 10, 100_000
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(ROWS, POINTS)).cumsum(axis=1),
+                        columns=pd.date_range('2020-01-01', periods=POINTS,
+                                              freq='min'))
+
+
+def test_uncached(benchmark, frame):
+    def build():
+        fig = display_chart(line_chart(frame), {}, iplot=False)
+        return to_json(fig)
+
+    benchmark.group = 'cache'
+    benchmark.extra_info['points'] = ROWS * POINTS
+    benchmark.pedantic(build, rounds=3, iterations=1)
+
+
+def test_hit(benchmark, frame):
+    cache = FigureCache()
+    cache.figure(line_chart, frame, layout={}, raw=True)
+
+    benchmark.group = 'cache'
+    benchmark.extra_info['points'] = ROWS * POINTS
+    benchmark(cache.figure, line_chart, frame, layout={}, raw=True)
+
+
+def test_key(benchmark, frame):
+    benchmark.group = 'cache'
+    benchmark.extra_info['points'] = ROWS * POINTS
+    benchmark(figure_key, line_chart, (frame,), {}, {})
@@ -0,0 +1,15 @@
+import pytest
+import seaborn as sns
+
+from plotly_chart_generator.chart_styles import chart_colors
+
+
+@pytest.mark.parametrize('source', ['seaborn', 'chart_colors'])
+def test_named_palette(benchmark, source):
+    def build():
+        if source == 'seaborn':
+            return sns.color_palette('viridis', 12).as_hex()
+        return chart_colors('palette', 'viridis', 12)
+
+    benchmark.group = 'named-palette'
+    benchmark(build)
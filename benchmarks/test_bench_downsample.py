@@ -0,0 +1,17 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator.line_chart import line_chart
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+@pytest.mark.parametrize('points', [100_000, 1_000_000])
+def test_line_chart_downsample(benchmark, method, points):
+    df = pd.DataFrame(
+        np.random.default_rng(0).standard_normal((4, points)).cumsum(axis=1))
+
+    benchmark.group = f'line_chart-downsample-{method}'
+    benchmark.extra_info['points'] = points
+    benchmark(line_chart, df, downsample=2_000, downsample_method=method,
+              raw=True)
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+import pytest
+
+from plotly_chart_generator import display_chart, line_chart, render_many
+
+pytest.importorskip('kaleido')
+
+N_FIGURES = 40
+
+
+@pytest.fixture(scope='module')
+def figures():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(5, 200)).cumsum(axis=1))
+    return [display_chart(line_chart(df), dict(title=f'Figure {i}'),
+                          iplot=False) for i in range(N_FIGURES)]
+
+
+@pytest.mark.parametrize('workers', ['serial', 1, 4])
+def test_export(benchmark, figures, tmp_path, workers):
+    def export():
+        if workers == 'serial':
+            for i, figure in enumerate(figures):
+                pio.write_image(figure, tmp_path / f'figure_{i}.png')
+        else:
+            render_many(figures, out_dir=tmp_path, workers=workers)
+
+    benchmark.group = 'export'
+    benchmark.extra_info['figures'] = N_FIGURES
+    benchmark.pedantic(export, rounds=3, iterations=1)
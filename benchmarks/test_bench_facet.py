@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator.subplots import facet, grid_subplots
+
+N_ROWS = 1_000_000
+
+
+@pytest.fixture(scope='module')
+def long_frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(dict(
+        region=rng.choice([f'region {i}' for i in range(15)], N_ROWS),
+        product=rng.choice([f'product {i}' for i in range(20)], N_ROWS),
+        day=rng.integers(0, 365, N_ROWS),
+        sales=rng.random(N_ROWS)))
+
+
+@pytest.mark.parametrize('method', ['groupby+pivot', 'facet'])
+def test_facet(benchmark, long_frame, method):
+    def build():
+        if method == 'facet':
+            return facet(long_frame, row='region', col='product', x='day',
+                         y='sales', kind='scatter', iplot=False,
+                         validate=False)
+        # what had to be done by hand before
+        panels, titles = [], []
+        for (region, product), group in long_frame.groupby(
+                ['region', 'product']):
+            panels.append(dict(type='scatter', mode='markers',
+                               x=group['day'].to_numpy(),
+                               y=group['sales'].to_numpy()))
+            titles.append(f'{region} | {product}')
+        return grid_subplots(panels, 15, 20, titles, iplot=False,
+                             validate=False)
+
+    benchmark.group = 'facet'
+    benchmark.extra_info['rows'] = N_ROWS
+    benchmark.pedantic(build, rounds=3, iterations=1)
@@ -0,0 +1,38 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# cumulative import time budget in microseconds, as reported by
+# `python -X importtime`; the eager imports took well over 500 ms
+BUDGET = 100_000
+
+
+def import_time(statement):
+    """Cumulative import time of plotly_chart_generator in microseconds."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement], cwd=ROOT,
+        check=True, capture_output=True, text=True)
+    for line in result.stderr.splitlines():
+        _, _, cumulative, module = (part.strip() for part in
+                                    line.replace(':', '|', 1).split('|'))
+        if module == 'plotly_chart_generator':
+            return int(cumulative)
+    raise AssertionError('plotly_chart_generator was not imported')
+
+
+@pytest.mark.parametrize('statement', [
+    'import plotly_chart_generator',
+    'from plotly_chart_generator import bar_chart',
+])
+def test_import_time(benchmark, statement):
+    benchmark.group = 'import'
+    timings = benchmark.pedantic(
+        import_time, args=(statement,), rounds=5, iterations=1)
+
+    benchmark.extra_info['importtime_us'] = timings
+    if statement == 'import plotly_chart_generator':
+        assert timings < BUDGET
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import LineStream, display_chart, line_chart
+
+ROWS, WINDOW, TICK = 5, 5000, 10
+
+
+def frame(start, n):
+    rng = np.random.default_rng(start)
+    return pd.DataFrame(rng.random((ROWS, n)),
+                        index=[f'line {i}' for i in range(ROWS)],
+                        columns=np.arange(start, start + n))
+
+
+@pytest.mark.parametrize('history', [10_000, 100_000])
+@pytest.mark.parametrize('method', ['redraw', 'stream'])
+def test_tick(benchmark, method, history):
+    data = frame(0, history)
+    tick = frame(history, TICK)
+
+    if method == 'redraw':
+        def update():
+            full = pd.concat((data, tick), axis=1)
+            return display_chart(line_chart(full, webgl_threshold=None,
+                                            raw=True), {}, iplot=False)
+    else:
+        stream = LineStream(data, {}, window=WINDOW, history=1000,
+                            widget=False, webgl_threshold=None)
+
+        def update():
+            stream.append(tick)
+
+    benchmark.group = f'stream-tick-{history}'
+    benchmark.extra_info['history'] = history
+    benchmark(update)
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import line_chart
+
+ROWS, SERIES, DAYS = 10_000_000, 50, 1_000
+
+
+@pytest.fixture(scope='module')
+def events():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'day': rng.integers(0, DAYS, ROWS),
+        'series': pd.Categorical.from_codes(
+            rng.integers(0, SERIES, ROWS),
+            [f'series {i}' for i in range(SERIES)]),
+        'value': rng.random(ROWS)})
+
+
+@pytest.mark.parametrize('path', ['pivot_table', 'long-format'])
+def test_long_format_line_chart(benchmark, events, path):
+    def build():
+        if path == 'pivot_table':
+            wide = events.pivot_table(index='series', columns='day',
+                                      values='value', observed=False)
+            return line_chart(wide, raw=True)
+        return line_chart(events, x='day', y='value', series='series',
+                          raw=True)
+
+    benchmark.group = 'long-format'
+    benchmark.extra_info['rows'] = ROWS
+    benchmark.pedantic(build, rounds=3, iterations=1)
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import build_many, display_chart, line_chart
+from plotly_chart_generator import to_json
+
+CHARTS, ROWS, POINTS = 200, 5, 2000
+
+
+@pytest.fixture(scope='module')
+def frames():
+    rng = np.random.default_rng(0)
+    columns = pd.date_range('2020-01-01', periods=POINTS, freq='min')
+    return [pd.DataFrame(rng.normal(size=(ROWS, POINTS)).cumsum(axis=1),
+                         columns=columns) for _ in range(CHARTS)]
+
+
+def test_serial(benchmark, frames):
+    def build():
+        return [to_json(display_chart(line_chart(df, raw=True), {},
+                                      iplot=False, validate=False))
+                for df in frames]
+
+    benchmark.group = 'build_many'
+    benchmark.extra_info['charts'] = CHARTS
+    benchmark.pedantic(build, rounds=3, iterations=1)
+
+
+def test_build_many(benchmark, frames):
+    specs = [('line_chart', df, None, {}) for df in frames]
+
+    benchmark.group = 'build_many'
+    benchmark.extra_info['charts'] = CHARTS
+    benchmark.extra_info['workers'] = os.cpu_count()
+    benchmark.pedantic(build_many, args=(specs,), rounds=3, iterations=1)
@@ -0,0 +1,23 @@
+import pytest
+
+from plotly_chart_generator import profile, sunburst_chart
+
+LABELS = ['a', 'b', 'c']
+PARENTS = ['', 'a', 'a']
+VALUES = [3, 1, 2]
+
+
+@pytest.mark.parametrize('mode', ['uninstrumented', 'off', 'on'])
+def test_instrumentation_overhead(benchmark, mode):
+    function = sunburst_chart.__wrapped__ if mode == 'uninstrumented' \
+        else sunburst_chart
+
+    def build():
+        return function(LABELS, PARENTS, VALUES, raw=True)
+
+    benchmark.group = 'profiling-overhead'
+    if mode == 'on':
+        with profile():
+            benchmark(build)
+    else:
+        benchmark(build)
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator.bar_chart import bar_chart
+from plotly_chart_generator.chart_styles import chart_styles
+from plotly_chart_generator.display_chart import display_chart
+
+
+@pytest.mark.parametrize('raw, validate', [
+    (False, True), (True, True), (True, False)])
+def test_bar_figure_validation(benchmark, raw, validate):
+    df = pd.DataFrame(np.random.default_rng(0).random((2_000, 20)))
+    layout = chart_styles()
+
+    def build():
+        traces = bar_chart(df, raw=raw)
+        return display_chart(traces, layout, iplot=False, validate=validate)
+
+    benchmark.group = 'bar-figure-validation'
+    benchmark(build)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import display_chart, line_chart, to_json
+
+ROWS, POINTS = 10, 100_000
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(ROWS, POINTS)).cumsum(axis=1),
+                        columns=pd.date_range('2020-01-01', periods=POINTS,
+                                              freq='min'))
+
+
+@pytest.mark.parametrize('path', [
+    'fig.to_json', 'to_json(json)', 'to_json(orjson)', 'to_json(raw)'])
+def test_serialize(benchmark, frame, path):
+    if path == 'to_json(raw)':
+        fig = display_chart(line_chart(frame, raw=True), {}, iplot=False,
+                            validate=False)
+    else:
+        fig = display_chart(line_chart(frame), {}, iplot=False)
+
+    if path == 'fig.to_json':
+        serialize = fig.to_json
+    else:
+        engine = 'json' if path == 'to_json(json)' else 'orjson'
+        serialize = lambda: to_json(fig, engine=engine)  # noqa: E731
+
+    benchmark.group = 'serialize'
+    benchmark.extra_info['points'] = ROWS * POINTS
+    benchmark.pedantic(serialize, rounds=3, iterations=1)
+
+
+@pytest.mark.parametrize('path', ['build+fig.to_json', 'build+to_json(raw)'])
+def test_build_and_serialize(benchmark, frame, path):
+    def build():
+        if path == 'build+fig.to_json':
+            return display_chart(line_chart(frame), {}, iplot=False).to_json()
+        return to_json(display_chart(line_chart(frame, raw=True), {},
+                                     iplot=False, validate=False))
+
+    benchmark.group = 'build-and-serialize'
+    benchmark.pedantic(build, rounds=3, iterations=1)
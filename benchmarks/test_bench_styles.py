@@ -0,0 +1,17 @@
+import pytest
+
+from plotly_chart_generator.chart_styles import chart_styles, style_template
+from plotly_chart_generator.display_chart import display_chart
+
+
+@pytest.mark.parametrize('styles', ['dict', 'template'])
+def test_styled_figure(benchmark, styles):
+    def build():
+        if styles == 'dict':
+            layout = chart_styles(title='Sales', width=600, height=400)
+        else:
+            layout = style_template(title='Sales', width=600, height=400)
+        return display_chart([], layout, iplot=False)
+
+    benchmark.group = 'styled-figure'
+    benchmark(build)
@@ -0,0 +1,34 @@
+import numpy as np
+import plotly.graph_objs as go
+import pytest
+from plotly.subplots import make_subplots
+
+from plotly_chart_generator.subplots import grid_subplots
+
+SIDE = 20
+
+
+@pytest.fixture(scope='module')
+def series():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(SIDE * SIDE, 50)).cumsum(axis=1)
+
+
+@pytest.mark.parametrize('engine', ['make_subplots', 'grid', 'grid(raw)'])
+def test_small_multiples(benchmark, series, engine):
+    titles = [f'Panel {i}' for i in range(len(series))]
+
+    def build():
+        if engine == 'make_subplots':
+            fig = make_subplots(rows=SIDE, cols=SIDE, subplot_titles=titles)
+            for i, y in enumerate(series):
+                fig.add_trace(go.Scatter(y=y),
+                              row=i // SIDE + 1, col=i % SIDE + 1)
+            return fig
+        panels = [dict(type='scatter', y=y) for y in series]
+        return grid_subplots(panels, SIDE, SIDE, titles, iplot=False,
+                             validate=engine == 'grid')
+
+    benchmark.group = 'small-multiples'
+    benchmark.extra_info['panels'] = len(series)
+    benchmark.pedantic(build, rounds=1, iterations=1)
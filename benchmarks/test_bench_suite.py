@@ -0,0 +1,113 @@
+"""Every chart function over data sizes from 10 to 10M points.
+
+Run offline and compare commits with pytest-benchmark's storage:
+
+    pytest benchmarks/test_bench_suite.py --benchmark-autosave
+    pytest benchmarks/test_bench_suite.py --benchmark-compare
+
+Every result records its `points` and the `peak_bytes` allocated by
+Python in `extra_info`. Sizes above --max-points (100k by default) are
+skipped.
+"""
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import (
+    bar_chart, box_plot, display_chart, dot_chart, histogram, line_chart,
+    scatter_chart, sunburst_chart, to_json)
+from plotly_chart_generator.chart_styles import (
+    bar_headings, bar_values, chart_styles)
+from plotly_chart_generator.pie_chart import pie_chart
+from plotly_chart_generator.subplots import pie_subplots, scatter_subplots
+
+SIZES = (10, 1_000, 100_000, 10_000_000)
+# charts are drawn from this many rows or panels
+SERIES = 10
+
+
+def _rng():
+    return np.random.default_rng(0)
+
+
+def _wide(points):
+    """SERIES rows of points / SERIES values, one column per x value."""
+    columns = max(1, points // SERIES)
+    return pd.DataFrame(
+        _rng().normal(size=(SERIES, columns)).cumsum(axis=1),
+        index=[f'series {i}' for i in range(SERIES)],
+        columns=pd.date_range('2020-01-01', periods=columns, freq='min'))
+
+
+def _labels(points):
+    return [f'label {i}' for i in range(points)]
+
+
+def _scatter_data(points, names=False):
+    rng = _rng()
+    size = max(1, points // SERIES)
+    return {f'group {i}': dict(x=rng.random(size), y=rng.random(size),
+                               **({'names': None} if names else {}))
+            for i in range(SERIES)}
+
+
+def _pie_data(points):
+    size = max(1, points // SERIES)
+    return {f'pie {i}': dict(zip(_labels(size), _rng().random(size)))
+            for i in range(SERIES)}
+
+
+def _sunburst(points):
+    labels = _labels(points)
+    parents = [''] + [labels[(i - 1) // 4] for i in range(1, points)]
+    return labels, parents, _rng().random(points)
+
+
+def _display_and_serialize(df):
+    fig = display_chart(line_chart(df, raw=True), chart_styles(title='T'),
+                        iplot=False, validate=False)
+    return to_json(fig)
+
+
+# name: (function of the size returning the call to time, largest size)
+CASES = {
+    'bar_chart': (lambda n: partial(bar_chart, _wide(n)), None),
+    'line_chart': (lambda n: partial(line_chart, _wide(n)), None),
+    'scatter_chart': (
+        lambda n: partial(scatter_chart, _scatter_data(n)), None),
+    'dot_chart': (lambda n: partial(dot_chart, _wide(n)), None),
+    'histogram': (lambda n: partial(histogram, _rng().normal(size=n)), None),
+    'box_plot': (lambda n: partial(box_plot, _wide(n).T), None),
+    # one slice, sector or annotation per point
+    'pie_chart': (
+        lambda n: partial(pie_chart, _labels(n), _rng().random(n)), 100_000),
+    'sunburst_chart': (
+        lambda n: partial(sunburst_chart, *_sunburst(n)), 100_000),
+    'pie_subplots': (lambda n: partial(
+        pie_subplots, _pie_data(n), 2, SERIES // 2, None, {}, iplot=False),
+        100_000),
+    'scatter_subplots': (lambda n: partial(
+        scatter_subplots, _scatter_data(n, names=True), {}, 2, SERIES // 2,
+        None, iplot=False), None),
+    'bar_values': (lambda n: partial(bar_values, _wide(n)), 100_000),
+    'bar_headings': (lambda n: partial(bar_headings, _wide(n)), 100_000),
+    'display_chart+to_json': (
+        lambda n: partial(_display_and_serialize, _wide(n)), None),
+}
+
+
+@pytest.mark.parametrize('points', SIZES)
+@pytest.mark.parametrize('case', CASES)
+def test_suite(measure, case, points):
+    make, largest = CASES[case]
+    if largest is not None and points > largest:
+        pytest.skip(f'{case} is not meant for {points} points')
+
+    measure(make(points), case, points)
+
+
+def test_chart_styles(measure):
+    measure(lambda: chart_styles(title='Title', x_title='x', y_title='y'),
+            'chart_styles', 0)
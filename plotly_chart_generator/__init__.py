@@ -1,10 +1,21 @@
-from . display_chart import display_chart
-from . bar_chart import bar_chart
-from . line_chart import line_chart
-from . scatter_chart import scatter_chart
-from . dot_chart import dot_chart
-from . histogram import histogram
-from . sunburst_chart import sunburst_chart
-from . box_plot import box_plot
-from . import chart_styles
-from . import subplots
+from .utils.lazy import lazy_package as _lazy_package
+
+_lazy_package(__name__, {
+    'display_chart': ('.display_chart', 'display_chart'),
+    'bar_chart': ('.bar_chart', 'bar_chart'),
+    'line_chart': ('.line_chart', 'line_chart'),
+    'scatter_chart': ('.scatter_chart', 'scatter_chart'),
+    'dot_chart': ('.dot_chart', 'dot_chart'),
+    'histogram': ('.histogram', 'histogram'),
+    'sunburst_chart': ('.sunburst_chart', 'sunburst_chart'),
+    'box_plot': ('.box_plot', 'box_plot'),
+    'LineStream': ('.line_stream', 'LineStream'),
+    'render_many': ('.export', 'render_many'),
+    'build_many': ('.parallel', 'build_many'),
+    'write_report': ('.report', 'write_report'),
+    'to_json': ('.serialize', 'to_json'),
+    'FigureCache': ('.cache', 'FigureCache'),
+    'profile': ('.profiling', 'profile'),
+    'chart_styles': ('.chart_styles', None),
+    'subplots': ('.subplots', None),
+})
@@ -1,6 +1,9 @@
-import plotly.graph_objs as go
+from .profiling import instrument
+from .utils.frame import input_rows
+from .utils.traces import make_trace
 
 
+@instrument('build')
 def bar_chart(
         df,
         orientation='v',
@@ -10,6 +13,12 @@ def bar_chart(
         linewidth=1,
         linecolor='#2C3347',
         marker_color=None,
+        x=None,
+        y=None,
+        series=None,
+        aggfunc='mean',
+        dtype=None,
+        raw=False,
         **kwargs):
     """Horizontal and vertical bar-charts.
 
@@ -43,8 +52,10 @@ def bar_chart(
 
     Parameters
     ----------
-    df : DataFrame
-        Contains the data to be charted
+    df : DataFrame, pyarrow Table or Polars DataFrame
+        Contains the data to be charted.
+        A pyarrow Table or Polars DataFrame is read without pandas,
+        with a trace per column and the `x` column as labels
     layout : dict
         Chart layout, formatting and styles
     orientation : str, optional
@@ -82,16 +93,41 @@ def bar_chart(
         Width of outer border of each bar, by default 1
     linecolor : str, optional
         Color of outer border of each bar, by default '#2C3347'
+    x : str, optional
+        With `y`, `df` holds long-format data, one observation per row,
+        and `x` is the column with the x values. The traces are built
+        as from df.pivot_table(index=series, columns=x, values=y,
+        aggfunc=aggfunc), without creating the wide frame.
+        By default None (`df` is wide)
+    y : str, optional
+        Column with the values of long-format data, by default None
+    series : str, optional
+        Column of long-format data whose values get their own trace.
+        By default None, a single trace
+    aggfunc : str, optional
+        'mean' or 'sum' of long-format rows with the same series and x
+        value, by default 'mean'
+    dtype : numpy dtype, optional
+        Type the values are converted to, e.g. np.float32 to halve the
+        memory of float64 data. By default the frame's own type
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
     """
 
+    # Convert the frame once so every trace is a view of the same block.
+    # For horizontal charts each trace is a column of the frame.
+    block, names, labels = input_rows(
+        df, 0 if orientation == 'v' else 1, dtype, x, y, series, aggfunc)
+    labels = [str(x) for x in labels]
+
     traces = []
-    rng = df.index.size if orientation == 'v' else df.columns.size
     otn = orientation
-    for i in range(rng):
-        x = [str(x) for x in df.columns] if otn == 'v' else df.iloc[:, i]
-        y = df.iloc[i] if otn == 'v' else [str(x) for x in df.index]
-        text = df.iloc[i] if otn == 'v' else df.iloc[:, i]
-        name = df.iloc[i].name if otn == 'v' else df.columns[i]
+    for i, values in enumerate(block):
+        x = labels if otn == 'v' else values
+        y = values if otn == 'v' else labels
+        text = values
+        name = names[i]
 
         preset_args = dict(
             x=x,
@@ -110,7 +146,7 @@ def bar_chart(
         )
 
         all_args = {**preset_args, **kwargs}
-        bar = go.Bar(all_args)
+        bar = make_trace('bar', all_args, raw)
         traces.append(bar)
 
     return traces
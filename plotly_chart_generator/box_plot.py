@@ -1,16 +1,29 @@
-import plotly.graph_objs as go
+import numpy as np
+import pandas as pd
 
+from .profiling import instrument
+from .utils.box_stats import STATS, box_stats, pad
+from .utils.frame import frame_rows
+from .utils.tables import (
+    as_array, as_table, column_names, is_table, table_column)
+from .utils.traces import make_trace
 
+
+@instrument('build')
 def box_plot(y=None, x=None, boxpoints=False,
-             boxmean=True, jitter=0.3, pointpos=-1.5, opacity=0.9):
+             boxmean=True, jitter=0.3, pointpos=-1.5, opacity=0.9,
+             max_outliers=1000, raw=False):
     """Box plot
 
     Parameters
     ----------
-    y : list, numpy array, pandas series, optional
-        Sets the y sample data or coordinates, by default None
-    x : list, numpy array, pandas series, optional
-        Sets the x sample data or coordinates, by default None
+    y : DataFrame, list of pandas series or arrays, optional
+        Samples drawn as vertical boxes, one box per DataFrame column
+        or list item. A single series or array gives one box. pyarrow
+        Tables, Polars DataFrames and their columns are read without
+        pandas. By default None
+    x : DataFrame, list of pandas series or arrays, optional
+        Samples drawn as horizontal boxes, by default None
     boxpoints : str, bool, optional
         Choose between 'all', 'outliers', suspectedoutliers and False.
         If "outliers", only the sample points lying outside the whiskers
@@ -41,17 +54,58 @@ def box_plot(y=None, x=None, boxpoints=False,
         boxes. By default -1.5
     opacity : float, optional
         Sets the opacity of the trace, by default 0.9
+    max_outliers : int, optional
+        Maximum number of outliers sent to the chart per box when
+        `boxpoints` is 'outliers' or 'suspectedoutliers'. Larger sets of
+        outliers are thinned out evenly, the most extreme points are
+        always kept. By default 1000
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
     """
+    samples, axis = (y, 'y') if y is not None else (x, 'x')
+    position = 'x' if axis == 'y' else 'y'
+    names, arrays = _series(samples)
+
+    style = dict(boxpoints=boxpoints, boxmean=boxmean, jitter=jitter,
+                 pointpos=pointpos, opacity=opacity)
+
+    # plotly only needs the raw samples to draw all points
+    if boxpoints == 'all':
+        return [make_trace('box', {axis: values, 'name': name, **style}, raw)
+                for name, values in zip(names, arrays)]
+
+    stats = box_stats(pad(arrays), max_outliers)
+
+    traces = []
+    for i, name in enumerate(names):
+        if np.isnan(stats['median'][i]):
+            # an empty box, like plotly draws for a sample without values
+            traces.append(make_trace('box', dict(name=name, **style), raw))
+            continue
+        props = {key: [stats[key][i]] for key in STATS}
+        props[position] = [f'trace {i}' if name is None else name]
+        if boxpoints:
+            props[axis] = [stats['outliers'][i]]
+        traces.append(make_trace('box', dict(name=name, **props, **style),
+                                 raw))
+    return traces
+
+
+def _series(samples):
+    """Names and float arrays of the samples passed to box_plot."""
+    if isinstance(samples, pd.DataFrame):
+        block, names, _ = frame_rows(samples, axis=1, dtype=float)
+        return list(names), list(block)
+    if is_table(samples):
+        table = as_table(samples)
+        names = column_names(table)
+        return names, [table_column(table, name, float) for name in names]
+
+    if isinstance(samples, (pd.Series, np.ndarray)) or np.isscalar(
+            next(iter(samples), None)):
+        samples = [samples]
 
-    if y:
-        return [go.Box(y=values, boxpoints=boxpoints,
-                       name=values.name, boxmean=boxmean,
-                       jitter=jitter, pointpos=pointpos,
-                       opacity=opacity)
-                for values in y]
-    else:
-        return [go.Box(x=values, boxpoints=boxpoints,
-                       name=values.name, boxmean=boxmean,
-                       jitter=jitter, pointpos=pointpos,
-                       opacity=opacity)
-                for values in x]
+    names = [getattr(values, 'name', None) for values in samples]
+    arrays = [np.asarray(as_array(values), dtype=float) for values in samples]
+    return names, arrays
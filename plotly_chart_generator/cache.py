@@ -0,0 +1,289 @@
+import collections
+import functools
+import hashlib
+import os
+import pathlib
+import tempfile
+import threading
+import types
+
+import numpy as np
+import pandas as pd
+
+from .display_chart import display_chart
+from .serialize import to_json
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', 'hits misses disk_hits evictions entries bytes')
+
+
+class FigureCache:
+    """Cache of serialized figures, keyed on their data and arguments.
+
+    A figure is identified by the chart function, a hash of its data
+    (`pandas.util.hash_pandas_object` for pandas objects, the raw bytes
+    for NumPy arrays) and a canonical hash of all other arguments and
+    the layout. The cache stores the figure's JSON, so a hit skips both
+    building the traces and serializing the figure.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of figures kept in memory, the least recently
+        used are evicted first. By default 128
+    max_bytes : int, optional
+        Maximum total size of the JSON kept in memory, by default None
+        (no size limit)
+    directory : str or path, optional
+        Directory of an on-disk store. Figures evicted from memory, or
+        cached by another process, are then read from disk instead of
+        being rebuilt. By default None (memory only)
+
+    Example:
+    ---------
+
+    cache = FigureCache(max_bytes=512 * 2 ** 20)
+    fig_json = cache.figure(bar_chart, df, layout=layout, mode='stack')
+
+    cached_line_chart = cache.wrap(line_chart)
+    fig_json = cached_line_chart(df, layout=layout)
+    """
+
+    def __init__(self, max_entries=128, max_bytes=None, directory=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = None
+        if directory is not None:
+            self.directory = pathlib.Path(directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counts = collections.Counter()
+
+    def figure(self, builder, *args, layout=None, annotations=None,
+               shapes=None, mode=None, validate=False, **kwargs):
+        """JSON of display_chart(builder(*args, **kwargs), layout, ...).
+
+        Parameters
+        ----------
+        builder : callable
+            One of the chart functions, e.g. `bar_chart`
+        *args, **kwargs
+            Arguments of the chart function
+        layout, annotations, shapes, mode, validate
+            Arguments of `display_chart`. By default the figure is not
+            validated, see `display_chart`.
+
+        Returns
+        -------
+        str
+            The figure serialized by `to_json`
+        """
+        key = figure_key(builder, args, kwargs, dict(
+            layout=layout, annotations=annotations, shapes=shapes,
+            mode=mode, validate=validate))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._counts['hits'] += 1
+                return self._entries[key]
+
+        fig_json = self._read(key)
+        if fig_json is None:
+            fig = display_chart(
+                builder(*args, **kwargs), layout, annotations=annotations,
+                shapes=shapes, mode=mode, iplot=False, validate=validate)
+            fig_json = to_json(fig)
+            self._write(key, fig_json)
+            hit = 'misses'
+        else:
+            hit = 'disk_hits'
+
+        with self._lock:
+            self._counts[hit] += 1
+            self._store(key, fig_json)
+        return fig_json
+
+    def wrap(self, builder):
+        """Cached version of a chart function, returning figure JSON.
+
+        The wrapper takes the arguments of the chart function and the
+        keyword arguments `layout`, `annotations`, `shapes`, `mode` and
+        `validate` of `display_chart`.
+        """
+        @functools.wraps(builder)
+        def cached(*args, **kwargs):
+            return self.figure(builder, *args, **kwargs)
+        return cached
+
+    def cache_info(self):
+        """Hit, miss and eviction counts and the current memory use."""
+        with self._lock:
+            return CacheInfo(
+                self._counts['hits'], self._counts['misses'],
+                self._counts['disk_hits'], self._counts['evictions'],
+                len(self._entries), self._bytes)
+
+    def cache_clear(self):
+        """Empty the memory store and reset the statistics.
+
+        Files of the on-disk store are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._counts.clear()
+
+    def _store(self, key, fig_json):
+        if key in self._entries:
+            return
+        self._entries[key] = fig_json
+        self._bytes += len(fig_json)
+        while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None
+                    and self._bytes > self.max_bytes)):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._counts['evictions'] += 1
+
+    def _path(self, key):
+        return self.directory / f'{key}.json'
+
+    def _read(self, key):
+        if self.directory is None:
+            return None
+        try:
+            return self._path(key).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key, fig_json):
+        if self.directory is None:
+            return
+        # write to a temporary file first, so readers never see half a file
+        handle, temporary = tempfile.mkstemp(dir=self.directory,
+                                             suffix='.tmp')
+        with os.fdopen(handle, 'w', encoding='utf-8') as file:
+            file.write(fig_json)
+        os.replace(temporary, self._path(key))
+
+
+def figure_key(builder, args, kwargs, display):
+    """Hex digest identifying a chart function call and its display.
+
+    Parameters
+    ----------
+    builder : callable
+        The chart function
+    args : tuple
+        Its positional arguments
+    kwargs : dict
+        Its keyword arguments
+    display : dict
+        The arguments of `display_chart`
+    """
+    digest = hashlib.sha1()
+    _update(digest, (builder, args, kwargs, display))
+    return digest.hexdigest()
+
+
+def _update(digest, value):
+    """Feed a canonical representation of value to a hash."""
+    if isinstance(value, pd.Index):
+        digest.update(f'{type(value).__name__}:{len(value)}'.encode())
+        _update(digest, [list(value.names), value.dtype])
+        digest.update(pd.util.hash_pandas_object(value).to_numpy().tobytes())
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(f'{type(value).__name__}:{value.shape}'.encode())
+        # the row hashes cover neither the labels nor the dtypes
+        _update(digest, value.index)
+        if isinstance(value, pd.Series):
+            _update(digest, [value.name, value.dtype])
+        else:
+            codes, dtypes = pd.factorize(value.dtypes)
+            _update(digest, [value.columns, codes, list(dtypes)])
+            if len(dtypes) == 1 and value.shape[1] > value.shape[0]:
+                # the column hashes are combined one column at a time,
+                # which is slow for wide frames of one x value per column
+                value = value.T
+        digest.update(pd.util.hash_pandas_object(
+            value, index=False).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f'ndarray:{value.dtype.str}:{value.shape}'.encode())
+        if value.dtype.kind == 'O':
+            digest.update(pd.util.hash_pandas_object(
+                pd.Series(value.ravel())).to_numpy().tobytes())
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(f'dict:{len(value)}'.encode())
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}:{len(value)}'.encode())
+        for item in value:
+            _update(digest, item)
+    elif hasattr(value, 'to_plotly_json'):
+        _update(digest, value.to_plotly_json())
+    elif isinstance(value, types.FunctionType):
+        _update_function(digest, value)
+    elif callable(value) and hasattr(value, '__qualname__'):
+        digest.update(
+            f'callable:{value.__module__}.{value.__qualname__}'.encode())
+    else:
+        digest.update(f'{type(value).__name__}:{value!r}'.encode())
+
+
+def _update_function(digest, function, seen=()):
+    """Feed a function's code, defaults and closure values to a hash.
+
+    Two closures made by the same factory share their name and code,
+    only the values they close over tell them apart. Immutable values
+    are hashed, other objects by identity, since they may change
+    between calls, e.g. a list the function appends to. Globals read by
+    the function are not part of the key.
+    """
+    digest.update(f'function:{function.__module__}.'
+                  f'{function.__qualname__}'.encode())
+    if function in seen:
+        return
+    seen = (*seen, function)
+    _update_code(digest, function.__code__)
+    _update(digest, [function.__defaults__, function.__kwdefaults__])
+    for cell in function.__closure__ or ():
+        try:
+            content = cell.cell_contents
+        except ValueError:
+            content = None
+        if isinstance(content, types.FunctionType):
+            _update_function(digest, content, seen)
+        elif _immutable(content):
+            _update(digest, content)
+        else:
+            digest.update(f'{type(content).__name__}@{id(content)}'.encode())
+
+
+def _immutable(value):
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(_immutable, value))
+    return value is None or isinstance(
+        value, (bool, int, float, complex, str, bytes, type))
+
+
+def _update_code(digest, code):
+    digest.update(code.co_code)
+    _update(digest, list(code.co_names))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code(digest, const)
+        elif isinstance(const, frozenset):
+            # e.g. `x in {'a', 'b'}`, the iteration order varies by run
+            _update(digest, sorted(map(repr, const)))
+        else:
+            _update(digest, const)
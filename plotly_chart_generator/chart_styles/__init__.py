@@ -1,7 +1,12 @@
-from . chart_colors import chart_colors
-from . chart_styles import chart_styles
-from . chart_annotation import chart_annotation
-from . bar_values import bar_values
-from . bar_headings import bar_headings
-from . shape import shape
-from . theme import theme
+from ..utils.lazy import lazy_package as _lazy_package
+
+_lazy_package(__name__, {
+    'chart_colors': ('.chart_colors', 'chart_colors'),
+    'chart_styles': ('.chart_styles', 'chart_styles'),
+    'chart_annotation': ('.chart_annotation', 'chart_annotation'),
+    'bar_values': ('.bar_values', 'bar_values'),
+    'bar_headings': ('.bar_headings', 'bar_headings'),
+    'shape': ('.shape', 'shape'),
+    'theme': ('.theme', 'theme'),
+    'style_template': ('.style_template', 'style_template'),
+})
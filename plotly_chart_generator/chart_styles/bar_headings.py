@@ -1,3 +1,9 @@
+import numpy as np
+
+from ..profiling import instrument
+
+
+@instrument('annotations')
 def bar_headings(df, orientation='h', font_color='lightgrey',
                  font_family='sans-serif', font_size=15, y=1, x=0):
     """Chart headings
@@ -30,18 +36,19 @@ def bar_headings(df, orientation='h', font_color='lightgrey',
     names = df.columns if orientation == 'h' else df.index
     textangle = 0 if orientation == 'h' else -90
     xref, yref = ('x', 'paper') if orientation == 'h' else ('paper', 'y')
+    font = dict(family=font_family, size=font_size, color=font_color)
+
+    # heading centers: the running total before each bar plus half the bar
+    values = values.to_numpy()
+    space = np.zeros(values.size)
+    np.cumsum(values[:-1], out=space[1:])
+    centers = (space + values / 2).tolist()
 
     annotations = []
-    space = 0
-    for i, tupl in enumerate(zip(values, names)):
-        x = space + (tupl[0] / 2) if orientation == 'h' else x
-        y = y if orientation == 'h' else space + (tupl[0] / 2)
+    for center, name in zip(centers, names):
         annotations.append(dict(xref=xref, yref=yref,
-                                x=x, y=y, text=tupl[1],
-                                textangle=textangle,
-                                font=dict(family=font_family,
-                                          size=font_size,
-                                          color=font_color),
-                                showarrow=False))
-        space += tupl[0]
+                                x=center if orientation == 'h' else x,
+                                y=y if orientation == 'h' else center,
+                                text=name, textangle=textangle,
+                                font=dict(font), showarrow=False))
     return annotations
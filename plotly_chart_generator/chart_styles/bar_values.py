@@ -1,7 +1,15 @@
+import numpy as np
+
+from ..profiling import instrument
+from ..utils.frame import frame_rows
+
+
+@instrument('annotations')
 def bar_values(
         df, orientation='h', font_size=15,
         font_color='lightgrey',
-        font_family='sans-serif'):
+        font_family='sans-serif',
+        mode='annotations'):
     """Bar values placed in the center of each bar.
 
     [extended_summary]
@@ -19,23 +27,44 @@ def bar_values(
         Bar values font-color, by default 'lightgrey'
     font_family : str, optional
         Bar values font-family, by default 'sans-serif'
+    mode : str, optional
+        'annotations' returns one layout annotation per bar. 'text'
+        returns bar trace properties that draw the values as text on
+        the bars themselves, which renders much faster for large
+        charts. Pass them on to `bar_chart` as keyword arguments.
+        By default 'annotations'
 
     Returns
     -------
-    list of annotations containing bar values
+    list of annotations containing bar values, or a dict of bar trace
+    properties if mode is 'text'
     """
+    font = dict(family=font_family, size=font_size, color=font_color)
+
+    if mode == 'text':
+        return dict(texttemplate='%{text}', textposition='inside',
+                    insidetextanchor='middle', textangle=0, textfont=font)
+    elif mode != 'annotations':
+        raise ValueError((f'Chosen mode {mode} not available.'
+                          ' Select between `annotations` and `text`'))
+
+    # one row of the block per stacked bar
+    block, names, _ = frame_rows(df, axis=0 if orientation == 'h' else 1)
+    if orientation == 'h':
+        text = block.astype(str)
+    else:
+        text = df.astype(str).to_numpy().T
+
+    # bar centers: the running total before each bar plus half the bar
+    space = np.zeros_like(block, dtype=float)
+    np.cumsum(block[:, :-1], axis=1, out=space[:, 1:])
+    centers = (space + block / 2).tolist()
+
     annotations = []
-    size = df.index.size if orientation == 'h' else df.columns.size
-    for i in list(range(size)):
-        arr = df.iloc[i] if orientation == 'h' else df.iloc[:, i]
-        space = 0
-        for ii, val in enumerate(arr):
-            x = space + (val / 2) if orientation == 'h' else arr.name
-            y = arr.name if orientation == 'h' else space + (val / 2)
+    for name, row_centers, row_text in zip(names, centers, text.tolist()):
+        for center, value in zip(row_centers, row_text):
+            x, y = (center, name) if orientation == 'h' else (name, center)
             annotations.append(dict(xref='x', yref='y', x=x, y=y,
-                                    text=str(val), showarrow=False,
-                                    font=dict(family=font_family,
-                                              size=font_size,
-                                              color=font_color)))
-            space += val
+                                    text=value, showarrow=False,
+                                    font=dict(font)))
     return annotations
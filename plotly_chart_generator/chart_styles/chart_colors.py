@@ -1,4 +1,13 @@
-import seaborn as sns
+import collections.abc
+import colorsys
+import functools
+import json
+import pathlib
+
+import numpy as np
+
+
+PALETTE_TABLE = pathlib.Path(__file__).with_name('palettes.json')
 
 
 def chart_colors(
@@ -30,8 +39,9 @@ def chart_colors(
         colors to include in palette. Look at extended summary
         above for more information. If None is chosen a
         default Seaborn color palette is chosen. By default None
-    n_colors : int, optional
-        Number of colors in palette, by default 10
+    n_colors : int or None, optional
+        Number of colors in palette. None gives the palette's own size,
+        like seaborn. By default 10
     start_pos : int, optional
         Sets new start position to return a palette that
         starts at a different place than the orginial
@@ -116,26 +126,138 @@ def chart_colors(
     """
 
     slce = slice(start_pos, end_pos, step)
+
+    if palette_type not in ('palette', 'light', 'dark', 'xkcd'):
+        raise ValueError((f'Chosen palette_type {palette_type} not'
+                          ' available. Select between `color_palette`,'
+                          ' `light`, `dark` and `xkcd`'))
+
+    if palette_type == 'xkcd' and isinstance(color, str):
+        color = [color, ]
+    if isinstance(color, list):
+        color = tuple(color)
+
+    if n_colors is None:
+        n_colors = _default_size(palette_type, color)
+
+    # unhashable colors (e.g. arrays) are not cached
+    palette = _palette if _hashable(color) else _palette.__wrapped__
+    colors = palette(palette_type, color, n_colors, desat, input_type,
+                     reverse)
+    if palette_type == 'xkcd':
+        return list(colors)
+    return list(colors)[slce]
+
+
+@functools.lru_cache(maxsize=256)
+def _palette(palette_type, color, n_colors, desat, input_type, reverse):
+    """Hex colors of a palette, from the bundled table when possible.
+
+    Named seaborn and matplotlib palettes, 'hls' and xkcd colors are
+    generated from `palettes.json`, which is built by
+    `scripts/build_palettes.py`. Everything else is handed to seaborn,
+    which is only imported then.
+    """
+    table = _table()
+
+    if palette_type == 'palette' and isinstance(color, str):
+        if color in table['seaborn']:
+            return _cycle(table['seaborn'][color], n_colors)
+        if color == 'hls':
+            return _hls(n_colors)
+        if color in table['colormaps']:
+            return _cycle(_colormap(color, n_colors), n_colors)
+
+    if palette_type == 'xkcd' and all(c in table['xkcd'] for c in color):
+        return tuple(table['xkcd'][c] for c in color)
+
+    return tuple(_seaborn_palette(
+        palette_type, color, n_colors, input_type, reverse))
+
+
+def _hashable(color):
+    if isinstance(color, tuple):
+        return all(map(_hashable, color))
+    return isinstance(color, collections.abc.Hashable)
+
+
+def _default_size(palette_type, color):
+    """Number of colors seaborn uses when n_colors is None.
+
+    The whole palette for named qualitative palettes and color lists, 6
+    colors of other palettes. None for the default color cycle, which
+    is left to seaborn.
+    """
+    if palette_type == 'palette' and color is None:
+        return None
+    if palette_type == 'xkcd' or (
+            palette_type == 'palette' and not isinstance(color, str)):
+        return len(color)
+    table = _table()
+    if palette_type == 'palette' and color in table['seaborn']:
+        return len(table['seaborn'][color])
+    if palette_type == 'palette':
+        return table['qualitative'].get(color, 6)
+    return 6
+
+
+@functools.lru_cache(maxsize=None)
+def _table():
+    return json.loads(PALETTE_TABLE.read_text())
+
+
+def _cycle(colors, n_colors):
+    """Repeat colors until there are n_colors of them, like seaborn."""
+    return tuple(colors[i % len(colors)] for i in range(n_colors))
+
+
+def _colormap(name, n_colors):
+    """Sample a colormap the way seaborn's `mpl_palette` does.
+
+    Qualitative colormaps return their first colors, other colormaps
+    evenly spaced colors without the two extremes.
+    """
+    lookup = _table()['colormaps'][name]
+    size = len(lookup) // 6
+    qualitative = _table()['qualitative']
+    if name in qualitative:
+        bins = np.linspace(0, 1, qualitative[name])[:n_colors]
+    else:
+        bins = np.linspace(0, 1, int(n_colors) + 2)[1:-1]
+    index = np.minimum((bins * size).astype(int), size - 1)
+    return ['#' + lookup[6 * i:6 * i + 6] for i in index]
+
+
+def _hls(n_colors, hue=.01, lightness=.6, saturation=.65):
+    """Evenly spaced hues, like seaborn's `hls_palette` defaults."""
+    hues = np.linspace(0, 1, int(n_colors) + 1)[:-1]
+    hues += hue
+    hues %= 1
+    hues -= hues.astype(int)
+    return tuple(_hex(colorsys.hls_to_rgb(h, lightness, saturation))
+                 for h in hues)
+
+
+def _hex(rgb):
+    return '#' + ''.join(f'{round(value * 255):02x}' for value in rgb)
+
+
+def _seaborn_palette(palette_type, color, n_colors, input_type, reverse):
+    import seaborn as sns
+
     kwargs = dict(color=color, n_colors=n_colors,
                   input=input_type, reverse=reverse)
 
     if palette_type == 'palette':
+        if isinstance(color, tuple):
+            color = list(color)
         return sns.color_palette(
-            palette=color, n_colors=n_colors,
-            desat=None).as_hex()[slce]
+            palette=color, n_colors=n_colors, desat=None).as_hex()
 
     elif palette_type == 'light':
-        return sns.light_palette(**kwargs).as_hex()[slce]
+        return sns.light_palette(**kwargs).as_hex()
 
     elif palette_type == 'dark':
-        return sns.dark_palette(**kwargs).as_hex()[slce]
+        return sns.dark_palette(**kwargs).as_hex()
 
-    elif palette_type == 'xkcd':
-        if isinstance(color, str):
-            color = [color, ]
-        return sns.xkcd_palette(color).as_hex()
-
-    else:
-        raise ValueError((f'Chosen palette_type {palette_type} not'
-                          ' available. Select between `color_palette`,'
-                          ' `light`, `dark` and `xkcd`'))
+    return sns.xkcd_palette(list(color)).as_hex()
@@ -387,10 +387,10 @@ def chart_styles(
         plot_bgcolor=bg_color,
         paper_bgcolor=bg_color,
         margin=dict(l=ml, r=mr, b=mb, t=mt, pad=pad),
-        title=dict(text=title, x=title_alignment),
-        titlefont=dict(size=title_size,
-                       color=title_color,
-                       family=title_font_family),
+        title=dict(text=title, x=title_alignment,
+                   font=dict(size=title_size,
+                             color=title_color,
+                             family=title_font_family)),
 
         yaxis=dict(
             type=yaxis_type,
@@ -412,13 +412,14 @@ def chart_styles(
             gridcolor=grid_color,
             tickformat=yaxis_tickformat,
             tickangle=yaxis_tickangle,
-            title=y_title,
+            title=dict(
+                text=y_title,
+                font=dict(
+                    size=yaxis_titlesize,
+                    color=axis_titlecolor,
+                    family=axis_fontfamily)),
             color=axis_color,
             separatethousands=yaxis_separatethousands,
-            titlefont=dict(
-                size=yaxis_titlesize,
-                color=axis_titlecolor,
-                family=axis_fontfamily),
             tickfont=dict(
                 size=yaxis_ticksize,
                 color=tick_color)),
@@ -427,7 +428,12 @@ def chart_styles(
             type=xaxis_type,
             range=xaxis_range,
             autorange=xaxis_autorange,
-            title=x_title,
+            title=dict(
+                text=x_title,
+                font=dict(
+                    size=xaxis_titlesize,
+                    color=axis_titlecolor,
+                    family=axis_fontfamily)),
             showticklabels=xaxis_showticklabels,
             ticks=xaxis_ticks,
             tickmode=xaxis_tickmode,
@@ -446,10 +452,6 @@ def chart_styles(
             separatethousands=xaxis_separatethousands,
             gridwidth=grid_width,
             gridcolor=grid_color,
-            titlefont=dict(
-                size=xaxis_titlesize,
-                color=axis_titlecolor,
-                family=axis_fontfamily),
             tickfont=dict(
                 size=xaxis_ticksize,
                 color=tick_color)),
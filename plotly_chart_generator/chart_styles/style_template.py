@@ -0,0 +1,93 @@
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objs as go
+import plotly.io as pio
+
+from .chart_styles import chart_styles
+from .theme import theme as theme_preset
+
+
+def style_template(theme=None, **kwargs):
+    """Chart styles compiled into a registered plotly template
+
+    Validating the layout dict returned by `chart_styles` is one of the
+    slower steps of building a figure. This function validates a style
+    once: the layout is merged into plotly's default template and
+    registered in `plotly.io.templates`. Calls with the same arguments
+    return the same template name without building anything.
+
+    Example:
+    template = style_template(theme='light', title='Sales', width=600)
+    display_chart(traces, layout=template)
+
+    Parameters
+    ----------
+    theme : str, optional
+        Name of a `theme` preset merged into the styles. Arguments
+        passed explicitly take precedence. By default None
+    **kwargs
+        Any `chart_styles` argument
+
+    Returns
+    -------
+    str
+        Name of the registered template. Use it as a layout in
+        `display_chart` or as `layout.template` of a figure.
+    """
+    return _compile(theme, _freeze(kwargs))
+
+
+def template_dict(name):
+    """Plain dict of a registered template, e.g. for unvalidated figures.
+
+    Templates are looked up in `plotly.io.templates` once per name, so
+    re-registering a different template under the same name is not
+    picked up.
+    """
+    return _template_dict(name)
+
+
+def _freeze(value):
+    """Hashable version of a (nested) argument value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in
+                            value.items()))
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def _thaw(value):
+    return list(map(_thaw, value)) if isinstance(value, tuple) else value
+
+
+@lru_cache(maxsize=None)
+def _compile(theme, frozen):
+    styles = dict(theme_preset(theme) or {}) if theme else {}
+    styles.update((key, _thaw(value)) for key, value in frozen)
+
+    template = pio.templates.merge_templates(
+        pio.templates.default,
+        go.layout.Template(layout=chart_styles(**styles)))
+
+    digest = hashlib.sha1(repr((theme, frozen)).encode()).hexdigest()
+    name = f'chart_styles_{digest[:12]}'
+    pio.templates[name] = template
+    return name
+
+
+@lru_cache(maxsize=None)
+def _template_dict(name):
+    if '+' in name:
+        return pio.templates.merge_templates(
+            *name.split('+')).to_plotly_json()
+    return pio.templates[name].to_plotly_json()
+
+
+style_template.cache_info = _compile.cache_info
+style_template.cache_clear = _compile.cache_clear
@@ -1,6 +1,11 @@
 import plotly.graph_objs as go
+import plotly.io as pio
 import plotly as py
 
+from .chart_styles.style_template import template_dict
+from .profiling import count, phase
+from .utils.traces import as_dict
+
 
 def display_chart(
         traces,
@@ -9,30 +14,115 @@ def display_chart(
         shapes=None,
         mode=None,
         iplot=True,
+        validate=True,
         **kwargs):
+    """Combine traces and layout into a figure and display it.
+
+    Parameters
+    ----------
+    traces : list or trace
+        Traces created by one of the chart functions, or the single
+        trace returned by some of them. Both plotly graph objects and
+        raw trace dicts are accepted.
+    layout : dict, str or None
+        Chart layout, formatting and styles, or the name of a template
+        created by `style_template`. None is an empty layout
+    annotations : list, optional
+        Annotations to add to the chart, by default None
+    shapes : list, optional
+        Shapes to add to the chart, by default None
+    mode : str, optional
+        Bar mode, e.g. 'stack' or 'group', by default None
+    iplot : bool, optional
+        If True the chart is displayed, otherwise the figure is
+        returned. By default True
+    validate : bool, optional
+        If True a validated `go.Figure` is built. Passing raw traces
+        (see the `raw` argument of the chart functions) means they are
+        validated once, by the figure. If False, no validation is done
+        at all and the figure is a plain dict with `data` and `layout`
+        keys, with named templates expanded to dicts. By default True
+    """
+    # barmode, annotations and shapes are merged into the layout up
+    # front, so the layout is validated once instead of after every
+    # add_annotation/add_shape call
+    with phase('layout', 'display_chart'):
+        layout = _merge_layout(layout, mode)
+    if annotations or shapes:
+        with phase('annotations', 'display_chart',
+                   annotations=len(annotations or ()),
+                   shapes=len(shapes or ())):
+            _add_annotations(layout, annotations, shapes)
+
+    # histogram, pie_chart and sunburst_chart return a single trace
+    if isinstance(traces, dict) or hasattr(traces, 'to_plotly_json'):
+        traces = [traces]
+
+    with phase('validation', 'display_chart') as record:
+        if not validate:
+            template = layout.get('template', pio.templates.default)
+            if isinstance(template, str):
+                layout['template'] = template_dict(template)
+            fig = dict(data=[as_dict(trace) for trace in traces],
+                       layout=layout)
+        else:
+            template = layout.get('template')
+            if isinstance(template, str) and template in pio.templates:
+                del layout['template']
+                fig = go.Figure(data=traces, layout=layout)
+                _set_template(fig, template)
+            else:
+                fig = go.Figure(data=traces, layout=layout)
+        if record is not None:
+            record.update(count(fig.data if validate else fig['data'],
+                                'build'))
+
+    if iplot:
+        with phase('display', 'display_chart'):
+            return py.offline.iplot(fig, validate=validate)
+    else:
+        return fig
+
 
-    # initialize figure
-    fig = go.Figure(data=traces, layout=layout)
+def _set_template(fig, name):
+    """Assign a registered template without validating it again.
+
+    Registered templates are already validated, so this skips the deep
+    copy and validation of assigning it by name, the same way plotly
+    applies its default template.
+    """
+    validate = fig.layout._validate
+    fig.layout._validate = False
+    try:
+        fig.layout.template = pio.templates[name]
+    finally:
+        fig.layout._validate = validate
+
+
+def _merge_layout(layout, mode):
+    """Layout dict with barmode added."""
+    if isinstance(layout, str):
+        layout = dict(template=layout)
+    layout = as_dict(layout or {})
 
     # update layout to display either stacked/grouped barmode
     if mode:
-        fig.update_layout(barmode=mode)
+        layout['barmode'] = mode
+    return layout
+
 
-    # add annotations
+def _add_annotations(layout, annotations, shapes):
+    """Add annotations and shapes to a layout dict."""
     if annotations:
-        for annotation in annotations:
-            fig.add_annotation(**annotation)
+        layout['annotations'] = [
+            *layout.get('annotations', ()),
+            *(as_dict(annotation) for annotation in annotations)]
 
-    # update shapes
+    # shapes are positioned in data coordinates
     if shapes:
-        for shape in shapes:
-            fig.add_shape(shape)
-        fig.update_shapes(dict(xref='x', yref='y'))
-
-    if iplot:
-        return py.offline.iplot(fig)
-    else:
-        return fig
+        layout['shapes'] = [
+            {**as_dict(shape), 'xref': 'x', 'yref': 'y'}
+            for shape in [*layout.get('shapes', ()), *shapes]]
 
 
 # class Chart:
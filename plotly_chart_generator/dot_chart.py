@@ -1,23 +1,55 @@
-import plotly.graph_objs as go
+from .profiling import instrument
+from .utils.frame import input_rows
+from .utils.traces import WEBGL_THRESHOLD, make_trace, scatter_type
 
 
-def dot_chart(df):
+@instrument('build')
+def dot_chart(df, webgl_threshold=WEBGL_THRESHOLD, x=None, y=None,
+              series=None, aggfunc='mean', dtype=None, raw=False):
     """Dot plot
 
 
     Parameters
     ----------
-    df : DataFrame
-        Contains the data to be charted
+    df : DataFrame, pyarrow Table or Polars DataFrame
+        Contains the data to be charted.
+        A pyarrow Table or Polars DataFrame is read without pandas,
+        with a trace per column and the `x` column as labels
+    webgl_threshold : int or None, optional
+        Number of points in the chart above which WebGL (`scattergl`)
+        traces are used. None disables WebGL, by default 20000
+    x : str, optional
+        With `y`, `df` holds long-format data, one observation per row,
+        and `x` is the column with the x values. The traces are built
+        as from df.pivot_table(index=series, columns=x, values=y,
+        aggfunc=aggfunc), without creating the wide frame.
+        By default None (`df` is wide)
+    y : str, optional
+        Column with the values of long-format data, by default None
+    series : str, optional
+        Column of long-format data whose values get their own trace.
+        By default None, a single trace
+    aggfunc : str, optional
+        'mean' or 'sum' of long-format rows with the same series and x
+        value, by default 'mean'
+    dtype : numpy dtype, optional
+        Type the values are converted to, e.g. np.float32 to halve the
+        memory of float64 data. By default the frame's own type
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
     """
 
+    block, names, labels = input_rows(df, 0, dtype, x, y, series, aggfunc)
+    trace_type = scatter_type(names.size * labels.size, webgl_threshold)
+
     traces = []
-    for row in df.index:
-        trace = go.Scatter(
-            x=df.loc[row],
-            y=df.columns,
+    for i, row in enumerate(names):
+        trace = make_trace(trace_type, dict(
+            x=block[i],
+            y=labels,
             mode='markers',
-            name=row)
+            name=row), raw)
 
         traces.append(trace)
 
@@ -0,0 +1,166 @@
+import concurrent.futures
+import importlib.util
+import json
+import multiprocessing
+import os
+import pathlib
+
+import plotly.io as pio
+
+from .serialize import to_json
+
+
+FORMATS = ('png', 'jpeg', 'webp', 'svg', 'pdf')
+
+# the kaleido renderer of a worker process, started by _start_renderer
+_renderer = None
+
+
+def render_many(figures, fmt='png', out_dir='.', workers=None, names=None,
+                width=None, height=None, scale=None, progress=None):
+    """Export many figures to static images in parallel.
+
+    The figures are rendered by a pool of worker processes that each
+    keep one kaleido renderer running, so Chromium is only started once
+    per worker instead of once per image. Figures are sent to the
+    workers as compact JSON, see `to_json`. A figure that fails to
+    export is reported in the result and does not stop the rest of the
+    batch.
+
+    Rendering is done offline: the renderers use the plotly.js bundled
+    with plotly and the MathJax bundled with kaleido.
+
+    Parameters
+    ----------
+    figures : list
+        Figures or figure dicts, e.g. returned by
+        display_chart(..., iplot=False)
+    fmt : str, optional
+        One of 'png', 'jpeg', 'webp', 'svg' and 'pdf', by default 'png'
+    out_dir : str or path, optional
+        Directory the images are written to. Created if it does not
+        exist. By default the current directory
+    workers : int, optional
+        Number of worker processes. By default the number of CPUs
+    names : list of str, optional
+        File names without extension, one per figure. By default the
+        figures are named figure_0, figure_1, ... zero padded to the
+        same width.
+    width : int, optional
+        Image width in layout pixels. By default the figure's layout
+        width, or 700
+    height : int, optional
+        Image height in layout pixels. By default the figure's layout
+        height, or 500
+    scale : float, optional
+        Multiplies the image resolution, by default 1
+    progress : callable, optional
+        Called as progress(done, total, result) after every figure,
+        where result is the figure's entry in the returned list.
+
+    Returns
+    -------
+    list of dict
+        One dict per figure, in input order, with the 'path' of the
+        image and the 'error' message, None if the export succeeded.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(
+            f'Chosen fmt {fmt} not available. Select between'
+            ' `png`, `jpeg`, `webp`, `svg` and `pdf`')
+    if importlib.util.find_spec('kaleido') is None:
+        raise ImportError(
+            'render_many requires kaleido. Install it with'
+            ' `pip install kaleido`')
+
+    figures = list(figures)
+    total = len(figures)
+    if names is None:
+        digits = len(str(max(total - 1, 0)))
+        names = [f'figure_{i:0{digits}d}' for i in range(total)]
+    if len(names) != total:
+        raise ValueError('names must have one entry per figure.')
+
+    out_dir = pathlib.Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = [str(out_dir / f'{name}.{fmt}') for name in names]
+
+    results = [None] * total
+    done = 0
+
+    def finish(i, error):
+        nonlocal done
+        results[i] = dict(path=paths[i], error=error)
+        done += 1
+        if progress is not None:
+            progress(done, total, results[i])
+
+    workers = max(1, min(workers or os.cpu_count() or 1, total))
+    # a few figures per worker are queued, so only those are held as JSON
+    window = 4 * workers
+    pending = {}
+
+    # spawn, a forked worker would share a renderer started by the parent
+    context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=context,
+            initializer=_start_renderer) as pool:
+        for i, figure in enumerate(figures):
+            try:
+                spec = to_json(figure)
+                future = pool.submit(
+                    _render, spec, paths[i], fmt, width, height, scale)
+            except Exception as error:
+                finish(i, _describe(error))
+                continue
+            pending[future] = i
+            if len(pending) >= window:
+                finished, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    finish(pending.pop(future), _result(future))
+
+        for future in concurrent.futures.as_completed(pending):
+            finish(pending[future], _result(future))
+
+    return results
+
+
+def _result(future):
+    """Error message of a finished render, None if it succeeded."""
+    try:
+        return future.result()
+    except Exception as error:
+        # e.g. a worker process that died
+        return _describe(error)
+
+
+def _describe(error):
+    return f'{type(error).__name__}: {error}'
+
+
+def _start_renderer():
+    """Start the kaleido renderer of a worker process."""
+    global _renderer
+    from kaleido.scopes.plotly import PlotlyScope
+
+    class Renderer(PlotlyScope):
+        # figures arrive as JSON, so they only hold plain JSON types
+        def _json_dumps(self, val):
+            return json.dumps(val, separators=(',', ':'))
+
+    plotlyjs = pathlib.Path(pio.__file__).parents[1] / 'package_data'
+    _renderer = Renderer(plotlyjs=str(plotlyjs / 'plotly.min.js'))
+    # the first export starts Chromium
+    _renderer.transform(dict(data=[], layout={}), format='png')
+
+
+def _render(spec, path, fmt, width, height, scale):
+    """Render one JSON figure to path, returns the error message if any."""
+    try:
+        image = _renderer.transform(json.loads(spec), format=fmt,
+                                    width=width, height=height, scale=scale)
+        pathlib.Path(path).write_bytes(image)
+    except Exception as error:
+        return _describe(error)
+    return None
@@ -1,6 +1,12 @@
-import plotly.graph_objs as go
+import numpy as np
 
+from .profiling import instrument
+from .utils.binning import aggregate, bin_edges
+from .utils.tables import as_array
+from .utils.traces import make_trace
 
+
+@instrument('build')
 def histogram(
         x=None,
         y=None,
@@ -15,13 +21,16 @@ def histogram(
         line_width=0,
         line_color=None,
         line_colorscale=None,
-        histfunc='count'):
+        histfunc='count',
+        binned=False,
+        bins='plotly',
+        raw=False):
     """Creates a histogram
 
 
     Parameters
     ----------
-    data : list, numpy array or pandas series
+    data : list, numpy array, pandas series or pyarrow/Polars column
         The data to base the chart on
     layout : dict
         Chart layout, formatting and styles
@@ -49,11 +58,49 @@ def histogram(
         'max', the histogram values are computed using the sum,
         the average, the minimum or the maximum of the values lying
         inside each bin respectively.
+    binned : bool, optional
+        If True the bins are computed in NumPy and a bar trace with one
+        bar per bin is returned, so the size of the chart depends on the
+        number of bins instead of the number of samples. `histnorm` and
+        `histfunc` are applied the same way plotly does. Bin edges are
+        kept in `customdata`. Dates are binned like numbers, durations
+        on their integer value in the unit of their dtype.
+        By default False
+    bins : str, int or sequence, optional
+        Bins used when `binned` is True. 'plotly' mimics the automatic
+        binning of plotly.js, 'fd' (Freedman-Diaconis), 'sturges' and
+        'auto' use numpy's bin estimators. An int sets the number of
+        equal width bins and a sequence the bin edges.
+        By default 'plotly'
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
 
     documentation: https://plotly.com/python/reference/#histogram
 
     """
-    return go.Histogram(
+    # pyarrow and Polars columns are read as NumPy views
+    x, y = as_array(x), as_array(y)
+
+    marker = dict(
+        opacity=opacity,
+        color=marker_color,
+        colorscale=marker_colorscale,
+        line=dict(
+            width=line_width,
+            color=line_color,
+            colorscale=line_colorscale,
+        ))
+
+    if binned:
+        return make_trace('bar', dict(
+            **_binned(x, y, orientation, histfunc, histnorm, bins),
+            orientation=orientation,
+            name=name,
+            text=text,
+            marker=marker), raw)
+
+    return make_trace('histogram', dict(
         x=x,
         y=y,
         histnorm=histnorm,
@@ -61,12 +108,55 @@ def histogram(
         histfunc=histfunc,
         name=name,
         text=text,
-        marker=dict(
-            opacity=opacity,
-            color=marker_color,
-            colorscale=marker_colorscale,
-            line=dict(
-                width=line_width,
-                color=line_color,
-                colorscale=line_colorscale,
-            )))
+        marker=marker), raw)
+
+
+def _binned(x, y, orientation, histfunc, histnorm, bins):
+    """Bar positions, sizes and widths of a pre-binned histogram."""
+    samples, values = (x, y) if orientation == 'v' else (y, x)
+    if samples is None:
+        samples, values = values, None
+    samples = np.asarray(samples)
+    values = None if values is None else np.asarray(values, dtype=float)
+
+    kind = samples.dtype.kind
+    if np.issubdtype(samples.dtype, np.number) or kind in 'mM':
+        if kind in 'mM':
+            # dates and durations are binned on their integer view
+            keep = ~np.isnat(samples)
+            time_dtype, samples = samples.dtype, samples.view('i8')
+        else:
+            keep = np.isfinite(samples)
+        samples = samples[keep].astype(float)
+        values = None if values is None else values[keep]
+        if not samples.size:
+            return dict(x=[], y=[])
+
+        edges = bin_edges(samples, bins)
+        widths = np.diff(edges)
+        positions = edges[:-1] + widths / 2
+        index = np.clip(np.searchsorted(edges, samples, side='right') - 1,
+                        0, widths.size - 1)
+        bounds = np.stack((edges[:-1], edges[1:]), axis=1)
+        if kind == 'M':
+            # back to dates, plotly measures bar widths on date axes in ms
+            positions, bounds = (
+                np.round(a).astype('i8').view(time_dtype)
+                for a in (positions, bounds))
+            unit = np.timedelta64(1, np.datetime_data(time_dtype)[0])
+            widths = widths * (unit / np.timedelta64(1, 'ms'))
+        extra = dict(
+            width=widths,
+            customdata=bounds,
+            hovertemplate='%{customdata[0]} - %{customdata[1]}: '
+                          + ('%{y}' if orientation == 'v' else '%{x}'))
+    else:
+        # categories, one bar each
+        positions, index = np.unique(samples, return_inverse=True)
+        widths, extra = None, {}
+
+    sizes = aggregate(index, positions.size, values, histfunc, histnorm,
+                      widths)
+    if orientation == 'v':
+        return dict(x=positions, y=sizes, **extra)
+    return dict(x=sizes, y=positions, **extra)
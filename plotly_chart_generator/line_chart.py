@@ -1,7 +1,14 @@
-import plotly.graph_objs as go
 import numpy as np
 
+from .profiling import instrument
+from .utils.downsample import DOWNSAMPLERS, x_positions
+from .utils.frame import input_rows
+from .utils.traces import (
+    WEBGL_THRESHOLD, budget_props, make_trace, scatter_type,
+    warn_render_budget, warn_webgl, webgl_props)
 
+
+@instrument('build')
 def line_chart(
         df,
         mode='lines',
@@ -15,6 +22,16 @@ def line_chart(
         line_smoothing=1.3,
         marker_color=None,
         line_color=None,
+        downsample=None,
+        downsample_method='lttb',
+        webgl_threshold=WEBGL_THRESHOLD,
+        render_budget=None,
+        x=None,
+        y=None,
+        series=None,
+        aggfunc='mean',
+        dtype=None,
+        raw=False,
         **kwargs):
     """
     Line chart
@@ -36,16 +53,18 @@ def line_chart(
 
     Parameters
     ----------
-    df : DataFrame
-        Contains the to be charted
+    df : DataFrame, pyarrow Table or Polars DataFrame
+        Contains the data to be charted.
+        A pyarrow Table or Polars DataFrame is read without pandas,
+        with a trace per column and the `x` column as labels
     layout : dict
         Chart layout, formatting and styles
     mode : str, optional
         Choose between `lines`, `markers` or `none`.
         `text` can also be added as an argument.
         by default 'lines'
-    line_width : int, optional
-        line width, by default 3
+    line_width : float or sequence, optional
+        Line width, or one width per line, by default 2
     marker_size : int or None, optional
         Sets the marker size of selected points., by default None
     marker_symbol: str, optional
@@ -71,6 +90,50 @@ def line_chart(
         positioned with respect to relative coordinates in the plot or
         with respect to the actual data coordinates of the graph.
         By default None
+    downsample : int, optional
+        Maximum number of points per line. Longer lines are reduced
+        with `downsample_method`. Every kept point is an original data
+        point, and the first and last x value of the points it stands
+        for are kept in `customdata` and shown on hover.
+        By default None (no downsampling)
+    downsample_method : str, optional
+        Choose between 'lttb' (Largest-Triangle-Three-Buckets) and
+        'minmax' (minimum and maximum of equally sized buckets, which
+        never drops a peak). By default 'lttb'
+    webgl_threshold : int or None, optional
+        Number of points in the chart above which WebGL (`scattergl`)
+        traces are used. Features WebGL can't draw, like spline lines,
+        are dropped with a warning. None disables WebGL,
+        by default 20000
+    render_budget : int, optional
+        Estimated browser render cost per line above which costly
+        features are dropped, in points of a plain linear line. Splines,
+        markers, marker gradients and text cost more, see
+        `RENDER_COSTS`. Text is dropped first, then the marker gradient
+        and the spline shape, and last the markers are thinned out. A
+        warning lists what was dropped. Only applies to SVG traces,
+        WebGL traces already drop the gradient and the spline.
+        By default None (no budget)
+    x : str, optional
+        With `y`, `df` holds long-format data, one observation per row,
+        and `x` is the column with the x values. The traces are built
+        as from df.pivot_table(index=series, columns=x, values=y,
+        aggfunc=aggfunc), without creating the wide frame.
+        By default None (`df` is wide)
+    y : str, optional
+        Column with the values of long-format data, by default None
+    series : str, optional
+        Column of long-format data whose values get their own trace.
+        By default None, a single trace
+    aggfunc : str, optional
+        'mean' or 'sum' of long-format rows with the same series and x
+        value, by default 'mean'
+    dtype : numpy dtype, optional
+        Type the values are converted to, e.g. np.float32 to halve the
+        memory of float64 data. By default the frame's own type
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
 
 
     Example:
@@ -87,18 +150,42 @@ def line_chart(
     chart.line(data, layout)
     """
 
-    if isinstance(line_width, int):
-        line_width = np.repeat(line_width, df.index.size).tolist()
+    block, names, labels = input_rows(df, 0, dtype, x, y, series, aggfunc)
+
+    if np.ndim(line_width) == 0:
+        line_widths = [line_width] * names.size
+    else:
+        line_widths = list(line_width)
+        if len(line_widths) != names.size:
+            raise ValueError('line_width must have one entry per line.')
+
+    points = None
+    if downsample is not None and downsample < labels.size:
+        if downsample_method not in DOWNSAMPLERS:
+            raise ValueError(
+                f'Chosen downsample_method {downsample_method} not'
+                ' available. Select between `lttb` and `minmax`')
+
+        # downsample all rows at once, the buckets are shared
+        if not isinstance(block, np.ndarray) or block.dtype.kind != 'f':
+            block = np.asarray(block, dtype=float)
+        points, lo, hi = DOWNSAMPLERS[downsample_method](
+            x_positions(labels), block, downsample)
+        x_range = np.stack((labels[lo], labels[hi]), axis=1)
+
+    n_points = names.size * labels.size if points is None else points.size
+    trace_type = scatter_type(n_points, webgl_threshold)
+    dropped, applied, exceeded = [], [], False
 
     traces = []
-    for row in df.index:
+    for i, row in enumerate(names):
 
         keyword_args = dict(
-            x=df.columns,
-            y=df.loc[row],
+            x=labels if points is None else labels[points[i]],
+            y=block[i] if points is None else block[i, points[i]],
             mode=mode,
             line=dict(
-                width=line_width.pop(0),
+                width=line_widths[i],
                 color=line_color,
                 shape='spline',
                 smoothing=line_smoothing),
@@ -117,7 +204,26 @@ def line_chart(
                     color=['#2f323d', '#bbbe64']))
         )
 
-        line = go.Scatter(dict(**keyword_args, **kwargs))
+        if points is not None:
+            keyword_args.update(
+                customdata=x_range,
+                hovertemplate=('(%{x}, %{y})<br>'
+                               '%{customdata[0]} - %{customdata[1]}'))
+
+        props = dict(**keyword_args, **kwargs)
+        if trace_type == 'scattergl':
+            props, removed = webgl_props(props)
+            dropped.extend(removed)
+        elif render_budget is not None:
+            n_line = labels.size if points is None else points.shape[1]
+            props, fallbacks, over = budget_props(props, n_line,
+                                                  render_budget)
+            applied.extend(fallbacks)
+            exceeded = exceeded or over
+
+        line = make_trace(trace_type, props, raw)
         traces.append(line)
 
+    warn_webgl(dropped, n_points)
+    warn_render_budget(applied, render_budget, exceeded)
     return traces
@@ -0,0 +1,132 @@
+import numpy as np
+import plotly.graph_objs as go
+
+from .display_chart import display_chart
+from .line_chart import line_chart
+from .utils.downsample import bucket_extremes
+from .utils.ring_buffer import RingBuffer
+from .utils.traces import (
+    WEBGL_THRESHOLD, scatter_type, warn_webgl, webgl_props)
+
+
+class LineStream:
+    """Live line chart that is updated by appending new points.
+
+    Every line keeps its latest `window` points in a ring buffer. New
+    points are written to the buffers and pushed to the figure in one
+    `batch_update`, so a tick costs the same however long the stream
+    has been running. With `history` set, points leaving the window are
+    not dropped but reduced to the minimum and maximum of every
+    `history_factor` points and kept in a second ring buffer, which is
+    drawn in front of the window.
+
+    Parameters
+    ----------
+    df : DataFrame
+        Initial data, shaped like the input of `line_chart`: one row
+        per line, one column per x value. Only its last `window`
+        columns are drawn in full resolution.
+    layout : dict or str
+        Chart layout, formatting and styles, or the name of a template
+        created by `style_template`
+    window : int, optional
+        Number of most recent points drawn per line, by default 10000
+    history : int, optional
+        Number of downsampled points of older data kept per line,
+        by default None (older data is dropped)
+    history_factor : int, optional
+        Number of points that are reduced to one minimum and one
+        maximum in the history, by default 100
+    widget : bool, optional
+        If True the figure is a `go.FigureWidget`, which needs
+        ipywidgets and updates live in Jupyter. Otherwise it is a
+        `go.Figure`, e.g. to be served by Dash. By default True
+    webgl_threshold : int or None, optional
+        Number of points in the full chart above which WebGL traces are
+        used, see `line_chart`. By default 20000
+    **kwargs
+        Passed on to `line_chart`
+
+    Example:
+    ---------
+
+    stream = LineStream(df, layout, window=5000)
+    stream.figure  # display the widget
+    stream.append(new_columns)
+    """
+
+    def __init__(self, df, layout, window=10000, history=None,
+                 history_factor=100, widget=True,
+                 webgl_threshold=WEBGL_THRESHOLD, **kwargs):
+        self.names = list(df.index)
+        self.history_factor = history_factor
+        rows = len(self.names)
+
+        x_dtype = np.asarray(df.columns).dtype
+        if x_dtype.kind in 'SU':
+            # fixed width strings would truncate longer labels
+            x_dtype = object
+        self._x = RingBuffer(1, window, dtype=x_dtype)
+        self._y = RingBuffer(rows, window)
+        self._history_x = self._history_y = None
+        if history:
+            self._history_x = RingBuffer(rows, history, dtype=x_dtype)
+            self._history_y = RingBuffer(rows, history)
+            self._pending_x = np.empty((rows, 0), dtype=x_dtype)
+            self._pending_y = np.empty((rows, 0))
+
+        traces = line_chart(df.iloc[:, :0], webgl_threshold=None, raw=True,
+                            **kwargs)
+        # the trace type is chosen for full buffers, not the first tick
+        capacity = rows * (window + (history or 0))
+        if scatter_type(capacity, webgl_threshold) == 'scattergl':
+            traces, dropped = zip(*map(webgl_props, traces))
+            traces = [dict(trace, type='scattergl') for trace in traces]
+            warn_webgl(sum(dropped, []), capacity)
+        fig = display_chart(traces, layout, iplot=False)
+        self.figure = go.FigureWidget(fig) if widget else fig
+
+        self.append(df)
+
+    def append(self, df):
+        """Append new points and redraw the lines.
+
+        Parameters
+        ----------
+        df : DataFrame
+            New data with the same rows as the initial data and one
+            column per new x value
+        """
+        values = df.loc[self.names].to_numpy(dtype=float)
+        x = np.asarray(df.columns)[None, :]
+        evicted_x = self._x.extend(x)
+        evicted_y = self._y.extend(values)
+        if self._history_y is not None and evicted_y.shape[1]:
+            self._add_history(
+                np.broadcast_to(evicted_x, evicted_y.shape), evicted_y)
+        self._redraw()
+
+    def _add_history(self, x, y):
+        """Reduce evicted points to bucket minima and maxima."""
+        x = np.concatenate((self._pending_x, x), axis=1)
+        y = np.concatenate((self._pending_y, y), axis=1)
+        n_full = y.shape[1] - y.shape[1] % self.history_factor
+        self._pending_x, self._pending_y = x[:, n_full:], y[:, n_full:]
+        if not n_full:
+            return
+
+        starts = np.arange(0, n_full, self.history_factor)
+        positions = bucket_extremes(y[:, :n_full], starts)
+        self._history_x.extend(np.take_along_axis(x, positions, axis=1))
+        self._history_y.extend(np.take_along_axis(y, positions, axis=1))
+
+    def _redraw(self):
+        x, y = self._x.view()[0], self._y.view()
+        with self.figure.batch_update():
+            for i, trace in enumerate(self.figure.data):
+                if self._history_y is None:
+                    trace.x, trace.y = x, y[i]
+                else:
+                    trace.x = np.concatenate((self._history_x.view()[i], x))
+                    trace.y = np.concatenate((self._history_y.view()[i],
+                                              y[i]))
@@ -0,0 +1,149 @@
+import concurrent.futures
+import importlib
+import json
+import multiprocessing
+import os
+import time
+
+from .utils.shared_frames import SharedFrames, unpack
+
+
+BUILDERS = ('bar_chart', 'line_chart', 'scatter_chart', 'dot_chart',
+            'histogram', 'box_plot')
+OUTPUTS = ('json', 'dict', 'figure')
+
+# keyword arguments of a spec that are passed on to display_chart
+DISPLAY_ARGS = ('annotations', 'shapes', 'mode')
+
+
+def build_many(specs, workers=None, output='json', validate=False):
+    """Build many figures in parallel.
+
+    The figures are built and serialized by a pool of worker processes.
+    The data is not pickled for every task: the arrays of all
+    DataFrames are copied once into shared memory, which the workers
+    read without copying, see `SharedFrames`. Like `render_many`, a
+    figure that fails to build is reported in the result and does not
+    stop the rest of the batch.
+
+    Parameters
+    ----------
+    specs : list of tuple
+        One (builder, data, kwargs, layout) tuple per figure. builder is
+        the name of a chart function, e.g. 'bar_chart', data its first
+        argument, kwargs a dict of its other arguments, or None, and
+        layout the layout passed to `display_chart`. The kwargs
+        `annotations`, `shapes` and `mode` are passed to `display_chart`
+        as well.
+    workers : int, optional
+        Number of worker processes. By default the number of CPUs
+    output : str, optional
+        'json' for the figures serialized by `to_json`, 'dict' for
+        plain figure dicts and 'figure' for `go.Figure` objects, which
+        are validated in this process. By default 'json'
+    validate : bool, optional
+        Validate the traces and the layout in the workers, see
+        `display_chart`. If False the chart functions build raw traces.
+        By default False
+
+    Returns
+    -------
+    list of dict
+        One dict per spec, in input order, with the 'figure', the
+        'error' message, None if the build succeeded, and the
+        'build_time' and 'serialize_time' of the task in seconds.
+
+    Raise
+    -----
+    ValueError
+        If a builder or the output is not available.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(
+            f'Chosen output {output} not available. Select between'
+            ' `json`, `dict` and `figure`')
+    specs = list(specs)
+    for builder, *_ in specs:
+        if builder not in BUILDERS:
+            raise ValueError(
+                f'Chosen builder {builder} not available. Select between '
+                + ', '.join(f'`{name}`' for name in BUILDERS))
+
+    results = [None] * len(specs)
+    if not specs:
+        return results
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(specs)))
+    context = multiprocessing.get_context('spawn')
+    with SharedFrames([data for _, data, *_ in specs]) as shared, \
+            concurrent.futures.ProcessPoolExecutor(
+                workers, mp_context=context,
+                initializer=_start_builder) as pool:
+        futures = {
+            pool.submit(_build, builder, data, kwargs or {}, layout,
+                        validate): i
+            for i, ((builder, _, kwargs, layout), data)
+            in enumerate(zip(specs, shared.descriptors))}
+
+        for future in concurrent.futures.as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as error:
+                # e.g. a worker process that died
+                results[i] = dict(figure=None, error=_describe(error),
+                                  build_time=None, serialize_time=None)
+
+    if output != 'json':
+        for result in results:
+            if result['figure'] is None:
+                continue
+            try:
+                result['figure'] = _load(result['figure'], output)
+            except Exception as error:
+                result.update(figure=None, error=_describe(error))
+    return results
+
+
+def _describe(error):
+    return f'{type(error).__name__}: {error}'
+
+
+def _load(fig_json, output):
+    figure = json.loads(fig_json)
+    if output == 'figure':
+        import plotly.graph_objs as go
+        figure = go.Figure(figure)
+    return figure
+
+
+def _start_builder():
+    """Import the chart functions once per worker process."""
+    for name in BUILDERS:
+        importlib.import_module(f'.{name}', __package__)
+
+
+def _build(builder, data, kwargs, layout, validate):
+    """Build and serialize one figure in a worker process."""
+    from .display_chart import display_chart
+    from .serialize import to_json
+
+    result = dict(figure=None, error=None, build_time=None,
+                  serialize_time=None)
+    try:
+        start = time.perf_counter()
+        function = getattr(
+            importlib.import_module(f'.{builder}', __package__), builder)
+        display = {key: kwargs.pop(key) for key in DISPLAY_ARGS
+                   if key in kwargs}
+        kwargs.setdefault('raw', not validate)
+        fig = display_chart(function(unpack(data), **kwargs), layout,
+                            iplot=False, validate=validate, **display)
+        result['build_time'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result['figure'] = to_json(fig)
+        result['serialize_time'] = time.perf_counter() - start
+    except Exception as error:
+        result['error'] = _describe(error)
+    return result
@@ -1,6 +1,8 @@
-import plotly.graph_objs as go
+from .profiling import instrument
+from .utils.traces import make_trace
 
 
+@instrument('build')
 def pie_chart(
         labels,
         values,
@@ -17,7 +19,8 @@ def pie_chart(
         titlesize=15,
         title=None,
         opacity=None,
-        textposition=None):
+        textposition=None,
+        raw=False):
     """Creates pie chart
 
     Create a pie chart by passing two lists, numpy arrays
@@ -65,10 +68,13 @@ def pie_chart(
         Title text, by default None
     opacity : float, optional
         Sets the opacity of the trace., by default None
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
     """
 
     pull = [pull_dist if x in pull else 0 for x in labels]
-    data = go.Pie(
+    data = make_trace('pie', dict(
         labels=labels,
         values=values,
         hole=hole,
@@ -78,11 +84,11 @@ def pie_chart(
         opacity=opacity,
         hoverinfo=hoverinfo,
         textinfo=textinfo,
-        textfont_size=textfont_size,
+        textfont=dict(size=textfont_size),
         pull=pull,
         marker=dict(
             line=dict(
                 color=linecolor,
                 width=linewidth))
-    )
+    ), raw)
     return data
@@ -0,0 +1,214 @@
+import collections
+import contextvars
+import functools
+import time
+import tracemalloc
+
+
+PHASES = ('build', 'annotations', 'layout', 'validation', 'display',
+          'serialize')
+
+# trace properties holding one value per point
+POINT_KEYS = ('x', 'y', 'values', 'labels', 'z')
+
+# the Profile being recorded, set by `profile`. A context variable, so
+# a profile only sees the charts of its own thread or task.
+_active = contextvars.ContextVar('profile', default=None)
+
+
+class Profile:
+    """Records of the phases of all charts made while it is active.
+
+    Every record is a dict with the `phase`, the `function` that ran
+    it, its wall time in `seconds` and, depending on the phase, the
+    number of `traces`, `points`, `annotations` and `shapes` and the
+    serialized `bytes`. With memory profiling, records also hold the
+    `allocated_bytes` still held after the phase and the `peak_bytes`
+    allocated during it, as traced by tracemalloc.
+
+    The phases are
+    - build: a chart function creating traces
+    - annotations: creating annotations, or adding annotations and
+      shapes to the layout in `display_chart`
+    - layout: merging the layout in `display_chart`
+    - validation: creating the figure, validated or as a plain dict
+    - display: showing the figure in the notebook or browser, which is
+      the time to send it, not the browser's rendering time
+    - serialize: `to_json`
+    """
+
+    def __init__(self, memory=False, callback=None):
+        self.memory = memory
+        self.callback = callback
+        self.records = []
+        self._peaks = []
+
+    def report(self):
+        """JSON serializable report, the records and a summary per phase.
+
+        Returns
+        -------
+        dict
+            'records' holds the records in order of completion,
+            'summary' the number of `calls` and the total `seconds`,
+            `traces`, `points`, `annotations`, `shapes` and `bytes`
+            per phase
+        """
+        summary = collections.defaultdict(collections.Counter)
+        for record in self.records:
+            totals = summary[record['phase']]
+            totals['calls'] += 1
+            for key, value in record.items():
+                if isinstance(value, (int, float)) and key != 'peak_bytes':
+                    totals[key] += value
+        return dict(records=[dict(record) for record in self.records],
+                    summary={phase: dict(totals)
+                             for phase, totals in summary.items()})
+
+    def _start(self):
+        if not self.memory:
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        tracemalloc.reset_peak()
+        self._peaks.append(current)
+        return current
+
+    def _finish(self, record, start, memory_start):
+        record['seconds'] = time.perf_counter() - start
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # peaks of nested phases were reset, they count for the outer
+            peak = max(peak, self._peaks.pop())
+            record['allocated_bytes'] = current - memory_start
+            record['peak_bytes'] = peak - memory_start
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+
+class profile:
+    """Record the phases of all charts made within a with block.
+
+    Profiling is off by default, the instrumented functions then only
+    check whether a profile is active. Only the charts made in the same
+    thread or asyncio task as the with block are recorded.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Record the memory allocated by every phase with tracemalloc,
+        which slows Python code down considerably. By default False
+    callback : callable, optional
+        Called with every record when its phase is done, e.g. to send
+        it to a metrics system. By default None
+
+    Example:
+    ---------
+
+    with profile() as prof:
+        fig = display_chart(line_chart(df), layout, iplot=False)
+        to_json(fig)
+    prof.report()['summary']
+    """
+
+    def __init__(self, memory=False, callback=None):
+        self.profile = Profile(memory, callback)
+        self._token = None
+        self._tracing = False
+
+    def __enter__(self):
+        if self.profile.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self._token = _active.set(self.profile)
+        return self.profile
+
+    def __exit__(self, *exc):
+        _active.reset(self._token)
+        if self._tracing:
+            tracemalloc.stop()
+
+
+class phase:
+    """Time the with block as a phase of the active profile.
+
+    The record is available as the target of the with statement, so
+    counts known at the end of the phase can be added to it. Without an
+    active profile it is None and nothing is recorded.
+
+    Parameters
+    ----------
+    name : str
+        The phase, see `Profile`
+    function : str
+        Name of the function running the phase
+    **counts
+        Counts known up front, e.g. traces=3
+    """
+
+    __slots__ = ('profile', 'record', 'start', 'memory_start')
+
+    def __init__(self, name, function, **counts):
+        self.profile = _active.get()
+        if self.profile is not None:
+            self.record = dict(phase=name, function=function, **counts)
+
+    def __enter__(self):
+        if self.profile is None:
+            return None
+        self.memory_start = self.profile._start()
+        self.start = time.perf_counter()
+        return self.record
+
+    def __exit__(self, *exc):
+        if self.profile is not None:
+            self.profile._finish(self.record, self.start, self.memory_start)
+
+
+def instrument(name):
+    """Decorator recording calls of a chart function as phase `name`.
+
+    The number of traces, points or annotations is counted from the
+    function's result.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active.get() is None:
+                return function(*args, **kwargs)
+            with phase(name, function.__name__) as record:
+                result = function(*args, **kwargs)
+                record.update(count(result, name))
+            return result
+        return wrapper
+    return decorator
+
+
+def count(result, name):
+    """Counts of the traces or annotations returned by a function."""
+    is_list = isinstance(result, (list, tuple))
+    if name == 'annotations':
+        # e.g. bar_values(mode='text') returns trace properties
+        return dict(annotations=len(result) if is_list else 0)
+    items = result if is_list else [result]
+    return dict(traces=len(items), points=sum(map(points, items)))
+
+
+def points(trace):
+    """Number of points of a trace, plotly object or dict."""
+    n = 0
+    for key in POINT_KEYS:
+        try:
+            values = trace[key]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if values is not None and not isinstance(values, str):
+            try:
+                n = max(n, len(values))
+            except TypeError:
+                pass
+    return n
@@ -0,0 +1,242 @@
+import base64
+import gzip
+import hashlib
+import html
+import pathlib
+
+import numpy as np
+import plotly.io as pio
+import plotly.offline as pyo
+
+from .serialize import to_json
+
+
+COMPRESSIONS = (None, 'gzip', 'brotli')
+
+# numeric arrays shorter than this stay plain JSON lists
+MIN_ENCODED_SIZE = 8
+
+# dtypes JavaScript has typed arrays for, by numpy kind and item size
+TYPED_ARRAYS = {('i', 1): 'i1', ('u', 1): 'u1', ('i', 2): 'i2',
+                ('u', 2): 'u2', ('i', 4): 'i4', ('u', 4): 'u4',
+                ('f', 4): 'f4', ('f', 8): 'f8'}
+
+DECODER = """
+var PCG_TYPES = {i1: Int8Array, u1: Uint8Array, i2: Int16Array,
+                 u2: Uint16Array, i4: Int32Array, u4: Uint32Array,
+                 f4: Float32Array, f8: Float64Array};
+function pcgDecode(value) {
+  if (Array.isArray(value)) {
+    for (var i = 0; i < value.length; i++) value[i] = pcgDecode(value[i]);
+  } else if (value !== null && typeof value === 'object') {
+    if (typeof value.bdata === 'string' && value.dtype in PCG_TYPES) {
+      var raw = atob(value.bdata);
+      var bytes = new Uint8Array(raw.length);
+      for (var j = 0; j < raw.length; j++) bytes[j] = raw.charCodeAt(j);
+      var flat = new PCG_TYPES[value.dtype](bytes.buffer);
+      if (!value.shape || value.shape.length < 2) return flat;
+      var rows = [], width = value.shape[1];
+      for (var r = 0; r < value.shape[0]; r++) {
+        rows.push(flat.subarray(r * width, (r + 1) * width));
+      }
+      return rows;
+    }
+    for (var key in value) value[key] = pcgDecode(value[key]);
+  }
+  return value;
+}
+"""
+
+LOADER = """
+var PCG_TEMPLATES = pcgDecode(JSON.parse(
+  document.getElementById('pcg-templates').textContent));
+function pcgPlot(div) {
+  if (div.dataset.plotted) return;
+  div.dataset.plotted = '1';
+  var script = document.getElementById(div.id + '-data');
+  var fig = pcgDecode(JSON.parse(script.textContent));
+  var layout = fig.layout || {};
+  if (typeof layout.template === 'string' &&
+      layout.template in PCG_TEMPLATES) {
+    layout.template = PCG_TEMPLATES[layout.template];
+  }
+  Plotly.newPlot(div, fig.data || [], layout, fig.config || {});
+}
+var pcgDivs = document.querySelectorAll('.pcg-figure');
+if (%(lazy)s && 'IntersectionObserver' in window) {
+  var pcgObserver = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) {
+        pcgObserver.unobserve(entry.target);
+        pcgPlot(entry.target);
+      }
+    });
+  }, {rootMargin: '400px 0px'});
+  pcgDivs.forEach(function (div) { pcgObserver.observe(div); });
+} else {
+  pcgDivs.forEach(pcgPlot);
+}
+"""
+
+
+def write_report(figures, path, title=None, lazy=True, compress=None,
+                 config=None):
+    """Write many figures to one self-contained HTML file.
+
+    plotly.js is embedded once for the whole report and the numeric
+    arrays of the traces are stored as base64 encoded typed arrays
+    instead of decimal JSON. Templates shared by several figures, e.g.
+    the default template or a `style_template`, are stored once, named
+    templates like 'plotly_dark' included.
+
+    Parameters
+    ----------
+    figures : list
+        Figures or figure dicts, e.g. returned by
+        display_chart(..., iplot=False)
+    path : str or path
+        The HTML file to write
+    title : str, optional
+        Title of the page, also shown as a heading. By default None
+    lazy : bool, optional
+        If True a figure is only drawn when it is scrolled close to
+        the viewport, otherwise all figures are drawn on page load.
+        By default True
+    compress : str, optional
+        Also write a precompressed copy of the report next to it,
+        'gzip' (path + '.gz') or 'brotli' (path + '.br', needs the
+        brotli package). By default None
+    config : dict, optional
+        plotly.js config used for every figure, by default None
+
+    Returns
+    -------
+    list of str
+        The paths written
+    """
+    if compress not in COMPRESSIONS:
+        raise ValueError(
+            f'Chosen compress {compress} not available. Select between'
+            ' `None`, `gzip` and `brotli`')
+
+    templates = {}
+    sections = []
+    for i, figure in enumerate(figures):
+        figure = _as_dict(figure)
+        # only trace data, layout lists like tickvals stay plain JSON
+        figure['data'] = [_pack(trace) for trace in figure.get('data', [])]
+        layout = figure['layout'] = _as_dict(figure.get('layout') or {})
+        template = layout.get('template')
+        if isinstance(template, str) and template in pio.templates:
+            # plotly.js does not know the names of plotly.py's templates
+            template = pio.templates[template].to_plotly_json()
+        if isinstance(template, dict):
+            key = hashlib.sha1(to_json(template).encode()).hexdigest()[:12]
+            templates.setdefault(key, template)
+            layout['template'] = key
+        if config is not None:
+            figure['config'] = config
+        height = layout.get('height') or 450
+        sections.append(
+            f'<div id="pcg-{i}" class="pcg-figure" '
+            f'style="height:{height}px"></div>\n'
+            f'<script type="application/json" id="pcg-{i}-data">'
+            f'{_script_safe(to_json(figure))}</script>')
+
+    heading = f'<h1>{html.escape(title)}</h1>\n' if title else ''
+    page = (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f'<title>{html.escape(title or "Report")}</title>\n'
+        f'<script>{pyo.get_plotlyjs()}</script>\n'
+        f'<script>{DECODER}</script>\n'
+        '</head>\n<body>\n'
+        f'{heading}'
+        '<script type="application/json" id="pcg-templates">'
+        f'{_script_safe(to_json(templates))}</script>\n'
+        + '\n'.join(sections) +
+        f'\n<script>{LOADER % dict(lazy=str(bool(lazy)).lower())}</script>'
+        '\n</body>\n</html>\n')
+
+    path = pathlib.Path(path)
+    content = page.encode('utf-8')
+    path.write_bytes(content)
+    written = [str(path)]
+
+    if compress == 'gzip':
+        compressed = path.with_name(path.name + '.gz')
+        compressed.write_bytes(gzip.compress(content, 9, mtime=0))
+        written.append(str(compressed))
+    elif compress == 'brotli':
+        import brotli
+        compressed = path.with_name(path.name + '.br')
+        compressed.write_bytes(brotli.compress(content))
+        written.append(str(compressed))
+    return written
+
+
+def _as_dict(figure):
+    if hasattr(figure, 'to_plotly_json'):
+        return figure.to_plotly_json()
+    return dict(figure)
+
+
+def _pack(value):
+    """Replace numeric arrays in a figure by base64 typed array dicts.
+
+    Arrays, pandas objects and long lists of numbers are encoded the way
+    plotly.js (2.28 and later) represents typed arrays:
+    {'dtype': 'f8', 'bdata': <base64>, 'shape': [rows, columns]}, where
+    the shape is only set for 2D arrays. Anything else is left as is.
+    """
+    if isinstance(value, dict):
+        return {key: _pack(item) for key, item in value.items()}
+    if hasattr(value, 'to_plotly_json'):
+        return _pack(value.to_plotly_json())
+    if isinstance(value, (list, tuple)):
+        if len(value) >= MIN_ENCODED_SIZE and all(
+                isinstance(item, (int, float)) and not isinstance(item, bool)
+                for item in value):
+            encoded = _typed_array(np.asarray(value))
+            if encoded is not None:
+                return encoded
+        return [_pack(item) for item in value]
+    if hasattr(value, '__array__') and not isinstance(value, str):
+        encoded = _typed_array(np.asarray(value))
+        if encoded is not None:
+            return encoded
+    return value
+
+
+def _typed_array(array):
+    """Typed array dict of a 1D or 2D numeric array, None otherwise."""
+    if (array.ndim not in (1, 2) or array.size < MIN_ENCODED_SIZE
+            or array.dtype.kind not in 'iuf'):
+        return None
+
+    if array.dtype.kind in 'iu' and array.dtype.itemsize == 8:
+        # there are no 64 bit integer arrays plotly.js can plot
+        info = np.iinfo(np.int32)
+        if array.min() >= info.min and array.max() <= info.max:
+            array = array.astype(np.int32)
+        else:
+            array = array.astype(np.float64)
+    elif array.dtype.kind == 'f' and array.dtype.itemsize != 4:
+        array = array.astype(np.float64)
+        single = array.astype(np.float32)
+        # halve the size when no precision is lost
+        if np.array_equal(single, array, equal_nan=True):
+            array = single
+
+    dtype = TYPED_ARRAYS.get((array.dtype.kind, array.dtype.itemsize))
+    if dtype is None:
+        return None
+    data = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+    encoded = dict(dtype=dtype, bdata=base64.b64encode(data).decode('ascii'))
+    if array.ndim == 2:
+        encoded['shape'] = list(array.shape)
+    return encoded
+
+
+def _script_safe(text):
+    """Keep JSON from closing the script tag it is embedded in."""
+    return text.replace('</', '<\\/')
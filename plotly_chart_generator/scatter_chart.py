@@ -1,6 +1,10 @@
-import plotly.graph_objs as go
+from .profiling import instrument
+from .utils.tables import as_array
+from .utils.traces import (
+    WEBGL_THRESHOLD, make_trace, scatter_type, warn_webgl, webgl_props)
 
 
+@instrument('build')
 def scatter_chart(
         data,
         marker_size=2,
@@ -10,6 +14,8 @@ def scatter_chart(
         text_pos='bottom center',
         text_size=14,
         text_color='grey',
+        webgl_threshold=WEBGL_THRESHOLD,
+        raw=False,
         **kwargs):
     """Scatter chart
 
@@ -21,7 +27,8 @@ def scatter_chart(
         least one 'key' of which itself contains a dictionary
         composed of two mandatory keys, labeled 'x', 'y',
         and two optional keys that must be labeled 'text'
-        and 'colors' if they are to be used.
+        and 'colors' if they are to be used. pyarrow and Polars
+        columns are read without pandas.
     layout : dict
         Chart layout, formatting and styles
     marker_size : int, optional
@@ -44,11 +51,26 @@ def scatter_chart(
         size of text, by default 14
     text_color : str, optional
         text color, by default 'lightgrey'
+    webgl_threshold : int or None, optional
+        Number of points in the chart above which WebGL (`scattergl`)
+        traces are used. Features WebGL can't draw, like spline lines,
+        are dropped with a warning. None disables WebGL,
+        by default 20000
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
     """
     if not isinstance(data, dict):
         raise TypeError(
             f'You must pass the data as a dictionary. You passed {type(data)}')
 
+    # pyarrow and Polars columns are read as NumPy views
+    data = {key: {name: as_array(values) for name, values in value.items()}
+            for key, value in data.items()}
+    n_points = sum(len(value['x']) for value in data.values())
+    trace_type = scatter_type(n_points, webgl_threshold)
+    dropped = []
+
     traces = []
     for key, value in data.items():
 
@@ -66,7 +88,13 @@ def scatter_chart(
                 color=value.get('colors'))
         )
 
-        scatter = go.Scatter(dict(**keyword_args, **kwargs))
+        props = dict(**keyword_args, **kwargs)
+        if trace_type == 'scattergl':
+            props, removed = webgl_props(props)
+            dropped.extend(removed)
+
+        scatter = make_trace(trace_type, props, raw)
         traces.append(scatter)
 
+    warn_webgl(dropped, n_points)
     return traces
@@ -1,2 +1,8 @@
-from . pie_subplots import pie_subplots
-from . scatter_subplots import scatter_subplots
+from ..utils.lazy import lazy_package as _lazy_package
+
+_lazy_package(__name__, {
+    'grid_subplots': ('.grid', 'grid_subplots'),
+    'facet': ('.facet', 'facet'),
+    'pie_subplots': ('.pie_subplots', 'pie_subplots'),
+    'scatter_subplots': ('.scatter_subplots', 'scatter_subplots'),
+})
@@ -0,0 +1,134 @@
+import math
+
+import numpy as np
+import plotly.colors
+
+from .grid import grid_subplots
+from ..utils.frame import codes
+from ..utils.traces import make_trace
+
+
+KINDS = ('line', 'bar', 'scatter')
+
+
+def facet(df, row=None, col=None, x=None, y=None, series=None, kind='line',
+          col_wrap=None, layout=None, colors=None, iplot=True,
+          validate=True):
+    """Small multiples from long-format data.
+
+    The frame is partitioned in one pass: the facet columns are turned
+    into categorical codes, the rows are sorted once by panel (and
+    series) and every trace gets a slice of the sorted x and y columns,
+    so no per-group DataFrames are created.
+
+    Parameters
+    ----------
+    df : pandas DataFrame
+        Long-format data, one observation per row
+    row : str, optional
+        Column whose values split the panels into rows, by default None
+    col : str, optional
+        Column whose values split the panels into columns,
+        by default None
+    x : str
+        Column with the x values
+    y : str
+        Column with the y values
+    series : str, optional
+        Column whose values get their own trace and color within a
+        panel, by default None
+    kind : str, optional
+        One of 'line', 'bar' and 'scatter', by default 'line'
+    col_wrap : int, optional
+        Wrap the `col` panels over several rows with this many columns.
+        Only used when `row` is None. By default None
+    layout : dict or str, optional
+        Chart layout, formatting and styles, see `grid_subplots`.
+        By default None
+    colors : list, optional
+        Colors of the series, by default plotly's qualitative colors
+    iplot : bool, optional
+        If True the chart is displayed, otherwise the figure is
+        returned. By default True
+    validate : bool, optional
+        If False the figure is returned as a plain dict without any
+        validation. By default True
+
+    Raise
+    -----
+    ValueError
+        If `x` or `y` is missing or `kind` is not available.
+    """
+    if x is None or y is None:
+        raise ValueError('facet needs both an x and a y column.')
+    if kind not in KINDS:
+        raise ValueError(
+            f'Chosen kind {kind} not available. Select between'
+            ' `line`, `bar` and `scatter`')
+
+    row_codes, row_levels = codes(df, row)
+    col_codes, col_levels = codes(df, col)
+    series_codes, series_levels = codes(df, series)
+
+    n_cols = len(col_levels)
+    n_series = len(series_levels)
+    keys = (row_codes * n_cols + col_codes) * n_series + series_codes
+    keep = (row_codes >= 0) & (col_codes >= 0) & (series_codes >= 0)
+
+    x_values, y_values = df[x].to_numpy(), df[y].to_numpy()
+    if not keep.all():
+        keys, x_values, y_values = keys[keep], x_values[keep], y_values[keep]
+
+    # one sort partitions everything, lines are also sorted along x.
+    # With up to 65536 keys numpy's stable sort is a linear radix sort.
+    n_keys = len(row_levels) * n_cols * n_series
+    keys = keys.astype(np.min_scalar_type(n_keys))
+    if kind == 'line':
+        order = np.lexsort((x_values, keys))
+    else:
+        order = np.argsort(keys, kind='stable')
+    keys, x_values, y_values = keys[order], x_values[order], y_values[order]
+    bounds = np.searchsorted(keys, np.arange(n_keys + 1))
+
+    colors = colors or plotly.colors.qualitative.Plotly
+    panels = [None] * (len(row_levels) * n_cols)
+    shown = set()
+    for key in np.flatnonzero(bounds[1:] > bounds[:-1]):
+        start, end = bounds[key], bounds[key + 1]
+        panel, s = divmod(int(key), n_series)
+        trace = _trace(kind, x_values[start:end], y_values[start:end],
+                       colors[s % len(colors)])
+        if series is not None:
+            trace.update(name=str(series_levels[s]),
+                         legendgroup=str(series_levels[s]),
+                         showlegend=s not in shown)
+            shown.add(s)
+        else:
+            trace['showlegend'] = False
+        if panels[panel] is None:
+            panels[panel] = []
+        panels[panel].append(trace)
+
+    titles = [_title(r, c) for r in row_levels for c in col_levels]
+    rows, cols = len(row_levels), n_cols
+    if row is None and col_wrap:
+        cols = min(col_wrap, n_cols)
+        rows = math.ceil(n_cols / cols)
+
+    return grid_subplots(panels, rows, cols, titles, layout,
+                         iplot=iplot, validate=validate)
+
+
+def _trace(kind, x, y, color):
+    if kind == 'bar':
+        return make_trace('bar', dict(x=x, y=y, marker=dict(color=color)),
+                          raw=True)
+    return make_trace('scatter', dict(
+        x=x, y=y, mode='lines' if kind == 'line' else 'markers',
+        line=dict(color=color) if kind == 'line' else None,
+        marker=dict(color=color) if kind == 'scatter' else None), raw=True)
+
+
+def _title(row_level, col_level):
+    return ' | '.join(str(level) for level in (row_level, col_level)
+                      if level is not None)
@@ -1,7 +1,5 @@
-import plotly.graph_objs as go
-from plotly.subplots import make_subplots
-import plotly as py
-import numpy as np
+from .grid import grid_subplots
+from ..utils.traces import make_trace
 
 
 def pie_subplots(data, rows, cols, titles,
@@ -45,32 +43,14 @@ def pie_subplots(data, rows, cols, titles,
         Any combination of `label`, `text`, `value`, `percent`
         joined with a `+` OR `none`. by default 'value'
     """
-    specs = [[{'type': 'domain'} for x in range(cols)] for x in range(rows)]
-
-    fig = make_subplots(rows=rows, cols=cols,
-                        subplot_titles=titles, specs=specs)
-
-    col_nums = np.tile([*range(1, cols + 1)], rows)
-    row_nums = np.repeat([*range(1, rows + 1)], cols)
-    plot_order = list(zip(col_nums, row_nums))
-
-    for key, value in data.items():
-        col, row = plot_order.pop(0)
-        fig.add_trace(
-            go.Pie(labels=[*value.keys()], values=[*value.values()],
-                   name=key, hole=hole, hoverinfo=hoverinfo,
-                   textinfo=textinfo, marker=dict(line=dict(
-                       color=linecolor, width=linewidth))),
-            row=row.item(), col=col.item())
-
-    # update layout
-    fig.update_layout(layout)
-    layout['annotations'] = dict(font=dict(size=12, color='lightgrey'))
-    for i in fig['layout']['annotations']:
-        i['font'] = layout['annotations']['font']
-
-    # display chart
-    if iplot:
-        py.offline.iplot(fig)
-    else:
-        return fig
+    panels = [
+        make_trace('pie', dict(
+            labels=[*value.keys()], values=[*value.values()], name=key,
+            hole=hole, hoverinfo=hoverinfo, textinfo=textinfo,
+            marker=dict(line=dict(color=linecolor, width=linewidth))),
+            raw=True)
+        for key, value in data.items()]
+
+    return grid_subplots(panels, rows, cols, titles, layout,
+                         title_font=dict(size=12, color='lightgrey'),
+                         iplot=iplot)
@@ -1,7 +1,9 @@
-import plotly.graph_objs as go
+from .profiling import instrument
+from .utils.traces import make_trace
 
 
-def sunburst_chart(labels, parents, values):
+@instrument('build')
+def sunburst_chart(labels, parents, values, raw=False):
     """Sunburst chart
 
 
@@ -18,8 +20,11 @@ def sunburst_chart(labels, parents, values):
     values : list, numpy array, or Pandas series
         Sets the values associated with each of the sectors. Use with
         `branchvalues` to determine how the values are summed.
+    raw : bool, optional
+        If True, plain trace dicts are returned instead of plotly graph
+        objects, skipping plotly's property validation. By default False
     """
-    return go.Sunburst(
+    return make_trace('sunburst', dict(
         labels=labels,
         parents=parents,
-        values=values)
+        values=values), raw)
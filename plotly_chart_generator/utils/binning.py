@@ -0,0 +1,183 @@
+import numpy as np
+
+
+BIN_METHODS = ('plotly', 'fd', 'sturges', 'auto')
+HISTFUNCS = ('count', 'sum', 'avg', 'min', 'max')
+HISTNORMS = ('', 'percent', 'probability', 'density', 'probability density')
+
+
+def _round_up(value, steps, reverse=False):
+    """plotly.js' `Lib.roundUp`: the first step above value, or with
+    reverse the last step not above it."""
+    if reverse:
+        below = [step for step in steps if step <= value]
+        return below[-1] if below else steps[0]
+    return next((step for step in steps if step > value), steps[-1])
+
+
+def _increment(value, step):
+    """plotly.js' `Lib.increment`, value + step without the floating
+    point noise in the last digits."""
+    scale = 1 / abs(step)
+    result = (scale * value + scale * step) / scale if scale > 1 else (
+        value + step)
+    if len(repr(float(result))) > 16 and len(repr(float(result))) >= (
+            len(repr(float(value))) + len(repr(float(step)))):
+        result = float(f'{result:.12g}')
+    return result
+
+
+def _plotly_size(samples):
+    """Bin size of plotly.js' automatic binning (`Axes.autoBin`).
+
+    The size starts from 2 * std / n ** 0.4, but not below the nicely
+    rounded smallest difference between values, and is rounded up to
+    2, 5 or 10 times a power of ten, like the tick spacing of an axis.
+    """
+    distinct = np.unique(samples)
+    diffs = np.diff(distinct)
+    min_diff = (distinct[-1] - distinct[0]) or 1.
+    # differences below plotly's rounding error are ignored
+    error = min_diff / max(samples.size - 1, 1) / 10000
+    diffs = diffs[diffs > error]
+    if diffs.size:
+        min_diff = min(min_diff, diffs.min())
+    exponent = 10 ** np.floor(np.log10(min_diff))
+    min_size = exponent * _round_up(min_diff / exponent,
+                                    (0.9, 1.9, 4.9, 9.9), reverse=True)
+    rough = max(min_size, 2 * samples.std() / samples.size ** 0.4)
+
+    base = 10 ** np.floor(np.log10(rough))
+    return base * _round_up(rough / base, (2, 5, 10))
+
+
+def _plotly_edges(samples):
+    """Bin edges following plotly.js' automatic binning.
+
+    A port of `Axes.autoBin` and `autoShiftNumericBins`: the first edge
+    is the last multiple of the bin size before the smallest value.
+    Integer data gets bins centred on the integers and data sitting on
+    the bin edges is shifted by half a bin.
+    """
+    lo, hi = samples.min(), samples.max()
+    size = _plotly_size(samples)
+    # the tick code plotly.js borrows extends the range a tiny bit
+    first = np.ceil((lo - (hi - lo) * 1e-4) / size) * size
+    start = _increment(first, -size)
+
+    def near_edge(values):
+        # within 1% of a bin edge, with JavaScript's remainder
+        return np.fmod(1 + (values - start) * 100 / size, 100) < 2
+
+    if np.all(np.fmod(samples, 1) == 0):
+        if size < 1:
+            start = lo - 0.5 * size
+        else:
+            start -= 0.5
+            if start + size < lo:
+                start += size
+    else:
+        edges = np.count_nonzero(near_edge(samples))
+        middles = np.count_nonzero(near_edge(samples + size / 2))
+        if middles < samples.size * 0.1 and (
+                edges > samples.size * 0.3 or near_edge(lo) or near_edge(hi)):
+            shift = size / 2
+            start += shift if start + shift < lo else -shift
+
+    n_bins = int(np.floor((hi - start) / size)) + 1
+    return start + np.arange(n_bins + 1) * size
+
+
+def bin_edges(samples, bins='plotly'):
+    """Bin edges for a numeric sample.
+
+    Parameters
+    ----------
+    samples : numpy array
+        Finite numeric samples
+    bins : str, int or sequence, optional
+        'plotly' mimics the automatic binning done by plotly.js, 'fd'
+        (Freedman-Diaconis), 'sturges' and 'auto' (the larger of the
+        two) use numpy's estimators. An int sets the number of equal
+        width bins, a sequence the bin edges. By default 'plotly'
+
+    Returns
+    -------
+    numpy array of bin edges
+    """
+    if isinstance(bins, str):
+        if bins not in BIN_METHODS:
+            raise ValueError(
+                f'Chosen bins {bins} not available. Select between'
+                ' `plotly`, `fd`, `sturges` and `auto`')
+        if bins == 'plotly':
+            return _plotly_edges(samples)
+    return np.histogram_bin_edges(samples, bins=bins)
+
+
+def aggregate(index, n_bins, values=None, histfunc='count', histnorm='',
+              widths=None):
+    """Aggregate values per bin and normalize the result.
+
+    Parameters
+    ----------
+    index : numpy array
+        Bin index of every sample
+    n_bins : int
+        Number of bins
+    values : numpy array, optional
+        Values aggregated by `histfunc`. Required unless `histfunc` is
+        'count'.
+    histfunc : str, optional
+        One of 'count', 'sum', 'avg', 'min' and 'max', by default 'count'
+    histnorm : str, optional
+        One of '', 'percent', 'probability', 'density' and
+        'probability density', by default ''
+    widths : numpy array, optional
+        Bin widths, used by the density normalizations. Bins are
+        assumed to have width 1 if omitted.
+
+    Returns
+    -------
+    numpy array with one value per bin, NaN for empty bins when
+    `histfunc` is 'avg', 'min' or 'max'.
+    """
+    if histfunc not in HISTFUNCS:
+        raise ValueError(
+            f'Chosen histfunc {histfunc} not available. Select between'
+            ' `count`, `sum`, `avg`, `min` and `max`')
+    if histnorm not in HISTNORMS and histnorm is not None:
+        raise ValueError(
+            f'Chosen histnorm {histnorm} not available. Select between'
+            ' ``, `percent`, `probability`, `density` and'
+            ' `probability density`')
+
+    counts = np.bincount(index, minlength=n_bins).astype(float)
+    if histfunc == 'count' or values is None:
+        result = counts
+    elif histfunc in ('sum', 'avg'):
+        result = np.bincount(index, weights=values, minlength=n_bins)
+        if histfunc == 'avg':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = result / counts
+    else:
+        # sort once by bin and reduce every run of equal bins
+        order = np.argsort(index, kind='stable')
+        index, values = index[order], values[order]
+        starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+        reduce = np.minimum if histfunc == 'min' else np.maximum
+        result = np.full(n_bins, np.nan)
+        result[index[starts]] = reduce.reduceat(values, starts)
+
+    if not histnorm:
+        return result
+
+    widths = 1 if widths is None else widths
+    total = np.nansum(result)
+    if histnorm == 'percent':
+        return 100 * result / total
+    if histnorm == 'probability':
+        return result / total
+    if histnorm == 'density':
+        return result / widths
+    return result / (total * widths)
@@ -0,0 +1,80 @@
+import numpy as np
+
+
+STATS = ('q1', 'median', 'q3', 'lowerfence', 'upperfence', 'mean', 'sd')
+
+
+def pad(arrays):
+    """Stack 1D arrays of different lengths into one NaN padded block."""
+    block = np.full((len(arrays), max(map(len, arrays), default=0)), np.nan)
+    for i, values in enumerate(arrays):
+        block[i, :len(values)] = values
+    return block
+
+
+def box_stats(block, max_outliers=1000):
+    """Box plot statistics of every row of a block.
+
+    The statistics are computed the same way as plotly.js does it: the
+    quartiles use linear interpolation between the closest ranks
+    (numpy's 'hazen' method), the fences are the most extreme points
+    within 1.5 IQR of the box and `sd` is the population standard
+    deviation. NaN values are ignored.
+
+    Parameters
+    ----------
+    block : numpy array
+        One sample per row, shape (series, n), padded with NaN
+    max_outliers : int, optional
+        Maximum number of outliers returned per row. When a row has more
+        outliers an evenly spaced selection of the sorted outliers is
+        returned, which always includes the most extreme ones.
+        By default 1000
+
+    Returns
+    -------
+    dict
+        Arrays with one value per row for 'q1', 'median', 'q3',
+        'lowerfence', 'upperfence', 'mean' and 'sd', and a list of
+        sorted outlier arrays under 'outliers'. Rows without values get
+        NaN statistics and no outliers.
+    """
+    # rows without any value keep NaN statistics, without numpy's
+    # all-NaN warnings
+    present = ~np.isnan(block).all(axis=1)
+    if not present.all():
+        stats = {key: np.full(len(block), np.nan) for key in STATS}
+        outliers = [np.empty(0)] * len(block)
+        if present.any():
+            found = box_stats(block[present], max_outliers)
+            for key in STATS:
+                stats[key][present] = found[key]
+            for i, values in zip(np.flatnonzero(present), found['outliers']):
+                outliers[i] = values
+        return dict(stats, outliers=outliers)
+
+    q1, median, q3 = np.nanquantile(
+        block, [0.25, 0.5, 0.75], axis=1, method='hazen')
+    iqr = q3 - q1
+
+    inside = ((block >= (q1 - 1.5 * iqr)[:, None])
+              & (block <= (q3 + 1.5 * iqr)[:, None]))
+    lowerfence = np.minimum(
+        q1, np.nanmin(np.where(inside, block, np.nan), axis=1))
+    upperfence = np.maximum(
+        q3, np.nanmax(np.where(inside, block, np.nan), axis=1))
+
+    outside = ~inside & ~np.isnan(block)
+    outliers = []
+    for values, mask in zip(block, outside):
+        values = np.sort(values[mask])
+        if values.size > max_outliers:
+            keep = np.linspace(0, values.size - 1, max_outliers)
+            values = values[np.round(keep).astype(int)]
+        outliers.append(values)
+
+    return dict(
+        q1=q1, median=median, q3=q3,
+        lowerfence=lowerfence, upperfence=upperfence,
+        mean=np.nanmean(block, axis=1), sd=np.nanstd(block, axis=1),
+        outliers=outliers)
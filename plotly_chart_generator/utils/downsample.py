@@ -0,0 +1,190 @@
+import numpy as np
+
+
+def x_positions(labels):
+    """Numeric x positions for a sequence of axis labels.
+
+    Numbers and datetimes keep their spacing, any other label type
+    (e.g. strings) is treated as evenly spaced.
+    """
+    values = np.asarray(labels)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]').astype(np.int64).astype(float)
+    if np.issubdtype(values.dtype, np.number):
+        return values.astype(float)
+    return np.arange(values.size, dtype=float)
+
+
+def lttb(x, values, n_out):
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    All rows of `values` are downsampled at once: the buckets are shared
+    and every step of the algorithm works on a whole column of buckets.
+    The global minimum and maximum of each row are always kept, unless
+    both fall in the same bucket, in which case the maximum is kept.
+
+    Parameters
+    ----------
+    x : numpy array
+        Numeric x positions, shape (n,)
+    values : numpy array
+        y values, one series per row, shape (rows, n)
+    n_out : int
+        Number of points to keep per row, at least 3
+
+    Returns
+    -------
+    tuple of numpy arrays
+        Selected positions, shape (rows, n_out), and the first and last
+        original position of the bucket each selected point represents,
+        both of shape (n_out,).
+    """
+    rows, n = values.shape
+    if n_out >= n:
+        positions = np.arange(n)
+        return np.tile(positions, (rows, 1)), positions, positions
+    if n_out < 3:
+        raise ValueError('lttb needs at least 3 output points.')
+
+    # the first and last points are kept, the rest is split in buckets
+    edges = np.arange(n_out - 1) * (n - 2) // (n_out - 2) + 1
+    starts, ends = edges[:-1], edges[1:]
+
+    # bucket means, the fixed last point is not part of the last bucket
+    filled = np.where(np.isnan(values), 0, values)
+    present = (~np.isnan(values[:, :-1])).astype(int)
+    counts = np.maximum(np.add.reduceat(present, starts, axis=1), 1)
+    y_mean = np.add.reduceat(filled[:, :-1], starts, axis=1) / counts
+    x_mean = np.add.reduceat(x[:-1], starts) / (ends - starts)
+
+    y_max = np.where(np.isnan(values), -np.inf, values)
+    y_min = np.where(np.isnan(values), np.inf, values)
+    peak_max, peak_min = y_max.argmax(axis=1), y_min.argmin(axis=1)
+    bucket_max = _bucket_of(peak_max, ends)
+    bucket_min = _bucket_of(peak_min, ends)
+
+    row_index = np.arange(rows)
+    selected = np.empty((rows, n_out), dtype=int)
+    selected[:, 0], selected[:, -1] = 0, n - 1
+
+    a = np.zeros(rows, dtype=int)
+    for b, (start, end) in enumerate(zip(starts, ends)):
+        if b + 1 < starts.size:
+            xc, yc = x_mean[b + 1], y_mean[:, b + 1]
+        else:
+            xc, yc = x[-1], filled[:, -1]
+        xa, ya = x[a], filled[row_index, a]
+
+        xb, yb = x[start:end], filled[:, start:end]
+        area = np.abs((xa - xc)[:, None] * (yb - ya[:, None])
+                      - (xa[:, None] - xb) * (yc - ya)[:, None])
+        choice = start + area.argmax(axis=1)
+
+        choice = np.where(bucket_min == b, peak_min, choice)
+        choice = np.where(bucket_max == b, peak_max, choice)
+        selected[:, b + 1] = a = choice
+
+    lo = np.concatenate(([0], starts, [n - 1]))
+    hi = np.concatenate(([0], ends - 1, [n - 1]))
+    return selected, lo, hi
+
+
+def _bucket_of(positions, ends):
+    """Bucket of each position, -1 for the fixed first and last point."""
+    buckets = np.searchsorted(ends, positions, side='right')
+    inner = (positions > 0) & (positions < ends[-1])
+    return np.where(inner, buckets, -1)
+
+
+def minmax(x, values, n_out):
+    """Min/max bucket downsampling.
+
+    The first and last points are kept, like in `lttb`, and so is the
+    point before the last when `n_out` is odd. The points in between
+    are split in `(n_out - 2) // 2` equally sized buckets and the
+    minimum and maximum of every bucket are kept, so no peak is lost.
+    All rows are downsampled in one vectorized pass.
+
+    Parameters
+    ----------
+    x : numpy array
+        Numeric x positions, shape (n,). Unused, the buckets are based
+        on point counts, but accepted for symmetry with `lttb`.
+    values : numpy array
+        y values, one series per row, shape (rows, n)
+    n_out : int
+        Number of points to keep per row, at least 2
+
+    Returns
+    -------
+    tuple of numpy arrays
+        Selected positions, shape (rows, n_out), and the first and last
+        original position of the bucket each selected point represents,
+        both of shape (n_out,).
+    """
+    rows, n = values.shape
+    if n_out >= n:
+        positions = np.arange(n)
+        return np.tile(positions, (rows, 1)), positions, positions
+    if n_out < 2:
+        raise ValueError('minmax needs at least 2 output points.')
+
+    n_buckets, odd = divmod(n_out - 2, 2)
+    end = n - 1 - odd
+    starts = 1 + np.arange(n_buckets) * (end - 1) // max(n_buckets, 1)
+    ends = np.append(starts[1:], end)[:n_buckets]
+
+    selected = np.empty((rows, n_out), dtype=int)
+    selected[:, 0], selected[:, -1] = 0, n - 1
+    if odd:
+        selected[:, -2] = n - 2
+    if n_buckets:
+        selected[:, 1:2 * n_buckets + 1] = 1 + bucket_extremes(
+            values[:, 1:end], starts - 1)
+
+    tail = np.full(odd, n - 2)
+    lo = np.concatenate(([0], np.repeat(starts, 2), tail, [n - 1]))
+    hi = np.concatenate(([0], np.repeat(ends - 1, 2), tail, [n - 1]))
+    return selected, lo, hi
+
+
+def bucket_extremes(values, starts):
+    """Positions of the minimum and maximum of every bucket.
+
+    Every bucket runs from its start to the next one, the last to the
+    end of the rows. NaN values are ignored.
+
+    Parameters
+    ----------
+    values : numpy array
+        y values, one series per row, shape (rows, n)
+    starts : numpy array
+        First position of every bucket, increasing
+
+    Returns
+    -------
+    numpy array
+        Positions of shape (rows, 2 * len(starts)), the minimum and
+        maximum of every bucket in order of position
+    """
+    missing = np.isnan(values)
+    low = high = values
+    if missing.any():
+        low = np.where(missing, np.inf, values)
+        high = np.where(missing, -np.inf, values)
+    low = _first_of(low, np.minimum, starts)
+    high = _first_of(high, np.maximum, starts)
+    return np.sort(np.stack((low, high), axis=2), axis=2).reshape(
+        values.shape[0], -1)
+
+
+def _first_of(block, reduce, starts):
+    """Position of the first extreme of every bucket of every row."""
+    extremes = reduce.reduceat(block, starts, axis=1)
+    sizes = np.diff(np.append(starts, block.shape[1]))
+    hits = block == np.repeat(extremes, sizes, axis=1)
+    index = np.where(hits, np.arange(block.shape[1]), block.shape[1])
+    return np.minimum.reduceat(index, starts, axis=1)
+
+
+DOWNSAMPLERS = {'lttb': lttb, 'minmax': minmax}
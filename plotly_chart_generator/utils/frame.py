@@ -0,0 +1,206 @@
+import collections
+
+import numpy as np
+import pandas as pd
+
+from .tables import as_table, column_names, is_table, table_column
+
+
+# values: block of shape (traces, points), every trace is a zero-copy
+# view values[i]. For pyarrow and Polars tables a list of the column
+# arrays. names: trace names, one per row of the block. labels: point
+# labels, one per column.
+Rows = collections.namedtuple('Rows', 'values names labels')
+
+AGGFUNCS = ('mean', 'sum')
+
+
+def frame_rows(df, axis=0, dtype=None):
+    """Convert a DataFrame once to a block with one trace per row.
+
+    Accessing the rows of a frame with `df.loc`/`df.iloc` creates a
+    Series for each of them. Here the frame is converted at most once:
+    the block of a single-dtype frame is a view of its storage, even
+    when the traces are strided in it, since plotly and `to_json` copy
+    every trace on their own anyway. A frame of several dtypes is
+    copied once by pandas, a dtype conversion copies the data into a
+    C-contiguous block. The labels are kept as they are, so dates, time
+    zones and categories survive.
+
+    Parameters
+    ----------
+    df : pandas DataFrame
+        Contains the data to be charted
+    axis : int, optional
+        0 when every row of the frame is a trace, 1 when every column
+        is. By default 0
+    dtype : numpy dtype, optional
+        Type of the block, e.g. np.float32 to halve the memory of a
+        float64 frame. By default the frame's own type
+
+    Returns
+    -------
+    Rows
+        The block `values` with the trace `names` and point `labels`
+        as pandas Indexes
+    """
+    if axis not in (0, 1):
+        raise ValueError(
+            f'Chosen axis {axis} not available. Select between `0` and `1`')
+
+    values = df.to_numpy()
+    if axis == 0:
+        names, labels = df.index, df.columns
+    else:
+        values, names, labels = values.T, df.columns, df.index
+    if dtype is not None and values.dtype != dtype:
+        values = values.astype(dtype, order='C')
+    return Rows(values, names, labels)
+
+
+def input_rows(df, axis=0, dtype=None, x=None, y=None, series=None,
+               aggfunc='mean'):
+    """Block of traces of wide data, or of long-format data with x and y.
+
+    See `frame_rows`, `table_rows` and `long_rows`. pyarrow and Polars
+    tables are read without converting them to pandas.
+    """
+    if is_table(df):
+        df = as_table(df)
+        if y is None and series is None:
+            return table_rows(df, x, dtype)
+    elif x is None and y is None and series is None:
+        return frame_rows(df, axis, dtype)
+    return long_rows(df, x, y, series, axis, dtype, aggfunc)
+
+
+def table_rows(table, x=None, dtype=None):
+    """Traces of the columns of a pyarrow or Polars table.
+
+    Every column but `x` is a trace. The values are zero-copy NumPy
+    views of the Arrow buffers of the numeric columns, see
+    `column_array`.
+
+    Parameters
+    ----------
+    table : pyarrow Table or RecordBatch, or Polars DataFrame
+        One column per trace
+    x : str, optional
+        Column with the point labels. By default None, the row numbers
+    dtype : numpy dtype, optional
+        Type of the values, by default the columns' own types
+
+    Returns
+    -------
+    Rows
+        The `values` are a list with an array per trace
+    """
+    names = [name for name in column_names(table) if name != x]
+    values = [table_column(table, name, dtype) for name in names]
+    if x is None:
+        labels = pd.RangeIndex(len(table))
+    else:
+        labels = pd.Index(table_column(table, x), name=x)
+    return Rows(values, pd.Index(names), labels)
+
+
+def long_rows(df, x, y, series=None, axis=0, dtype=None, aggfunc='mean'):
+    """Build the block of traces directly from long-format data.
+
+    Gives the same block as `frame_rows` of
+    df.pivot_table(index=series, columns=x, values=y, aggfunc=aggfunc)
+    without creating the wide frame: the series and x columns are
+    turned into categorical codes and the values are summed into the
+    block with one `np.bincount` pass.
+
+    Parameters
+    ----------
+    df : pandas DataFrame, pyarrow Table or Polars DataFrame
+        Long-format data, one observation per row
+    x : str
+        Column with the x values, the point labels
+    y : str
+        Column with the values
+    series : str, optional
+        Column whose values get their own trace. By default None, one
+        trace named after `y`
+    axis : int, optional
+        0 for a trace per series, 1 for a trace per x value, like
+        `frame_rows` of the pivoted frame. By default 0
+    dtype : numpy dtype, optional
+        Type of the block, by default float
+    aggfunc : str, optional
+        'mean' or 'sum' of the values of rows with the same series and
+        x value. By default 'mean'
+
+    Returns
+    -------
+    Rows
+        The block, NaN where a series has no value at an x value. Like
+        pivot_table, series and x values without any value are dropped.
+    """
+    if x is None or y is None:
+        raise ValueError('Long-format data needs both an x and a y column.')
+    if aggfunc not in AGGFUNCS:
+        raise ValueError(
+            f'Chosen aggfunc {aggfunc} not available. Select between'
+            ' `mean` and `sum`')
+    if axis not in (0, 1):
+        raise ValueError(
+            f'Chosen axis {axis} not available. Select between `0` and `1`')
+
+    series_codes, names = codes(df, series)
+    x_codes, labels = codes(df, x)
+    values = _column(df, y, float)
+
+    # like pivot_table, rows with a missing key or value are left out
+    keep = (series_codes >= 0) & (x_codes >= 0) & ~np.isnan(values)
+    cells = series_codes * len(labels) + x_codes
+    if not keep.all():
+        cells, values = cells[keep], values[keep]
+
+    size = len(names) * len(labels)
+    sums = np.bincount(cells, weights=values, minlength=size)
+    counts = np.bincount(cells, minlength=size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        block = sums / counts if aggfunc == 'mean' else sums
+    block[counts == 0] = np.nan
+    block = block.reshape(len(names), len(labels))
+
+    names = pd.Index([y] if series is None else names, name=series)
+    labels = pd.Index(labels, name=x)
+    # like pivot_table, series and x values without any value are left
+    # out, e.g. unused categories or a series of only NaN
+    counts = counts.reshape(block.shape) > 0
+    used_names, used_labels = counts.any(axis=1), counts.any(axis=0)
+    if not (used_names.all() and used_labels.all()):
+        block = block[np.ix_(used_names, used_labels)]
+        names, labels = names[used_names], labels[used_labels]
+    if axis == 1:
+        block, names, labels = block.T, labels, names
+    return Rows(np.asarray(block, dtype=dtype, order='C'), names, labels)
+
+
+def codes(df, column):
+    """Integer codes (-1 for missing) and levels of a column.
+
+    The levels are the categories of a categorical column and the
+    sorted unique values otherwise. Without a column every row gets
+    code 0 of the single level None.
+    """
+    if column is None:
+        return np.zeros(len(df), dtype=np.intp), [None]
+    values = df[column] if isinstance(df, pd.DataFrame) else _column(
+        df, column)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes, levels = values.cat.codes, values.cat.categories
+    else:
+        codes, levels = pd.factorize(values, sort=True)
+    return np.asarray(codes, dtype=np.intp), list(levels)
+
+
+def _column(df, name, dtype=None):
+    """NumPy array of a column of a DataFrame or table."""
+    if isinstance(df, pd.DataFrame):
+        return df[name].to_numpy(dtype=dtype)
+    return table_column(df, name, dtype)
@@ -0,0 +1,62 @@
+import importlib
+import importlib.util
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Package whose public attributes are imported on first access.
+
+    The attributes are listed in the package's `_LAZY` dict, which maps
+    every name to the submodule defining it and the attribute to take
+    from that submodule, or None for the submodule itself.
+    """
+
+    def __getattr__(self, name):
+        lazy = self.__dict__.get('_LAZY', {})
+        if name not in lazy:
+            raise AttributeError(
+                f'module {self.__name__!r} has no attribute {name!r}')
+        module, attribute = lazy[name]
+        value = importlib.import_module(module, self.__name__)
+        if attribute is not None:
+            value = getattr(value, attribute)
+        setattr(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        # importing a submodule binds it to the package under its own
+        # name, which would shadow the function of the same name
+        lazy = self.__dict__.get('_LAZY', {})
+        if isinstance(value, types.ModuleType) and name in lazy:
+            module, attribute = lazy[name]
+            if (attribute is not None and value.__name__
+                    == importlib.util.resolve_name(module, self.__name__)):
+                value = getattr(value, attribute)
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._LAZY))
+
+
+def lazy_package(name, attributes):
+    """Make a package import its public attributes lazily.
+
+    Called at the end of a package's `__init__`. `from package import
+    name`, `package.name` and `import *` keep working as with eager
+    imports, but the submodules (and plotly, pandas and seaborn behind
+    them) are only imported when one of their attributes is first used.
+
+    Parameters
+    ----------
+    name : str
+        `__name__` of the package
+    attributes : dict
+        Maps every public name to the relative name of the submodule
+        defining it and the attribute to take from that submodule, or
+        None to expose the submodule itself.
+    """
+    package = sys.modules[name]
+    package._LAZY = attributes
+    package.__all__ = list(attributes)
+    package.__class__ = LazyModule
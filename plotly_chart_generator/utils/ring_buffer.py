@@ -0,0 +1,60 @@
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-size buffer of the latest values of several series.
+
+    Every value is stored twice, at its slot and one capacity further,
+    so the contents are always available as one contiguous view in
+    order, oldest first, without copying. Appending k values costs
+    O(k) whatever the capacity or the number of values seen so far.
+
+    Parameters
+    ----------
+    rows : int
+        Number of series
+    capacity : int
+        Number of values kept per series
+    dtype : numpy dtype, optional
+        By default float
+    """
+
+    def __init__(self, rows, capacity, dtype=float):
+        self.capacity = capacity
+        self._data = np.empty((rows, 2 * capacity), dtype=dtype)
+        self._end = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def view(self):
+        """The stored values, shape (rows, len(self)), oldest first."""
+        start = (self._end - self._size) % self.capacity
+        return self._data[:, start:start + self._size]
+
+    def extend(self, values):
+        """Append values of shape (rows, k) and return the evicted ones.
+
+        Returns
+        -------
+        numpy array
+            The values pushed out of the buffer, oldest first, shape
+            (rows, n_evicted)
+        """
+        values = np.asarray(values, dtype=self._data.dtype)
+        n_new = values.shape[1]
+        n_evicted = max(0, self._size + n_new - self.capacity)
+        if n_evicted <= self._size:
+            evicted = self.view()[:, :n_evicted].copy()
+        else:
+            evicted = np.concatenate(
+                (self.view(), values[:, :n_evicted - self._size]), axis=1)
+
+        values = values[:, -self.capacity:]
+        slots = (self._end + np.arange(values.shape[1])) % self.capacity
+        self._data[:, slots] = values
+        self._data[:, slots + self.capacity] = values
+        self._end = (self._end + values.shape[1]) % self.capacity
+        self._size = min(self._size + n_new, self.capacity)
+        return evicted
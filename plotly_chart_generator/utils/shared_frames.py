@@ -0,0 +1,142 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+# offsets of the arrays in the block are aligned like numpy's allocations
+ALIGNMENT = 64
+
+# blocks attached by this process, by name
+_attached = {}
+
+
+class SharedFrames:
+    """Data for worker processes, stored once in shared memory.
+
+    The numeric and datetime arrays of DataFrames, Series, Indexes and
+    NumPy arrays are copied into one shared memory block. The objects
+    are replaced by small descriptors that a worker turns back into the
+    same objects with `unpack`, as read-only views of the block, without
+    any pickling or copying of the data. The columns of a frame with
+    several dtypes are stored one by one. Anything else, e.g. object
+    columns or labels, is sent along in the descriptor as is.
+
+    Use as a context manager, the block is released on exit.
+
+    Parameters
+    ----------
+    values : list
+        DataFrames, Series, Indexes, NumPy arrays or other objects
+    """
+
+    def __init__(self, values):
+        self._arrays = []
+        self._size = 0
+        self.descriptors = [self._describe(value) for value in values]
+
+        self.block = shared_memory.SharedMemory(
+            create=True, size=max(self._size, 1))
+        for offset, array in self._arrays:
+            _view(self.block, offset, array.shape, array.dtype)[...] = array
+        self._arrays = None
+        for descriptor in self.descriptors:
+            _set_block(descriptor, self.block.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the shared memory block."""
+        self.block.close()
+        self.block.unlink()
+
+    def _describe(self, value):
+        if isinstance(value, pd.DataFrame):
+            dtypes = value.dtypes.unique()
+            if len(dtypes) == 1 and _is_plain(dtypes[0]):
+                return dict(kind='frame', values=self._add(value.to_numpy()),
+                            index=self._describe(value.index),
+                            columns=self._describe(value.columns))
+            # mixed dtypes, every plain column is shared on its own
+            return dict(kind='mixed',
+                        arrays=[self._describe(column.to_numpy())
+                                if _is_plain(column.dtype)
+                                else dict(kind='object', value=column.array)
+                                for _, column in value.items()],
+                        index=self._describe(value.index),
+                        columns=self._describe(value.columns))
+        elif isinstance(value, pd.Series):
+            if _is_plain(value.dtype):
+                return dict(kind='series', values=self._add(value.to_numpy()),
+                            index=self._describe(value.index),
+                            name=value.name)
+        elif isinstance(value, pd.Index):
+            if _is_plain(value.dtype) and not isinstance(
+                    value, pd.MultiIndex):
+                return dict(kind='index', values=self._add(value.to_numpy()),
+                            name=value.name)
+        elif isinstance(value, np.ndarray) and _is_plain(value.dtype):
+            return dict(kind='array', values=self._add(value))
+        return dict(kind='object', value=value)
+
+    def _add(self, array):
+        offset = -(-self._size // ALIGNMENT) * ALIGNMENT
+        self._arrays.append((offset, array))
+        self._size = offset + array.nbytes
+        return dict(offset=offset, shape=array.shape, dtype=array.dtype.str)
+
+
+def unpack(descriptor):
+    """The object described by a descriptor of `SharedFrames`."""
+    kind = descriptor['kind']
+    if kind == 'object':
+        return descriptor['value']
+    if kind == 'mixed':
+        arrays = [unpack(array) for array in descriptor['arrays']]
+        frame = pd.DataFrame(dict(enumerate(arrays)),
+                             index=unpack(descriptor['index']), copy=False)
+        frame.columns = unpack(descriptor['columns'])
+        return frame
+
+    values = descriptor['values']
+    block = _attached.get(values['block'])
+    if block is None:
+        block = _attached[values['block']] = shared_memory.SharedMemory(
+            values['block'])
+    array = _view(block, values['offset'], values['shape'], values['dtype'])
+    array.flags.writeable = False
+
+    if kind == 'frame':
+        return pd.DataFrame(array, index=unpack(descriptor['index']),
+                            columns=unpack(descriptor['columns']),
+                            copy=False)
+    if kind == 'series':
+        return pd.Series(array, index=unpack(descriptor['index']),
+                         name=descriptor['name'], copy=False)
+    if kind == 'index':
+        return pd.Index(array, name=descriptor['name'], copy=False)
+    return array
+
+
+def _is_plain(dtype):
+    """Whether values of dtype can be stored as raw bytes."""
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM'
+
+
+def _view(block, offset, shape, dtype):
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+
+
+def _set_block(descriptor, name):
+    """Record the block name in a descriptor and its nested ones."""
+    if 'values' in descriptor:
+        descriptor['values']['block'] = name
+    for key in ('index', 'columns'):
+        if key in descriptor:
+            _set_block(descriptor[key], name)
+    for array in descriptor.get('arrays', ()):
+        _set_block(array, name)
@@ -0,0 +1,94 @@
+import numpy as np
+
+
+# libraries whose tables and columns are read without pandas. Neither
+# is a dependency, they are recognized by the module of the object.
+LIBRARIES = ('pyarrow', 'polars')
+
+
+def _library(obj):
+    return type(obj).__module__.partition('.')[0]
+
+
+def is_table(obj):
+    """Whether obj is a pyarrow or Polars table, or exports Arrow data.
+
+    pyarrow Tables and RecordBatches and Polars DataFrames are read
+    directly. Other objects implementing the Arrow PyCapsule stream
+    interface (`__arrow_c_stream__`) are read through pyarrow, except
+    pandas frames, which implement it too but stay on the pandas path.
+    """
+    library = _library(obj)
+    if library in LIBRARIES:
+        return hasattr(obj, 'columns') or hasattr(obj, 'column_names')
+    return library != 'pandas' and hasattr(obj, '__arrow_c_stream__')
+
+
+def is_column(obj):
+    """Whether obj is a pyarrow Array or ChunkedArray or a Polars Series."""
+    return _library(obj) in LIBRARIES and not is_table(obj)
+
+
+def as_table(obj):
+    """A table whose columns can be read with `column_array`."""
+    if _library(obj) in LIBRARIES:
+        return obj
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            f'Reading a {type(obj).__name__} requires pyarrow. Install it'
+            ' with `pip install pyarrow`') from None
+    return pyarrow.table(obj)
+
+
+def column_names(table):
+    """Names of the columns of a table from `as_table`."""
+    if hasattr(table, 'column_names'):
+        return list(table.column_names)
+    return list(table.columns)
+
+
+def table_column(table, name, dtype=None):
+    """NumPy array of a column of a table from `as_table`."""
+    if _library(table) == 'pyarrow':
+        return column_array(table.column(name), dtype)
+    return column_array(table[name], dtype)
+
+
+def column_array(column, dtype=None):
+    """NumPy array of a pyarrow or Polars column.
+
+    Numeric and temporal columns without nulls in one chunk are not
+    copied, the array is a view of the Arrow buffer. Nulls become NaN
+    (or NaT), which needs a copy, and so do columns of several chunks
+    and strings.
+
+    Parameters
+    ----------
+    column : pyarrow Array or ChunkedArray, Polars Series or array-like
+        The column. Anything else is passed to np.asarray
+    dtype : numpy dtype, optional
+        Type of the array, by default the column's own type
+    """
+    library = _library(column)
+    if library == 'pyarrow':
+        if hasattr(column, 'num_chunks'):
+            column = (column.chunk(0) if column.num_chunks == 1
+                      else column.combine_chunks())
+        values = column.to_numpy(zero_copy_only=False)
+    elif library == 'polars':
+        values = column.to_numpy()
+    else:
+        values = column
+    return np.asarray(values, dtype=dtype)
+
+
+def as_array(values, dtype=None):
+    """Convert pyarrow and Polars columns with `column_array`.
+
+    Other values are returned as they are.
+    """
+    if is_column(values):
+        return column_array(values, dtype)
+    return values
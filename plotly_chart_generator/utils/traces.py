@@ -0,0 +1,213 @@
+import sys
+import warnings
+
+import plotly.graph_objs as go
+
+from .. import profiling
+
+
+TRACE_CLASSES = {
+    'bar': go.Bar,
+    'box': go.Box,
+    'histogram': go.Histogram,
+    'pie': go.Pie,
+    'scatter': go.Scatter,
+    'scattergl': go.Scattergl,
+    'sunburst': go.Sunburst,
+}
+
+# Above this many points per figure SVG scatter traces get too slow to
+# render in the browser and the WebGL variant is used instead.
+WEBGL_THRESHOLD = 20000
+
+# Rough browser render cost per point of the scatter features, relative
+# to a point of a plain linear line
+RENDER_COSTS = dict(line=1, spline=2, markers=3, gradient=3, text=5)
+
+
+def strip_none(props):
+    """Return a copy of a (nested) property dict without None values.
+
+    Mirrors what the plotly constructors do with unset arguments, so
+    a raw trace serializes the same way as its validated counterpart.
+    """
+    return {key: strip_none(value) if isinstance(value, dict) else value
+            for key, value in props.items() if value is not None}
+
+
+def as_dict(obj):
+    """Plain dict copy of a graph object or property dict."""
+    if hasattr(obj, 'to_plotly_json'):
+        obj = obj.to_plotly_json()
+    return strip_none(obj)
+
+
+def make_trace(trace_type, props, raw=False):
+    """Create a trace from a property dict.
+
+    Parameters
+    ----------
+    trace_type : str
+        Plotly trace type, e.g. 'bar' or 'scatter'
+    props : dict
+        Trace properties. Nested properties must be given as dicts,
+        magic underscore names are only expanded by validated traces.
+    raw : bool, optional
+        If True a plain dict with a `type` key is returned and none of
+        plotly's property validators are run. If False a validated
+        graph object is returned. By default False
+
+    Returns
+    -------
+    dict or plotly trace object
+    """
+    if raw:
+        return dict(type=trace_type, **strip_none(props))
+    return TRACE_CLASSES[trace_type](props)
+
+
+def scatter_type(n_points, webgl_threshold=WEBGL_THRESHOLD):
+    """Pick 'scatter' or 'scattergl' based on the number of points.
+
+    Parameters
+    ----------
+    n_points : int
+        Total number of points in the figure
+    webgl_threshold : int or None, optional
+        Point count above which WebGL is used. None disables WebGL.
+        By default WEBGL_THRESHOLD
+    """
+    if webgl_threshold is not None and n_points > webgl_threshold:
+        return 'scattergl'
+    return 'scatter'
+
+
+def webgl_props(props):
+    """Remove scatter properties that `scattergl` does not support.
+
+    Returns the cleaned property dict and a list with a description of
+    every dropped feature.
+    """
+    props = dict(props)
+    dropped = []
+
+    line = props.get('line')
+    if isinstance(line, dict):
+        line = dict(line)
+        if line.get('shape') == 'spline':
+            line['shape'] = 'linear'
+            dropped.append("line shape 'spline'")
+        if line.pop('smoothing', None) is not None:
+            dropped.append('line smoothing')
+        props['line'] = line
+
+    marker = props.get('marker')
+    if isinstance(marker, dict):
+        marker = dict(marker)
+        if marker.pop('gradient', None) is not None:
+            dropped.append('marker gradient')
+        props['marker'] = marker
+
+    return props, dropped
+
+
+def render_cost(props, n_points):
+    """Estimated render cost of a scatter trace, see RENDER_COSTS."""
+    mode = props.get('mode') or ''
+    line = props.get('line') or {}
+    marker = props.get('marker') or {}
+
+    cost = 0
+    if 'lines' in mode:
+        cost += RENDER_COSTS['line'] * n_points
+        if line.get('shape') == 'spline':
+            cost += RENDER_COSTS['spline'] * n_points
+    if 'markers' in mode:
+        n_markers = min(n_points, marker.get('maxdisplayed') or n_points)
+        cost += RENDER_COSTS['markers'] * n_markers
+        if marker.get('gradient') is not None:
+            cost += RENDER_COSTS['gradient'] * n_markers
+    if props.get('text') is not None:
+        cost += RENDER_COSTS['text'] * n_points
+    return cost
+
+
+def budget_props(props, n_points, budget):
+    """Drop costly scatter features until a trace fits a render budget.
+
+    Per-point text goes first, then the marker gradient and the spline
+    shape, and last the markers are thinned out with `maxdisplayed`.
+    Only features that add to the `render_cost` of the trace's mode are
+    dropped.
+
+    Returns the property dict, a list with a description of every
+    applied fallback and whether the trace still exceeds the budget,
+    e.g. when the budget is below the cost of the plain line.
+    """
+    props = dict(props)
+    applied = []
+    line = dict(props.get('line') or {})
+    marker = dict(props.get('marker') or {})
+    mode = props.get('mode') or ''
+
+    def over():
+        return render_cost(dict(props, line=line, marker=marker),
+                           n_points) > budget
+
+    if over() and props.get('text') is not None:
+        props['text'] = None
+        applied.append('text')
+    if (over() and 'markers' in mode
+            and marker.get('gradient') is not None):
+        marker['gradient'] = None
+        applied.append('marker gradient')
+    if over() and 'lines' in mode and line.get('shape') == 'spline':
+        line['shape'] = 'linear'
+        line['smoothing'] = None
+        applied.append("line shape 'spline'")
+    if over() and 'markers' in mode:
+        # what is left of the budget after the lines is spent on markers
+        lines = render_cost(dict(props, mode='lines', line=line), n_points)
+        marker['maxdisplayed'] = max(
+            1, (budget - lines) // RENDER_COSTS['markers'])
+        applied.append(f"markers beyond {marker['maxdisplayed']}")
+
+    if line:
+        props['line'] = line
+    if marker:
+        props['marker'] = marker
+    return props, applied, over()
+
+
+def warn_render_budget(applied, budget, exceeded=False):
+    """Warn once about the fallbacks applied to fit a render budget.
+
+    Traces that exceed the budget even so are mentioned as well.
+    """
+    if not applied and not exceeded:
+        return
+    message = f'Traces exceed the render budget of {budget}'
+    if applied:
+        message += f", dropped: {', '.join(dict.fromkeys(applied))}."
+    else:
+        message += ', there is nothing left to drop.'
+    if applied and exceeded:
+        message += ' Some traces still exceed it.'
+    _warn(message)
+
+
+def warn_webgl(dropped, n_points):
+    """Warn once about features dropped for a WebGL figure."""
+    if dropped:
+        features = ', '.join(dict.fromkeys(dropped))
+        _warn(f'{n_points} points exceed the WebGL threshold, using '
+              f'scattergl traces without: {features}.')
+
+
+def _warn(message):
+    """Warn at the caller of the chart function, past `instrument`."""
+    # frames: _warn, warn_ helper, chart function, its caller
+    level, frame = 4, sys._getframe(3)
+    while frame is not None and frame.f_code.co_filename == profiling.__file__:
+        level, frame = level + 1, frame.f_back
+    warnings.warn(message, stacklevel=level)
@@ -0,0 +1,71 @@
+"""Build the precomputed palette table used by `chart_colors`.
+
+Run from the repository root whenever seaborn or matplotlib is upgraded:
+
+    python scripts/build_palettes.py
+
+The table holds the lookup table of every named colormap, seaborn's
+qualitative palettes and the xkcd color names, so `chart_colors` can
+generate these palettes without importing seaborn.
+"""
+import json
+import pathlib
+
+import matplotlib as mpl
+import numpy as np
+import seaborn as sns
+from seaborn.palettes import SEABORN_PALETTES
+
+
+TABLE = (pathlib.Path(__file__).resolve().parents[1]
+         / 'plotly_chart_generator' / 'chart_styles' / 'palettes.json')
+
+# seaborn refuses to make a palette from 'jet', keep it that way
+EXCLUDED = ('jet',)
+
+
+DOCUMENTED = {
+    'Accent', 'Blues', 'BrBG', 'BuGn', 'BuPu', 'CMRmap', 'Dark2', 'GnBu',
+    'Greens', 'Greys', 'OrRd', 'Oranges', 'PRGn', 'Paired', 'Pastel1',
+    'Pastel2', 'PiYG', 'PuBu', 'PuBuGn', 'PuOr', 'PuRd', 'Purples', 'RdBu',
+    'RdGy', 'RdPu', 'RdYlBu', 'RdYlGn', 'Reds', 'Set1', 'Set2', 'Set3',
+    'Spectral', 'Wistia', 'YlGn', 'YlGnBu', 'YlOrBr', 'YlOrRd', 'afmhot',
+    'autumn', 'binary', 'bone', 'brg', 'bwr', 'cividis', 'cool',
+    'coolwarm', 'copper', 'cubehelix', 'flag', 'gist_earth', 'gist_gray',
+    'gist_heat', 'gist_ncar', 'gist_rainbow', 'gist_stern', 'gist_yarg',
+    'gnuplot', 'gnuplot2', 'gray', 'hot', 'hsv', 'icefire', 'inferno',
+    'jet', 'magma', 'mako', 'nipy_spectral', 'ocean', 'pink', 'plasma',
+    'prism', 'rainbow', 'rocket', 'seismic', 'spring', 'summer', 'tab10',
+    'tab20', 'tab20b', 'tab20c', 'terrain', 'twilight', 'twilight_shifted',
+    'viridis', 'vlag', 'winter',
+}
+
+
+def colormap_names():
+    """Colormap names listed in the `chart_colors` docstring."""
+    names = [name for name in mpl.colormaps if name not in EXCLUDED]
+    return sorted(name for name in names
+                  if name.removesuffix('_r') in DOCUMENTED)
+
+
+def lookup_table(name):
+    """Hex colors of every entry in a colormap's lookup table."""
+    cmap = mpl.colormaps[name]
+    rgb = cmap(np.arange(cmap.N))[:, :3]
+    return ''.join(mpl.colors.rgb2hex(color)[1:] for color in rgb)
+
+
+def main():
+    table = dict(
+        versions=dict(seaborn=sns.__version__, matplotlib=mpl.__version__),
+        seaborn={name: [color.lower() for color in colors]
+                 for name, colors in SEABORN_PALETTES.items()},
+        qualitative=sns.palettes.MPL_QUAL_PALS,
+        colormaps={name: lookup_table(name) for name in colormap_names()},
+        xkcd=sns.xkcd_rgb,
+    )
+    TABLE.write_text(json.dumps(table, separators=(',', ':')))
+
+
+if __name__ == '__main__':
+    main()
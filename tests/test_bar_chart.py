@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+import pytest
+
+from plotly_chart_generator.bar_chart import bar_chart
+
+
+def reference_bar_chart(df, orientation='v'):
+    """Row-by-row construction the columnar path must reproduce."""
+    traces = []
+    rng = df.index.size if orientation == 'v' else df.columns.size
+    for i in range(rng):
+        if orientation == 'v':
+            x, y = [str(c) for c in df.columns], df.iloc[i]
+            text, name = df.iloc[i], df.iloc[i].name
+        else:
+            x, y = df.iloc[:, i], [str(r) for r in df.index]
+            text, name = df.iloc[:, i], df.columns[i]
+        traces.append(go.Bar(
+            x=x, y=y, text=text, textposition=None,
+            marker=dict(opacity=0.9, color=None,
+                        line=dict(color='#2C3347', width=1)),
+            name=name, width=None, orientation=orientation))
+    return traces
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.integers(0, 100, size=(4, 6)).astype(float),
+        index=[f'Row {i}' for i in range(4)],
+        columns=[f'Y{2020 + i}' for i in range(6)])
+
+
+@pytest.mark.parametrize('orientation', ['v', 'h'])
+def test_bar_chart_matches_reference(frame, orientation):
+    expected = reference_bar_chart(frame, orientation)
+    traces = bar_chart(frame, orientation=orientation)
+
+    assert len(traces) == len(expected)
+    for trace, ref in zip(traces, expected):
+        assert trace.to_json() == ref.to_json()
+
+
+def test_bar_chart_mixed_dtypes():
+    df = pd.DataFrame({'a': [1, 2], 'b': [1.5, 2.5]}, index=['x', 'y'])
+    traces = bar_chart(df)
+    expected = reference_bar_chart(df)
+    assert [t.to_json() for t in traces] == [t.to_json() for t in expected]
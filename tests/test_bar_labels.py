@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import bar_chart
+from plotly_chart_generator.chart_styles import bar_headings, bar_values
+
+
+def reference_bar_values(df, orientation):
+    """Nested loop placement the vectorized version must reproduce."""
+    annotations = []
+    size = df.index.size if orientation == 'h' else df.columns.size
+    for i in range(size):
+        arr = df.iloc[i] if orientation == 'h' else df.iloc[:, i]
+        space = 0
+        for val in arr:
+            x = space + (val / 2) if orientation == 'h' else arr.name
+            y = arr.name if orientation == 'h' else space + (val / 2)
+            annotations.append((x, y, str(val)))
+            space += val
+    return annotations
+
+
+@pytest.fixture(params=['float', 'int'])
+def frame(request):
+    rng = np.random.default_rng(7)
+    values = rng.random((5, 4)) * 10
+    if request.param == 'int':
+        values = values.astype(int)
+    return pd.DataFrame(values, index=list('abcde'), columns=list('wxyz'))
+
+
+@pytest.mark.parametrize('orientation', ['h', 'v'])
+def test_bar_values_positions(frame, orientation):
+    annotations = bar_values(frame, orientation=orientation)
+    placed = [(a['x'], a['y'], a['text']) for a in annotations]
+    assert placed == reference_bar_values(frame, orientation)
+
+
+def test_bar_values_text_mode(frame):
+    props = bar_values(frame, orientation='h', font_size=11, mode='text')
+    traces = bar_chart(frame, orientation='h', **props)
+
+    assert traces[0].texttemplate == '%{text}'
+    assert traces[0].insidetextanchor == 'middle'
+    assert traces[0].textfont.size == 11
+    np.testing.assert_array_equal(traces[0].text, frame['w'])
+
+    with pytest.raises(ValueError):
+        bar_values(frame, mode='labels')
+
+
+@pytest.mark.parametrize('orientation', ['h', 'v'])
+def test_bar_headings_positions(frame, orientation):
+    values = frame.iloc[-1] if orientation == 'h' else frame.iloc[:, 0]
+    centers = values.cumsum() - values / 2
+    key = 'x' if orientation == 'h' else 'y'
+
+    headings = bar_headings(frame, orientation=orientation)
+    np.testing.assert_allclose([h[key] for h in headings], centers)
@@ -0,0 +1,83 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import box_plot
+from plotly_chart_generator.utils.box_stats import box_stats, pad
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(6)
+    return pd.DataFrame(rng.standard_normal((500, 3)) ** 3,
+                        columns=['a', 'b', 'c'])
+
+
+def test_box_stats_match_plotly_definitions():
+    values = np.array([1., 2., 3., 4., 5., 6., 7., 8., 100.])
+    stats = box_stats(values[None, :])
+
+    # plotly.js interpolates at position p * n - 0.5
+    assert stats['q1'][0] == pytest.approx(2.75)
+    assert stats['median'][0] == 5
+    assert stats['q3'][0] == pytest.approx(7.25)
+    assert stats['lowerfence'][0] == 1 and stats['upperfence'][0] == 8
+    assert stats['mean'][0] == pytest.approx(values.mean())
+    assert stats['sd'][0] == pytest.approx(values.std())
+    np.testing.assert_array_equal(stats['outliers'][0], [100.])
+
+
+def test_box_stats_ignore_padding():
+    short, long = np.arange(5.), np.arange(50.)
+    stats = box_stats(pad([short, long]))
+    assert stats['median'].tolist() == [2, 24.5]
+
+
+def test_samples_without_values_give_empty_boxes(frame):
+    frame = frame.assign(b=np.nan)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        traces = box_plot(frame, boxpoints='outliers', raw=True)
+        empty = box_plot([pd.Series([], dtype=float), frame['a']], raw=True)
+        stats = box_stats(pad([np.array([]), np.array([np.nan])]))
+
+    assert 'median' not in traces[1] and 'y' not in traces[1]
+    assert traces[2]['median'] == [np.median(frame['c'])]
+    assert 'median' not in empty[0]
+    assert empty[1]['median'] == [np.median(frame['a'])]
+    assert np.isnan(stats['median']).all()
+    assert [len(values) for values in stats['outliers']] == [0, 0]
+
+
+def test_box_plot_from_dataframe(frame):
+    traces = box_plot(frame, boxpoints='outliers', raw=True)
+
+    assert [trace['name'] for trace in traces] == ['a', 'b', 'c']
+    for trace, column in zip(traces, frame):
+        assert trace['x'] == [column]
+        assert trace['median'][0] == pytest.approx(frame[column].median())
+        outliers = trace['y'][0]
+        assert ((outliers < trace['lowerfence'][0])
+                | (outliers > trace['upperfence'][0])).all()
+
+
+def test_box_plot_series_list_and_bounded_outliers(frame):
+    traces = box_plot(x=[frame['a'], frame['b']], boxpoints='outliers',
+                      max_outliers=5, raw=True)
+
+    assert traces[0]['y'] == ['a']
+    outliers = traces[0]['x'][0]
+    assert len(outliers) == 5
+    assert outliers[-1] == frame['a'].max()
+
+
+def test_box_plot_keeps_samples_only_for_all(frame):
+    boxes = box_plot(frame['a'], raw=True)
+    assert 'y' not in boxes[0]
+
+    points = box_plot(frame, boxpoints='all', raw=True)
+    assert len(points[0]['y']) == len(frame)
+    assert 'q1' not in points[0]
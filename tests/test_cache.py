@@ -0,0 +1,165 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import (
+    FigureCache, bar_chart, display_chart, line_chart, to_json)
+from plotly_chart_generator.cache import figure_key
+from plotly_chart_generator.chart_styles import chart_styles
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(3)
+    return pd.DataFrame(rng.random((3, 10)), index=['a', 'b', 'c'],
+                        columns=[f'c{i}' for i in range(10)])
+
+
+@pytest.fixture
+def counting():
+    calls = []
+
+    def builder(df, **kwargs):
+        calls.append(kwargs)
+        return line_chart(df, raw=True, **kwargs)
+    builder.calls = calls
+    return builder
+
+
+def test_figure_matches_uncached_json(frame):
+    cache = FigureCache()
+    layout = chart_styles(title='T')
+
+    fig_json = cache.figure(bar_chart, frame, layout=layout, mode='stack')
+
+    fig = display_chart(bar_chart(frame), layout, mode='stack', iplot=False,
+                        validate=False)
+    assert json.loads(fig_json) == json.loads(to_json(fig))
+
+
+def test_hit_skips_the_builder(frame, counting):
+    cache = FigureCache()
+
+    first = cache.figure(counting, frame, layout={})
+    second = cache.figure(counting, frame.copy(), layout={})
+
+    assert first is second
+    assert len(counting.calls) == 1
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+    assert info.bytes == len(first)
+
+
+@pytest.mark.parametrize('change', [
+    lambda df: df.iloc[::-1],
+    lambda df: df.rename(columns={'c0': 'x'}),
+    lambda df: df.rename(index={'a': 'z'}),
+    lambda df: df.astype('float32'),
+    lambda df: df.where(df > 0.5),
+])
+def test_key_follows_the_data(frame, change):
+    assert (figure_key(line_chart, (frame,), {}, {})
+            != figure_key(line_chart, (change(frame),), {}, {}))
+
+
+def test_key_follows_arguments_and_layout(frame):
+    base = figure_key(line_chart, (frame,), {}, dict(layout={'a': 1}))
+
+    assert base == figure_key(line_chart, (frame,), {},
+                              dict(layout={'a': 1}))
+    assert base != figure_key(bar_chart, (frame,), {}, dict(layout={'a': 1}))
+    assert base != figure_key(line_chart, (frame,), {'line_width': 3},
+                              dict(layout={'a': 1}))
+    assert base != figure_key(line_chart, (frame,), {},
+                              dict(layout={'a': 2}))
+
+
+def test_key_ignores_dict_order(frame):
+    assert (figure_key(line_chart, (frame,), {}, dict(a=1, b=[1, 2]))
+            == figure_key(line_chart, (frame,), {}, dict(b=[1, 2], a=1)))
+
+
+def test_key_follows_closure_values(frame):
+    def make_formatter(digits):
+        return lambda value: round(value, digits)
+
+    def key(formatter):
+        return figure_key(line_chart, (frame,), {'format': formatter}, {})
+
+    assert key(make_formatter(2)) == key(make_formatter(2))
+    assert key(make_formatter(2)) != key(make_formatter(3))
+    assert key(lambda value: value) != key(lambda value: -value)
+
+
+def test_least_recently_used_entries_are_evicted(frame, counting):
+    cache = FigureCache(max_entries=2)
+    frames = [frame, frame * 2, frame * 3]
+
+    cache.figure(counting, frames[0], layout={})
+    cache.figure(counting, frames[1], layout={})
+    cache.figure(counting, frames[0], layout={})
+    cache.figure(counting, frames[2], layout={})
+    cache.figure(counting, frames[0], layout={})
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (2, 3, 1)
+    assert len(counting.calls) == 3
+
+
+def test_size_limit(frame, counting):
+    size = len(FigureCache().figure(counting, frame, layout={}))
+    cache = FigureCache(max_bytes=int(size * 1.5))
+
+    cache.figure(counting, frame, layout={})
+    cache.figure(counting, frame * 2, layout={})
+
+    info = cache.cache_info()
+    assert info.entries == 1
+    assert info.bytes <= size * 1.5
+
+
+def test_disk_store_is_shared(tmp_path, frame, counting):
+    first = FigureCache(directory=tmp_path).figure(counting, frame, layout={})
+    cache = FigureCache(directory=tmp_path)
+    second = cache.figure(counting, frame, layout={})
+
+    assert first == second
+    assert len(counting.calls) == 1
+    assert cache.cache_info().disk_hits == 1
+    assert [p.suffix for p in tmp_path.iterdir()] == ['.json']
+
+
+def test_wrap(frame, counting):
+    cache = FigureCache()
+    cached = cache.wrap(counting)
+
+    cached(frame, layout={}, line_width=3)
+    cached(frame, layout={}, line_width=3)
+
+    assert counting.calls == [{'line_width': 3}]
+    assert cached.__wrapped__ is counting
+
+
+def test_default_layout(frame, counting):
+    cache = FigureCache()
+
+    fig_json = cache.figure(bar_chart, frame)
+    cache.wrap(counting)(frame)
+    cache.wrap(counting)(frame)
+
+    assert json.loads(fig_json) == json.loads(to_json(display_chart(
+        bar_chart(frame), None, iplot=False, validate=False)))
+    assert len(counting.calls) == 1
+
+
+def test_cache_clear(frame, counting):
+    cache = FigureCache()
+    cache.figure(counting, frame, layout={})
+
+    cache.cache_clear()
+    cache.figure(counting, frame, layout={})
+
+    assert len(counting.calls) == 2
+    assert cache.cache_info() == (0, 1, 0, 0, 1, cache.cache_info().bytes)
@@ -0,0 +1,78 @@
+import pathlib
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+import seaborn as sns
+
+from plotly_chart_generator.chart_styles import chart_colors
+
+
+@pytest.mark.parametrize('name', [
+    'deep', 'muted6', 'tab10', 'tab20c_r', 'Set2', 'viridis', 'Blues_r',
+    'rocket', 'icefire', 'hls'])
+@pytest.mark.parametrize('n_colors', [1, 5, 12, 25])
+def test_table_matches_seaborn(name, n_colors):
+    expected = sns.color_palette(name, n_colors).as_hex()
+
+    assert chart_colors('palette', name, n_colors) == list(expected)
+
+
+def test_xkcd_matches_seaborn():
+    names = ['windows blue', 'amber', 'faded green', 'dusty purple']
+
+    assert chart_colors('xkcd', names) == list(
+        sns.xkcd_palette(names).as_hex())
+    assert chart_colors('xkcd', 'amber') == list(
+        sns.xkcd_palette(['amber']).as_hex())
+
+
+def test_other_palettes_fall_back_to_seaborn():
+    assert chart_colors('light', 'seagreen', 4) == list(
+        sns.light_palette('seagreen', 4).as_hex())
+    assert chart_colors('palette', ['red', 'blue'], 3) == [
+        '#ff0000', '#0000ff', '#ff0000']
+    with pytest.raises(ValueError):
+        chart_colors('palette', 'jet')
+
+
+def test_results_are_cached_and_sliced():
+    first = chart_colors('palette', 'Set1', 6, start_pos=1, step=2)
+    first.append('#000000')
+
+    assert chart_colors('palette', 'Set1', 6, start_pos=1, step=2) == list(
+        sns.color_palette('Set1', 6).as_hex()[1::2])
+
+
+def test_named_palettes_do_not_import_seaborn():
+    code = ('import sys\n'
+            'from plotly_chart_generator.chart_styles import chart_colors\n'
+            'chart_colors("palette", "viridis", 8)\n'
+            'chart_colors("xkcd", ["amber", "pale red"])\n'
+            'print("seaborn" in sys.modules)')
+    root = pathlib.Path(__file__).resolve().parents[1]
+    result = subprocess.run([sys.executable, '-c', code], cwd=root,
+                            check=True, capture_output=True, text=True)
+
+    assert result.stdout.strip() == 'False'
+
+
+@pytest.mark.parametrize('palette_type, color', [
+    ('palette', 'deep'), ('palette', 'muted6'), ('palette', 'Set1'),
+    ('palette', 'viridis'), ('palette', 'hls'), ('palette', ['red', 'blue']),
+    ('light', 'seagreen'), ('dark', 'seagreen')])
+def test_n_colors_none_gives_the_palette_size(palette_type, color):
+    # light and dark palettes default to 6 colors
+    palette = {'palette': sns.color_palette, 'light': sns.light_palette,
+               'dark': sns.dark_palette}[palette_type]
+
+    assert chart_colors(palette_type, color, None) == list(
+        palette(color).as_hex())
+
+
+def test_unhashable_colors_are_not_cached():
+    color = np.array([0.2, 0.4, 0.6])
+
+    assert chart_colors('light', color, 3) == list(
+        sns.light_palette(color, 3).as_hex())
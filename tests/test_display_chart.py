@@ -0,0 +1,48 @@
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+
+from plotly_chart_generator import bar_chart, display_chart
+from plotly_chart_generator.chart_styles import bar_values, chart_styles, shape
+
+
+def reference_figure(traces, layout, annotations, shapes, mode):
+    """Item by item construction the bulk path must reproduce."""
+    fig = go.Figure(data=traces, layout=layout)
+    fig.update_layout(barmode=mode)
+    for annotation in annotations:
+        fig.add_annotation(**annotation)
+    for item in shapes:
+        fig.add_shape(item)
+    fig.update_shapes(dict(xref='x', yref='y'))
+    return fig
+
+
+def test_bulk_annotations_and_shapes_match_reference():
+    df = pd.DataFrame(np.arange(12.).reshape(3, 4),
+                      index=['a', 'b', 'c'], columns=['w', 'x', 'y', 'z'])
+    layout = chart_styles(title='Stacked')
+    annotations = bar_values(df, orientation='v')
+    shapes = [shape(0, 1, 0, 1), dict(type='line', x0=0, x1=2, y0=1, y1=1)]
+
+    fig = display_chart(bar_chart(df), layout, annotations=annotations,
+                        shapes=shapes, mode='stack', iplot=False)
+    expected = reference_figure(bar_chart(df), layout, annotations,
+                                shapes, 'stack')
+
+    assert len(fig.layout.annotations) == df.size
+    assert json.loads(fig.to_json()) == json.loads(expected.to_json())
+
+
+def test_layout_none():
+    df = pd.DataFrame(np.arange(6.).reshape(2, 3), index=['a', 'b'])
+    traces = bar_chart(df)
+
+    fig = display_chart(traces, None, iplot=False)
+    plain = display_chart(traces, None, iplot=False, validate=False)
+
+    assert json.loads(fig.to_json()) == json.loads(
+        go.Figure(data=traces).to_json())
+    assert len(plain['data']) == 2
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import line_chart
+from plotly_chart_generator.utils.downsample import lttb, minmax
+
+
+def reference_lttb(x, y, n_out):
+    """Textbook single series LTTB."""
+    def edge(i):
+        return i * (len(x) - 2) // (n_out - 2) + 1
+
+    a, selected = 0, [0]
+    for i in range(n_out - 2):
+        start, end = edge(i), edge(i + 1)
+        if i == n_out - 3:
+            xc, yc = x[-1], y[-1]
+        else:
+            following = slice(end, edge(i + 2))
+            xc, yc = x[following].mean(), y[following].mean()
+        area = np.abs((x[a] - xc) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (yc - y[a]))
+        a = start + area.argmax()
+        selected.append(a)
+    return np.array(selected + [len(x) - 1])
+
+
+@pytest.fixture
+def values():
+    # increasing series keep their extremes at the fixed end points
+    return np.random.default_rng(3).random((4, 997)).cumsum(axis=1)
+
+
+def test_lttb_matches_reference(values):
+    x = np.sort(np.random.default_rng(4).random(values.shape[1]))
+    selected, lo, hi = lttb(x, values, 50)
+
+    assert selected.shape == (4, 50)
+    for row, points in zip(values, selected):
+        np.testing.assert_array_equal(points, reference_lttb(x, row, 50))
+    assert lo[0] == hi[0] == 0 and lo[-1] == hi[-1] == values.shape[1] - 1
+
+
+def test_downsamplers_keep_peaks(values):
+    values = values.copy()
+    values[0, 400], values[1, 123] = 1e6, -1e6
+    x = np.arange(values.shape[1], dtype=float)
+
+    for downsampler in (lttb, minmax):
+        selected, lo, hi = downsampler(x, values, 60)
+        assert 400 in selected[0] and 123 in selected[1]
+        assert (np.diff(selected, axis=1) >= 0).all()
+        assert ((lo <= selected) & (selected <= hi)).all()
+
+
+def test_minmax_keeps_bucket_extremes(values):
+    selected, lo, hi = minmax(None, values, 20)
+    for row, points in zip(values, selected):
+        for start in np.unique(lo):
+            bucket = row[start:hi[lo == start][0] + 1]
+            kept = row[points[lo == start]]
+            assert kept.min() == bucket.min() and kept.max() == bucket.max()
+
+
+def test_line_chart_downsample(values):
+    df = pd.DataFrame(values, index=list('abcd'),
+                      columns=pd.date_range('2024', periods=997, freq='min'))
+    traces = line_chart(df, downsample=100, raw=True)
+
+    assert len(traces) == 4
+    assert all(len(trace['x']) == len(trace['y']) == 100 for trace in traces)
+    assert traces[0]['customdata'].shape == (100, 2)
+    assert line_chart(df, downsample=2000, raw=True)[0]['x'] is df.columns
+
+    with pytest.raises(ValueError):
+        line_chart(df, downsample=100, downsample_method='mean')
+
+
+@pytest.mark.parametrize('n, n_out', [(10, 3), (10, 4), (10, 9), (997, 2),
+                                      (997, 51), (997, 100)])
+def test_minmax_keeps_end_points_and_length(n, n_out):
+    values = np.random.default_rng(8).random((3, n))
+    selected, lo, hi = minmax(None, values, n_out)
+
+    assert selected.shape == (3, n_out) and lo.shape == hi.shape == (n_out,)
+    assert (selected[:, 0] == 0).all() and (selected[:, -1] == n - 1).all()
+    assert (np.diff(selected, axis=1) > 0).all()
@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import bar_chart, display_chart, render_many
+
+pytest.importorskip('kaleido')
+
+
+def figure(title):
+    df = pd.DataFrame({'a': [1, 2], 'b': [3, 4]}, index=['x', 'y'])
+    return display_chart(bar_chart(df), dict(title=title), iplot=False)
+
+
+def test_render_many_writes_images_and_reports_failures(tmp_path):
+    figures = [figure('one'), dict(data='not a list'), figure('three')]
+    calls = []
+
+    results = render_many(
+        figures, fmt='svg', out_dir=tmp_path / 'images', workers=2,
+        progress=lambda done, total, result: calls.append((done, total)))
+
+    assert [r['path'] for r in results] == [
+        str(tmp_path / 'images' / f'figure_{i}.svg') for i in range(3)]
+    assert results[0]['error'] is None and results[2]['error'] is None
+    assert results[1]['error']
+    assert 'three' in (tmp_path / 'images' / 'figure_2.svg').read_text()
+    assert sorted(calls) == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_render_many_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        render_many([figure('one')], fmt='gif', out_dir=tmp_path)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator.subplots import facet
+
+
+@pytest.fixture
+def long_frame():
+    rng = np.random.default_rng(3)
+    n = 2000
+    return pd.DataFrame(dict(
+        region=pd.Categorical(rng.choice(['north', 'south', 'west'], n)),
+        product=rng.choice(['a', 'b', 'c', 'd'], n),
+        kind=rng.choice(['new', 'used'], n),
+        day=rng.permutation(n),
+        sales=rng.random(n)))
+
+
+def test_panels_match_groupby(long_frame):
+    fig = facet(long_frame, row='region', col='product', x='day',
+                y='sales', kind='line', iplot=False, validate=False)
+
+    groups = long_frame.groupby(['region', 'product'], observed=True)
+    assert len(fig['data']) == groups.ngroups
+    for trace, ((region, product), group) in zip(fig['data'], groups):
+        group = group.sort_values('day')
+        np.testing.assert_array_equal(trace['x'], group['day'])
+        np.testing.assert_array_equal(trace['y'], group['sales'])
+    titles = [a['text'] for a in fig['layout']['annotations']]
+    assert titles[:2] == ['north | a', 'north | b']
+
+
+def test_series_share_colors_and_legend(long_frame):
+    fig = facet(long_frame, col='product', x='day', y='sales',
+                series='kind', kind='scatter', col_wrap=2, iplot=False,
+                validate=False)
+
+    assert len(fig['data']) == 8
+    assert {t['name']: t['marker']['color'] for t in fig['data']} == {
+        'new': '#636EFA', 'used': '#EF553B'}
+    assert sum(t['showlegend'] for t in fig['data']) == 2
+    # 4 products wrapped over 2 columns
+    assert fig['data'][-1]['xaxis'] == 'x4'
+    assert fig['layout']['xaxis4']['domain'][0] > 0.5
+
+
+def test_missing_facet_values_are_dropped():
+    df = pd.DataFrame(dict(c=['x', None, 'y'], x=[1, 2, 3], y=[4, 5, 6]))
+
+    fig = facet(df, col='c', x='x', y='y', kind='bar', iplot=False)
+
+    assert [list(t.y) for t in fig.data] == [[4], [6]]
+
+
+def test_facet_needs_x_and_y(long_frame):
+    with pytest.raises(ValueError):
+        facet(long_frame, col='product', y='sales')
+    with pytest.raises(ValueError):
+        facet(long_frame, col='product', x='day', y='sales', kind='area')
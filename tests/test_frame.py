@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import bar_chart, dot_chart, line_chart
+from plotly_chart_generator.utils.frame import frame_rows
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(6)
+    return pd.DataFrame(
+        rng.random((3, 5)), index=pd.Index(['a', 'b', 'c'], name='series'),
+        columns=pd.date_range('2023-01-01', periods=5, tz='Europe/Oslo'))
+
+
+def test_rows_keep_dtype_and_labels(frame):
+    values, names, labels = frame_rows(frame)
+
+    assert values.dtype == np.float64
+    np.testing.assert_array_equal(values, frame.to_numpy())
+    pd.testing.assert_index_equal(names, frame.index)
+    pd.testing.assert_index_equal(labels, frame.columns)
+
+
+def test_rows_of_a_row_major_block_are_views():
+    block = np.arange(12.).reshape(3, 4)
+
+    values = frame_rows(pd.DataFrame(block)).values
+
+    assert np.shares_memory(values, block)
+
+
+@pytest.mark.parametrize('axis', [0, 1])
+def test_single_dtype_frames_are_not_copied(frame, axis):
+    # one array per column, like a frame read from a file
+    frame = pd.DataFrame(dict(frame.items()))
+
+    values = frame_rows(frame, axis=axis).values
+
+    assert np.shares_memory(values, frame.to_numpy())
+
+
+def test_columns(frame):
+    values, names, labels = frame_rows(frame, axis=1)
+
+    np.testing.assert_array_equal(values, frame.to_numpy().T)
+    assert names is frame.columns and labels is frame.index
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.int64, None])
+def test_dtype(frame, dtype):
+    frame = (frame * 100).astype(np.int64) if dtype is np.int64 else frame
+
+    values = frame_rows(frame, dtype=dtype).values
+
+    assert values.dtype == (dtype or np.float64)
+    assert values.flags.c_contiguous or dtype is None
+    np.testing.assert_allclose(values, frame.to_numpy(), rtol=1e-6)
+
+
+def test_mixed_dtypes_and_categories():
+    frame = pd.DataFrame({'x': [1, 2], 'y': [0.5, 1.5]},
+                         index=pd.CategoricalIndex(['p', 'q']))
+
+    values, names, _ = frame_rows(frame)
+
+    assert values.dtype == np.float64
+    assert isinstance(names, pd.CategoricalIndex)
+
+
+def test_rejects_unknown_axis(frame):
+    with pytest.raises(ValueError):
+        frame_rows(frame, axis=2)
+
+
+@pytest.mark.parametrize('builder', [bar_chart, dot_chart, line_chart])
+def test_builders_accept_float32(frame, builder):
+    traces = builder(frame, dtype=np.float32, raw=True)
+    key = 'x' if builder is dot_chart else 'y'
+
+    assert [trace['name'] for trace in traces] == ['a', 'b', 'c']
+    assert traces[0][key].dtype == np.float32
+    np.testing.assert_allclose(traces[1][key], frame.loc['b'], rtol=1e-6)
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+import pytest
+
+from plotly_chart_generator import histogram
+from plotly_chart_generator.utils.binning import bin_edges
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(5)
+    return rng.normal(10, 3, 5_000), rng.random(5_000)
+
+
+def test_binned_counts_match_numpy(samples):
+    x, _ = samples
+    edges = np.linspace(x.min(), x.max(), 21)
+    trace = histogram(x, binned=True, bins=edges, histnorm='', raw=True)
+
+    counts, _ = np.histogram(x, bins=edges)
+    np.testing.assert_array_equal(trace['y'], counts)
+    np.testing.assert_allclose(trace['x'], (edges[:-1] + edges[1:]) / 2)
+    np.testing.assert_allclose(trace['customdata'][:, 0], edges[:-1])
+    assert trace['type'] == 'bar'
+
+
+@pytest.mark.parametrize('histfunc', ['sum', 'avg', 'min', 'max'])
+def test_binned_histfunc(samples, histfunc):
+    x, y = samples
+    trace = histogram(x, y, binned=True, bins=15, histnorm='',
+                      histfunc=histfunc, raw=True)
+
+    edges = np.histogram_bin_edges(x, bins=15)
+    groups = pd.cut(x, edges, include_lowest=True, right=False, labels=False)
+    groups[x == edges[-1]] = 14
+    agg = {'avg': 'mean'}.get(histfunc, histfunc)
+    expected = pd.Series(y).groupby(groups).agg(agg).reindex(range(15))
+    np.testing.assert_allclose(trace['y'], expected.to_numpy())
+
+
+@pytest.mark.parametrize('histnorm, total', [
+    ('percent', 100), ('probability', 1), ('probability density', 1)])
+def test_binned_histnorm(samples, histnorm, total):
+    x, _ = samples
+    trace = histogram(x, binned=True, histnorm=histnorm, raw=True)
+
+    sizes = trace['y']
+    if histnorm == 'probability density':
+        sizes = sizes * trace['width']
+    assert sizes.sum() == pytest.approx(total)
+
+
+def test_binned_payload_scales_with_bins(samples):
+    x, _ = samples
+    small = histogram(x[:500], binned=True, bins=10, raw=True)
+    large = histogram(np.tile(x, 20), binned=True, bins=10, raw=True)
+    assert len(small['x']) == len(large['x']) == 10
+
+    horizontal = histogram(y=x, orientation='h', binned=True, raw=True)
+    assert len(horizontal['y']) == len(horizontal['x'])
+
+
+def test_bin_edges_cover_samples(samples):
+    x, _ = samples
+    for method in ('plotly', 'fd', 'sturges', 'auto'):
+        edges = bin_edges(x, method)
+        assert edges[0] <= x.min() and edges[-1] >= x.max()
+
+    with pytest.raises(ValueError):
+        bin_edges(x, 'scott-ish')
+
+
+def test_binned_constant_sample_is_centred():
+    trace = histogram(np.full(10, 5.0), binned=True, histnorm='', raw=True)
+
+    np.testing.assert_array_equal(trace['x'], [5.0])
+    np.testing.assert_array_equal(trace['customdata'], [[4.5, 5.5]])
+    np.testing.assert_array_equal(trace['y'], [10])
+
+
+@pytest.mark.parametrize('x', [np.array([]), np.full(3, np.nan)])
+def test_binned_empty_sample(x):
+    trace = histogram(x, binned=True, raw=True)
+
+    assert len(trace['x']) == len(trace['y']) == 0
+
+
+def test_binned_dates_are_binned():
+    dates = pd.date_range('2023-01-01', periods=1000, freq='h').to_numpy()
+    trace = histogram(dates, binned=True, bins=10, histnorm='', raw=True)
+
+    assert len(trace['x']) == 10
+    assert trace['x'].dtype == dates.dtype
+    assert trace['y'].sum() == 1000
+    assert trace['customdata'][0, 0] <= dates[0]
+    np.testing.assert_allclose(trace['width'], 99.9 * 3600 * 1000)
+
+
+@pytest.mark.parametrize('x, start, size', [
+    # bins as computed by plotly.js
+    (np.round(np.random.default_rng(0).normal(0, 1, 300) * 2) / 2,
+     -3.25, 0.5),
+    (np.random.default_rng(2).exponential(1000, 2000), -50, 100),
+    (np.random.default_rng(3).integers(0, 10, 200), -0.5, 1),
+])
+def test_plotly_bins_shift_like_plotlyjs(x, start, size):
+    edges = bin_edges(x.astype(float))
+
+    assert edges[0] == pytest.approx(start)
+    assert np.diff(edges) == pytest.approx(size)
+
+
+def test_plotly_bins_match_plotlyjs():
+    pytest.importorskip('kaleido')
+    rng = np.random.default_rng(7)
+    samples = [rng.normal(0, 10 ** rng.uniform(-3, 4), 500)
+               for _ in range(6)]
+    samples += [np.round(x) for x in samples[:3]]
+
+    fig = go.Figure([go.Histogram(x=x, xaxis=f'x{i + 1}')
+                     for i, x in enumerate(samples)])
+    full = fig.full_figure_for_development(warn=False)
+
+    for x, trace in zip(samples, full.data):
+        edges = bin_edges(x)
+        assert edges[0] == pytest.approx(trace.xbins.start)
+        assert edges[1] - edges[0] == pytest.approx(trace.xbins.size)
@@ -0,0 +1,57 @@
+import pathlib
+import subprocess
+import sys
+import types
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+def run(code):
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                            check=True, capture_output=True, text=True)
+    return result.stdout.split()
+
+
+def test_import_does_not_load_heavy_dependencies():
+    loaded = run(
+        'import sys\n'
+        'import plotly_chart_generator\n'
+        'import plotly_chart_generator.chart_styles\n'
+        'import plotly_chart_generator.subplots\n'
+        'heavy = ("plotly", "pandas", "numpy", "seaborn", "matplotlib")\n'
+        'print(*[m for m in heavy if m in sys.modules])')
+
+    assert loaded == []
+
+
+def test_attributes_are_loaded_on_first_use():
+    loaded = run(
+        'import sys\n'
+        'import plotly_chart_generator as pcg\n'
+        'pcg.histogram\n'
+        'print("plotly_chart_generator.histogram" in sys.modules,'
+        ' "plotly_chart_generator.box_plot" in sys.modules)')
+
+    assert loaded == ['True', 'False']
+
+
+def test_functions_win_over_submodules_of_the_same_name():
+    import plotly_chart_generator as pcg
+    import plotly_chart_generator.bar_chart  # noqa: F401
+    import plotly_chart_generator.chart_styles.chart_styles  # noqa: F401
+    from plotly_chart_generator.chart_styles import chart_styles
+
+    assert isinstance(pcg.chart_styles, types.ModuleType)
+    assert callable(pcg.bar_chart)
+    assert callable(pcg.chart_styles.chart_styles)
+    assert chart_styles is pcg.chart_styles.chart_styles
+    assert 'pie_subplots' in dir(pcg.subplots)
+
+
+def test_unknown_attribute_raises():
+    import plotly_chart_generator as pcg
+
+    with pytest.raises(AttributeError):
+        pcg.pie_chart_that_does_not_exist
@@ -0,0 +1,63 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import LineStream
+from plotly_chart_generator.utils.ring_buffer import RingBuffer
+
+
+def test_ring_buffer_keeps_latest_values_and_returns_evicted():
+    buffer = RingBuffer(2, 5)
+    values = np.arange(40.0).reshape(2, 20)
+    evicted, end = [], 0
+    for n_new in (3, 1, 4, 7, 2, 3):
+        evicted.append(buffer.extend(values[:, end:end + n_new]))
+        end += n_new
+        np.testing.assert_array_equal(
+            buffer.view(), values[:, max(0, end - 5):end])
+
+    np.testing.assert_array_equal(np.concatenate(evicted, axis=1),
+                                  values[:, :end - 5])
+
+
+def frame(start, n, rows='abc', seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.random((len(rows), n)), index=list(rows),
+                        columns=np.arange(start, start + n))
+
+
+def test_stream_keeps_window_and_downsampled_history():
+    stream = LineStream(frame(0, 100), {}, window=50, history=20,
+                        history_factor=10, widget=False)
+    new = frame(100, 30, seed=1)
+    stream.append(new.loc[['c', 'a', 'b']])
+
+    trace = stream.figure.data[0]
+    # 80 evicted points make 8 buckets, each kept as minimum and maximum
+    assert len(trace.x) == 16 + 50
+    np.testing.assert_array_equal(trace.x[-50:], np.arange(80, 130))
+    np.testing.assert_array_equal(trace.y[-30:], new.loc['a'])
+    first_bucket = frame(0, 100).loc['a'].to_numpy()[:10]
+    assert sorted(trace.y[:2]) == [first_bucket.min(), first_bucket.max()]
+
+
+def test_stream_without_history_drops_old_points():
+    stream = LineStream(frame(0, 10), dict(title='Live'), window=8,
+                        widget=False)
+    stream.append(frame(10, 5))
+
+    np.testing.assert_array_equal(stream.figure.data[2].x, np.arange(7, 15))
+    assert stream.figure.layout.title.text == 'Live'
+
+
+def test_trace_type_is_chosen_for_full_buffers():
+    with pytest.warns(UserWarning, match='30000 points'):
+        stream = LineStream(frame(0, 10), {}, window=10000, widget=False)
+    assert stream.figure.data[0].type == 'scattergl'
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        stream = LineStream(frame(0, 10), {}, window=100, widget=False)
+    assert stream.figure.data[0].type == 'scatter'
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import bar_chart, dot_chart, line_chart
+from plotly_chart_generator.utils.frame import frame_rows, long_rows
+
+
+@pytest.fixture
+def events():
+    rng = np.random.default_rng(8)
+    n = 500
+    df = pd.DataFrame({
+        'day': rng.choice(pd.date_range('2023-01-01', periods=20), n),
+        'shop': rng.choice(['north', 'south', 'east'], n),
+        'sales': rng.integers(0, 100, n).astype(float)})
+    df.loc[::17, 'sales'] = np.nan
+    df.loc[::23, 'shop'] = None
+    # a shop without sales on some days
+    return df[~((df['shop'] == 'east') & (df['day'].dt.day < 5))]
+
+
+def assert_block_equal(rows, wide, axis=0):
+    expected = frame_rows(wide, axis=axis)
+    np.testing.assert_allclose(rows.values, expected.values)
+    assert list(rows.names) == list(expected.names)
+    assert list(rows.labels) == list(expected.labels)
+
+
+@pytest.mark.parametrize('aggfunc', ['mean', 'sum'])
+@pytest.mark.parametrize('axis', [0, 1])
+def test_matches_pivot_table(events, aggfunc, axis):
+    wide = events.pivot_table(index='shop', columns='day', values='sales',
+                              aggfunc=aggfunc)
+    if aggfunc == 'sum':
+        # pivot_table sums days without sales to 0 instead of NaN
+        counts = events.pivot_table(index='shop', columns='day',
+                                    values='sales', aggfunc='count')
+        wide = wide.where(counts > 0)
+
+    rows = long_rows(events, 'day', 'sales', 'shop', axis=axis,
+                     aggfunc=aggfunc)
+
+    assert_block_equal(rows, wide, axis)
+
+
+def test_without_series(events):
+    rows = long_rows(events, 'day', 'sales')
+
+    expected = events.groupby('day')['sales'].mean()
+    np.testing.assert_allclose(rows.values[0], expected)
+    assert list(rows.names) == ['sales']
+
+
+def test_categorical_levels_keep_their_order(events):
+    events = events.assign(shop=pd.Categorical(
+        events['shop'], categories=['south', 'north', 'east', 'west']))
+
+    rows = long_rows(events, 'day', 'sales', 'shop')
+
+    # like pivot_table, the unused category is dropped
+    assert list(rows.names) == ['south', 'north', 'east']
+
+
+def test_series_without_values_are_dropped(events):
+    events = events.copy()
+    events.loc[events['shop'] == 'east', 'sales'] = np.nan
+    events.loc[events['day'] == events['day'].min(), 'sales'] = np.nan
+    wide = events.pivot_table(index='shop', columns='day', values='sales')
+
+    for axis in (0, 1):
+        rows = long_rows(events, 'day', 'sales', 'shop', axis=axis)
+        assert 'east' not in list(rows.names) + list(rows.labels)
+        assert_block_equal(rows, wide, axis)
+
+
+@pytest.mark.parametrize('builder', [line_chart, bar_chart, dot_chart])
+def test_builders_accept_long_format(events, builder):
+    wide = events.pivot_table(index='shop', columns='day', values='sales')
+
+    traces = builder(events, x='day', y='sales', series='shop', raw=True)
+    expected = builder(wide, raw=True)
+
+    key = 'x' if builder is dot_chart else 'y'
+    for trace, wide_trace in zip(traces, expected, strict=True):
+        assert trace['name'] == wide_trace['name']
+        np.testing.assert_allclose(trace[key], wide_trace[key])
+
+
+def test_horizontal_bars(events):
+    wide = events.pivot_table(index='shop', columns='day', values='sales')
+
+    traces = bar_chart(events, orientation='h', x='day', y='sales',
+                       series='shop', raw=True)
+
+    assert len(traces) == wide.columns.size
+    np.testing.assert_allclose(traces[0]['x'], wide.iloc[:, 0])
+
+
+def test_needs_x_and_y(events):
+    with pytest.raises(ValueError):
+        line_chart(events, y='sales', series='shop')
+    with pytest.raises(ValueError):
+        long_rows(events, 'day', 'sales', aggfunc='median')
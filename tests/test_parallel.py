@@ -0,0 +1,119 @@
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+import pytest
+
+from plotly_chart_generator import (
+    bar_chart, build_many, display_chart, line_chart, to_json)
+from plotly_chart_generator.utils.shared_frames import SharedFrames, unpack
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(4)
+    return pd.DataFrame(rng.random((3, 6)), index=['a', 'b', 'c'],
+                        columns=pd.date_range('2023-01-01', periods=6))
+
+
+@pytest.mark.parametrize('value', [
+    pd.DataFrame(np.arange(6.).reshape(2, 3), index=['a', 'b'],
+                 columns=pd.date_range('2023-01-01', periods=3)),
+    pd.DataFrame({'x': [1, 2], 'y': ['a', 'b']}),
+    pd.Series([1, 2, 3], index=[0.5, 1.5, 2.5], name='s'),
+    pd.Index(pd.date_range('2023-01-01', periods=3), name='t'),
+    np.arange(5, dtype=np.int32),
+    np.empty((0, 3)),
+    ['a', 'list'],
+])
+def test_shared_frames_round_trip(value):
+    with SharedFrames([value]) as shared:
+        result = unpack(shared.descriptors[0])
+
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(result, value)
+        elif isinstance(value, pd.Series):
+            pd.testing.assert_series_equal(result, value)
+        elif isinstance(value, pd.Index):
+            pd.testing.assert_index_equal(result, value)
+        else:
+            np.testing.assert_array_equal(result, value)
+
+
+def test_shared_frames_are_read_only_views(frame):
+    with SharedFrames([frame]) as shared:
+        descriptor = shared.descriptors[0]
+        result = unpack(descriptor)
+
+        assert 'value' not in descriptor
+        assert not result.to_numpy().flags.writeable
+
+
+def test_mixed_dtype_frames_only_pickle_object_columns():
+    value = pd.DataFrame({'i': np.arange(1000), 'f': np.linspace(0, 1, 1000),
+                          't': pd.date_range('2023', periods=1000),
+                          'o': ['a', 'b'] * 500})
+
+    with SharedFrames([value]) as shared:
+        descriptor = shared.descriptors[0]
+        result = unpack(descriptor)
+
+        assert [array['kind'] for array in descriptor['arrays']] == [
+            'array', 'array', 'array', 'object']
+        assert len(pickle.dumps(descriptor)) < value['o'].nbytes
+        pd.testing.assert_frame_equal(result, value)
+        assert not result['f'].to_numpy().flags.writeable
+
+
+def test_build_many_matches_serial_build(frame):
+    specs = [('line_chart', frame, None, dict(title='one')),
+             ('bar_chart', frame, dict(mode='stack'), dict(title='two'))]
+
+    results = build_many(specs, workers=2)
+
+    expected = [
+        display_chart(line_chart(frame, raw=True), dict(title='one'),
+                      iplot=False, validate=False),
+        display_chart(bar_chart(frame, raw=True), dict(title='two'),
+                      mode='stack', iplot=False, validate=False)]
+    for result, fig in zip(results, expected):
+        assert json.loads(result['figure']) == json.loads(to_json(fig))
+        assert result['error'] is None
+        assert result['build_time'] >= 0 and result['serialize_time'] >= 0
+
+
+def test_build_many_single_trace_builders(frame):
+    specs = [('histogram', frame.iloc[0], None, {}),
+             ('box_plot', frame.T, None, {})]
+
+    results = build_many(specs, workers=1, output='dict')
+
+    assert [result['error'] for result in results] == [None, None]
+    histogram_trace, = results[0]['figure']['data']
+    assert histogram_trace['type'] == 'histogram'
+    assert [trace['name'] for trace in results[1]['figure']['data']] == [
+        'a', 'b', 'c']
+
+
+def test_build_many_reports_failures(frame):
+    specs = [('line_chart', frame, None, {}),
+             ('line_chart', frame,
+              dict(downsample=2, downsample_method='mean'), {}),
+             ('bar_chart', frame, dict(mode='sideways'), {})]
+
+    results = build_many(specs, workers=1, output='figure')
+
+    assert isinstance(results[0]['figure'], go.Figure)
+    # fails in the worker
+    assert results[1]['figure'] is None
+    assert results[1]['error'].startswith('ValueError')
+    # fails validation in this process
+    assert results[2]['figure'] is None
+    assert results[2]['error'].startswith('ValueError')
+
+
+def test_build_many_rejects_unknown_builder(frame):
+    with pytest.raises(ValueError):
+        build_many([('pie', frame, None, {})])
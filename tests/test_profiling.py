@@ -0,0 +1,114 @@
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import (
+    bar_chart, display_chart, line_chart, profile, to_json)
+from plotly_chart_generator.chart_styles import bar_values, chart_styles
+from plotly_chart_generator import profiling
+from plotly_chart_generator.profiling import phase
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(5)
+    return pd.DataFrame(rng.integers(1, 9, (3, 4)), index=['a', 'b', 'c'],
+                        columns=['w', 'x', 'y', 'z'])
+
+
+def test_records_every_phase(frame):
+    with profile() as prof:
+        traces = bar_chart(frame)
+        annotations = bar_values(frame, orientation='v')
+        fig = display_chart(traces, chart_styles(title='T'),
+                            annotations=annotations, shapes=[dict(x0=0)],
+                            iplot=False)
+        fig_json = to_json(fig)
+
+    records = prof.report()['records']
+    assert [(r['phase'], r['function']) for r in records] == [
+        ('build', 'bar_chart'), ('annotations', 'bar_values'),
+        ('layout', 'display_chart'), ('annotations', 'display_chart'),
+        ('validation', 'display_chart'), ('serialize', 'to_json')]
+    assert records[0]['traces'] == 3 and records[0]['points'] == 12
+    assert records[1]['annotations'] == 12
+    assert records[3]['shapes'] == 1
+    assert records[4]['traces'] == 3 and records[4]['points'] == 12
+    assert records[5]['bytes'] == len(fig_json)
+    assert all(r['seconds'] >= 0 for r in records)
+
+
+def test_report_is_json_with_a_summary(frame):
+    with profile() as prof:
+        display_chart(line_chart(frame, raw=True), {}, iplot=False,
+                      validate=False)
+        display_chart(line_chart(frame, raw=True), {}, iplot=False,
+                      validate=False)
+
+    report = json.loads(json.dumps(prof.report()))
+    assert report['summary']['build']['calls'] == 2
+    assert report['summary']['build']['points'] == 24
+    assert report['summary']['validation']['traces'] == 6
+
+
+def test_memory_and_callback(frame):
+    seen = []
+    with profile(memory=True, callback=seen.append) as prof:
+        with profile() as inner:
+            line_chart(frame)
+        line_chart(pd.concat([frame] * 100, axis=1))
+
+    assert len(inner.records) == 1 and 'peak_bytes' not in inner.records[0]
+    assert seen == prof.records
+    assert seen[0]['peak_bytes'] > 0
+    assert seen[0]['peak_bytes'] >= seen[0]['allocated_bytes']
+
+
+def test_inactive_by_default(frame):
+    line_chart(frame)
+
+    assert profiling._active.get() is None
+    assert line_chart.__wrapped__.__name__ == 'line_chart'
+
+
+def test_nested_peaks_count_for_the_outer_phase():
+    with profile(memory=True) as prof:
+        with phase('build', 'outer'):
+            with phase('build', 'inner'):
+                block = bytearray(10_000_000)
+                del block
+
+    inner, outer = prof.records
+    assert inner['peak_bytes'] >= 10_000_000
+    assert outer['peak_bytes'] >= inner['peak_bytes']
+
+
+def test_profiles_are_per_thread(frame):
+    entered, done = threading.Barrier(2), threading.Barrier(2)
+    profiles = {}
+
+    def run(name):
+        with profile() as prof:
+            entered.wait()
+            line_chart(frame) if name == 'line' else bar_chart(frame)
+            done.wait()
+        profiles[name] = prof
+        profiles[name + ' after'] = profiling._active.get()
+
+    threads = [threading.Thread(target=run, args=(name,))
+               for name in ('line', 'bar')]
+    for thread in threads:
+        thread.start()
+    with profile() as main:
+        for thread in threads:
+            thread.join()
+
+    assert [r['function'] for r in profiles['line'].records] == [
+        'line_chart']
+    assert [r['function'] for r in profiles['bar'].records] == ['bar_chart']
+    assert main.records == []
+    assert profiles['line after'] is profiles['bar after'] is None
+    assert profiling._active.get() is None
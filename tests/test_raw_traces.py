@@ -0,0 +1,82 @@
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+import pytest
+
+from plotly_chart_generator import (
+    bar_chart, box_plot, display_chart, dot_chart, histogram,
+    line_chart, scatter_chart, sunburst_chart)
+from plotly_chart_generator.chart_styles import chart_styles
+from plotly_chart_generator.pie_chart import pie_chart
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(rng.random((3, 5)),
+                        index=['a', 'b', 'c'],
+                        columns=[f'c{i}' for i in range(5)])
+
+
+def builders(frame):
+    series = [frame[column] for column in frame.columns]
+    return [
+        (bar_chart, dict(df=frame)),
+        (line_chart, dict(df=frame)),
+        (dot_chart, dict(df=frame)),
+        (scatter_chart, dict(data={'s': dict(x=[1, 2], y=[3, 4])})),
+        (histogram, dict(x=frame.iloc[0])),
+        (box_plot, dict(y=series)),
+        (pie_chart, dict(labels=['a', 'b'], values=[1, 2], pull=['a'])),
+        (sunburst_chart, dict(labels=['a', 'b'], parents=['', 'a'],
+                              values=[1, 2])),
+    ]
+
+
+def figure_json(fig):
+    return json.loads(fig.to_json())
+
+
+def as_list(traces):
+    return traces if isinstance(traces, list) else [traces]
+
+
+def test_raw_traces_match_graph_objects(frame):
+    for builder, kwargs in builders(frame):
+        objects = as_list(builder(**kwargs))
+        raw = as_list(builder(raw=True, **kwargs))
+
+        assert all(isinstance(trace, dict) for trace in raw)
+        assert (figure_json(go.Figure(data=raw))
+                == figure_json(go.Figure(data=objects))), builder.__name__
+
+
+def test_display_chart_without_validation(frame):
+    layout = chart_styles(title='Title')
+    annotations = [dict(x='c1', y=0.5, text='note', showarrow=False)]
+    shapes = [dict(type='line', x0=0, x1=1, y0=0, y1=1)]
+
+    fig = display_chart(bar_chart(frame), layout, annotations=annotations,
+                        shapes=shapes, mode='stack', iplot=False)
+    raw = display_chart(bar_chart(frame, raw=True), layout,
+                        annotations=annotations, shapes=shapes,
+                        mode='stack', iplot=False, validate=False)
+
+    assert isinstance(raw, dict)
+    assert figure_json(go.Figure(raw)) == figure_json(fig)
+
+
+@pytest.mark.parametrize('raw', [True, False])
+def test_display_chart_of_a_single_trace(frame, raw):
+    for builder, kwargs in builders(frame):
+        traces = builder(raw=raw, **kwargs)
+        if isinstance(traces, list):
+            continue
+
+        fig = display_chart(traces, {}, iplot=False)
+        plain = display_chart(traces, {}, iplot=False, validate=False)
+
+        assert len(plain['data']) == 1, builder.__name__
+        assert figure_json(go.Figure(plain)) == figure_json(fig)
@@ -0,0 +1,108 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import line_chart
+from plotly_chart_generator.utils.traces import (
+    budget_props, render_cost, warn_render_budget)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(np.random.default_rng(7).random((2, 50)),
+                        index=['a', 'b'])
+
+
+def styled(frame, **kwargs):
+    return line_chart(frame, mode='lines+markers', text='t', marker_size=4,
+                      webgl_threshold=None, **kwargs)
+
+
+def test_render_cost(frame):
+    trace = styled(frame, raw=True)[0]
+
+    # line, spline, markers, gradient and text
+    assert render_cost(trace, 50) == 50 * (1 + 2 + 3 + 3 + 5)
+
+
+def test_within_budget_is_unchanged(frame):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        traces = styled(frame, render_budget=700)
+
+    assert traces[0].line.shape == 'spline'
+    assert traces[0].text == 't'
+
+
+def test_text_is_dropped_first(frame):
+    with pytest.warns(UserWarning, match='dropped: text.'):
+        traces = styled(frame, render_budget=500)
+
+    assert traces[0].text is None
+    assert traces[0].marker.gradient.type == 'radial'
+    assert traces[0].line.shape == 'spline'
+
+
+def test_markers_are_thinned_last(frame):
+    with pytest.warns(UserWarning) as record:
+        traces = styled(frame, render_budget=100)
+
+    assert str(record[0].message) == (
+        'Traces exceed the render budget of 100, dropped: text, marker '
+        "gradient, line shape 'spline', markers beyond 16.")
+    assert traces[1].line.shape == 'linear'
+    assert traces[1].line.smoothing is None
+    assert traces[1].marker.gradient.type is None
+    assert traces[1].marker.maxdisplayed == 16
+    assert render_cost(traces[1].to_plotly_json(), 50) <= 100
+
+
+def test_only_costly_features_are_dropped(frame):
+    with pytest.warns(UserWarning) as record:
+        traces = line_chart(frame, mode='lines', text='t',
+                            webgl_threshold=None, render_budget=100)
+
+    # the gradient adds no cost without markers
+    assert str(record[0].message) == (
+        'Traces exceed the render budget of 100, dropped: text, line shape '
+        "'spline'.")
+    assert traces[0].marker.gradient.type == 'radial'
+
+
+def test_budget_below_the_line_cost(frame):
+    with pytest.warns(UserWarning, match='Some traces still exceed it.'):
+        styled(frame, render_budget=10)
+
+    props, applied, over = budget_props(
+        dict(mode='lines', line=dict(shape='linear')), 50, 10)
+    assert applied == [] and over
+    with pytest.warns(UserWarning, match='nothing left to drop.'):
+        warn_render_budget(applied, 10, over)
+
+
+def test_render_budget_warning_points_at_the_caller(frame):
+    with pytest.warns(UserWarning) as record:
+        line_chart(frame, mode='lines+markers', render_budget=10)
+
+    assert record[0].filename == __file__
+
+
+@pytest.mark.parametrize('line_width', [[1, 4], np.array([1, 4]),
+                                        pd.Series([1, 4])])
+def test_line_width_per_line(frame, line_width):
+    traces = line_chart(frame, line_width=line_width, raw=True)
+
+    assert [trace['line']['width'] for trace in traces] == [1, 4]
+
+
+def test_line_width_scalar(frame):
+    traces = line_chart(frame, line_width=2.5, raw=True)
+
+    assert [trace['line']['width'] for trace in traces] == [2.5, 2.5]
+
+
+def test_line_width_length_is_checked(frame):
+    with pytest.raises(ValueError):
+        line_chart(frame, line_width=[1, 2, 3])
@@ -0,0 +1,114 @@
+import base64
+import gzip
+import json
+import re
+import shutil
+import subprocess
+
+import numpy as np
+import pandas as pd
+import plotly.offline as pyo
+import pytest
+
+from plotly_chart_generator import (
+    bar_chart, display_chart, line_chart, write_report)
+from plotly_chart_generator.report import DECODER, _pack
+
+
+@pytest.fixture
+def figures():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(3, 50)).cumsum(axis=1),
+                      index=['a', 'b', 'c'])
+    bars = pd.DataFrame({'x': [1, 2], 'y': [3, 4]}, index=['p', 'q'])
+    return [display_chart(line_chart(df), dict(title='Lines'), iplot=False),
+            display_chart(bar_chart(bars), dict(title='Bars'), iplot=False,
+                          validate=False)]
+
+
+def figure_json(page, i):
+    match = re.search(
+        f'<script type="application/json" id="pcg-{i}-data">(.*?)</script>',
+        page, re.S)
+    return json.loads(match.group(1))
+
+
+def test_report_embeds_plotlyjs_and_templates_once(figures, tmp_path):
+    path = tmp_path / 'report.html'
+    write_report(figures, path, title='Weekly')
+    page = path.read_text()
+
+    assert page.count(pyo.get_plotlyjs()) == 1
+    templates = json.loads(re.search(
+        '<script type="application/json" id="pcg-templates">(.*?)</script>',
+        page, re.S).group(1))
+    first, second = figure_json(page, 0), figure_json(page, 1)
+    assert first['layout']['template'] == second['layout']['template']
+    assert list(templates) == [first['layout']['template']]
+
+
+def test_numeric_arrays_are_base64_typed_arrays(figures, tmp_path):
+    path = tmp_path / 'report.html'
+    write_report(figures, path)
+    y = figure_json(path.read_text(), 0)['data'][0]['y']
+
+    assert y['dtype'] == 'f8'
+    decoded = np.frombuffer(base64.b64decode(y['bdata']), dtype='<f8')
+    np.testing.assert_array_equal(decoded, figures[0].data[0].y)
+
+
+def test_named_templates_are_embedded_and_layout_stays_plain(tmp_path):
+    figure = dict(data=[dict(type='scatter', y=list(range(20)))],
+                  layout=dict(template='plotly_dark',
+                              xaxis=dict(tickvals=list(range(10)))))
+    path = tmp_path / 'report.html'
+    write_report([figure], path)
+    page = path.read_text()
+
+    templates = json.loads(re.search(
+        '<script type="application/json" id="pcg-templates">(.*?)</script>',
+        page, re.S).group(1))
+    layout = figure_json(page, 0)['layout']
+    assert templates[layout['template']]['layout']['paper_bgcolor'] == (
+        'rgb(17,17,17)')
+    assert layout['xaxis']['tickvals'] == list(range(10))
+    assert figure_json(page, 0)['data'][0]['y']['dtype'] == 'i4'
+
+
+def test_lossless_downcasts():
+    packed = _pack(dict(a=list(range(10)), b=np.arange(10.0),
+                        c=np.arange(10, dtype=np.int64) * 2 ** 40,
+                        d=['x'] * 10, e=[1, 2]))
+
+    assert packed['a']['dtype'] == 'i4'
+    assert packed['b']['dtype'] == 'f4'
+    assert packed['c']['dtype'] == 'f8'
+    assert packed['d'] == ['x'] * 10 and packed['e'] == [1, 2]
+
+
+def test_gzip_copy(figures, tmp_path):
+    path = tmp_path / 'report.html'
+    written = write_report(figures, path, compress='gzip')
+
+    assert written == [str(path), str(path) + '.gz']
+    assert gzip.decompress((tmp_path / 'report.html.gz').read_bytes()) == (
+        path.read_bytes())
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='needs node')
+def test_javascript_decoder_restores_arrays():
+    values = dict(y=np.linspace(0, 1, 9),
+                  z=np.arange(12.5, 24.5).reshape(3, 4),
+                  n=list(range(-5, 5)))
+    script = DECODER + (
+        'var v = pcgDecode(%s);'
+        'console.log(JSON.stringify({y: Array.from(v.y),'
+        ' z: v.z.map(function (r) { return Array.from(r); }),'
+        ' n: Array.from(v.n)}));' % json.dumps(_pack(values)))
+    output = subprocess.run(['node', '-e', script], check=True,
+                            capture_output=True, text=True).stdout
+
+    decoded = json.loads(output)
+    np.testing.assert_array_equal(decoded['y'], values['y'])
+    np.testing.assert_array_equal(decoded['z'], values['z'])
+    assert decoded['n'] == values['n']
@@ -0,0 +1,64 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import display_chart, line_chart, to_json
+from plotly_chart_generator.chart_styles import chart_styles
+
+from .test_raw_traces import builders
+
+ENGINES = ['orjson', 'json']
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(2)
+    values = rng.random((3, 20))
+    values[1, 4] = np.nan
+    return pd.DataFrame(values, index=['a', 'b', 'c'],
+                        columns=pd.date_range('2023-01-01', periods=20,
+                                              freq='D'))
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_matches_figure_to_json(frame, engine):
+    frame = frame.iloc[:, :5].rename(columns=lambda c: f'{c:%d %b}')
+    for builder, kwargs in builders(frame):
+        fig = display_chart(builder(**kwargs), chart_styles(title='T'),
+                            iplot=False)
+
+        assert json.loads(to_json(fig, engine)) == json.loads(fig.to_json())
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_raw_figure_matches_validated_figure(frame, engine):
+    fig = display_chart(line_chart(frame), chart_styles(title='T'),
+                        iplot=False)
+    raw = display_chart(line_chart(frame, raw=True), chart_styles(title='T'),
+                        iplot=False, validate=False)
+
+    assert json.loads(to_json(raw, engine)) == json.loads(fig.to_json())
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_numpy_and_pandas_values(engine):
+    times = pd.to_datetime(['2023-01-01 00:00:00.5', None])
+    figure = dict(data=[dict(
+        type='scatter', x=times.to_numpy(), y=np.array([1.5, np.inf]),
+        customdata=np.arange(6, dtype=np.int64).reshape(3, 2)[:, 0],
+        text=pd.Series(['a', 'b']),
+        marker=dict(size=np.float16(3)))],
+        layout=dict(title=pd.Timestamp('2023-01-02')))
+
+    assert json.loads(to_json(figure, engine)) == dict(
+        data=[dict(type='scatter', x=['2023-01-01T00:00:00.500000', None],
+                   y=[1.5, None], customdata=[0, 2, 4], text=['a', 'b'],
+                   marker=dict(size=3.0))],
+        layout=dict(title='2023-01-02T00:00:00'))
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        to_json(dict(data=[], layout={}), engine='ujson')
@@ -0,0 +1,48 @@
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+import plotly.io as pio
+
+from plotly_chart_generator import bar_chart, display_chart
+from plotly_chart_generator.chart_styles import (
+    chart_styles, style_template, theme)
+
+
+def test_same_arguments_compile_once():
+    name = style_template(title='Sales', yaxis_tickvals=[1, 2, 3])
+    info = style_template.cache_info()
+
+    assert style_template(yaxis_tickvals=(1, 2, 3), title='Sales') == name
+    assert style_template.cache_info().hits == info.hits + 1
+    assert name in pio.templates
+    assert style_template(title='Costs') != name
+
+
+def test_template_contains_theme_and_styles():
+    name = style_template(theme='light', title='Light', bg_color='white')
+    layout = pio.templates[name].layout
+
+    assert layout.title.text == 'Light'
+    assert layout.plot_bgcolor == 'white'
+    assert layout.title.font.color == theme('light')['title_color']
+    # plotly's default template is kept underneath
+    assert layout.colorway == pio.templates[pio.templates.default].layout.colorway
+
+
+def test_display_chart_with_template():
+    df = pd.DataFrame(np.arange(6.).reshape(2, 3), index=['a', 'b'])
+    name = style_template(title='Template', width=400)
+
+    fig = display_chart(bar_chart(df), name, iplot=False)
+    styled = go.Figure(bar_chart(df), layout=chart_styles(title='Template',
+                                                          width=400))
+    assert fig.layout.template.layout.title.text == 'Template'
+    assert fig.layout.template.layout.width == styled.layout.width
+
+    raw = display_chart(bar_chart(df, raw=True), name, iplot=False,
+                        validate=False)
+    assert raw['layout']['template']['layout']['width'] == 400
+    assert (json.loads(go.Figure(raw).to_json())
+            == json.loads(fig.to_json()))
@@ -0,0 +1,72 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from plotly.subplots import make_subplots
+
+from plotly_chart_generator import bar_chart, sunburst_chart
+from plotly_chart_generator.chart_styles import chart_styles
+from plotly_chart_generator.subplots import (
+    grid_subplots, pie_subplots, scatter_subplots)
+
+
+@pytest.mark.parametrize('titles', [None, list('abcdefghijkl')])
+def test_domains_match_make_subplots(titles):
+    expected = make_subplots(rows=3, cols=4, subplot_titles=titles).layout
+    panels = [[dict(type='scatter', x=[1], y=[i])] for i in range(12)]
+
+    fig = grid_subplots(panels, 3, 4, titles, iplot=False)
+
+    for i in range(12):
+        suffix = '' if i == 0 else str(i + 1)
+        for axis in (f'xaxis{suffix}', f'yaxis{suffix}'):
+            np.testing.assert_allclose(fig.layout[axis].domain,
+                                       expected[axis].domain, atol=1e-12)
+            assert fig.layout[axis].anchor == expected[axis].anchor
+        assert fig.data[i].xaxis == f'x{suffix}'
+    for got, want in zip(fig.layout.annotations, expected.annotations):
+        assert got.text == want.text
+        assert (got.x, got.y) == pytest.approx((want.x, want.y))
+
+
+def test_builders_and_domain_traces():
+    df = pd.DataFrame({'a': [1, 2], 'b': [3, 4]}, index=['x', 'y'])
+    sunburst = sunburst_chart(labels=['a', 'b'], parents=['', 'a'],
+                              values=[1, 2], raw=True)
+
+    fig = grid_subplots([bar_chart(df, raw=True), None, sunburst], cols=2,
+                        layout=dict(xaxis=dict(showgrid=False)),
+                        validate=False, iplot=False)
+
+    bars, sun = fig['data'][:2], fig['data'][2]
+    assert [bar['xaxis'] for bar in bars] == ['x', 'x']
+    assert 'xaxis' not in sun and sun['domain']['y'] == [0, 0.425]
+    assert fig['layout']['xaxis']['showgrid'] is False
+    assert 'xaxis2' not in fig['layout'] and 'xaxis3' not in fig['layout']
+
+
+def test_too_many_panels():
+    with pytest.raises(ValueError):
+        grid_subplots([None] * 7, rows=2, cols=3)
+
+
+@pytest.mark.parametrize('rows', [None, 2])
+def test_no_panels(rows):
+    fig = grid_subplots([], rows=rows, iplot=False, validate=False)
+
+    assert fig['data'] == []
+
+
+def test_pie_and_scatter_subplots_keep_their_output():
+    pies = pie_subplots({'p': {'a': 1, 'b': 2}, 'q': {'a': 3, 'b': 1}},
+                        1, 2, ['P', 'Q'], dict(title='Pies'), iplot=False)
+    data = {'s': dict(x=[1, 2], y=[3, 4], names=['a', 'b'])}
+    scatter = scatter_subplots(data, chart_styles(title='S'), 1, 1, ['S'],
+                               iplot=False)
+
+    assert [pie.domain.x for pie in pies.data] == [
+        (0, pytest.approx(0.45)), (pytest.approx(0.55), 1)]
+    assert pies.layout.annotations[1].font.size == 12
+    assert json.loads(scatter.to_json())['data'][0]['mode'] == 'markers'
+    assert scatter.layout.xaxis.color == chart_styles()['xaxis']['color']
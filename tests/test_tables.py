@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plotly_chart_generator import (
+    bar_chart, box_plot, histogram, line_chart, scatter_chart)
+from plotly_chart_generator.utils.tables import (
+    as_array, as_table, is_column, is_table)
+
+
+class ArrowStream:
+    """Minimal object exporting Arrow data through the PyCapsule API."""
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(12)
+    return pd.DataFrame(dict(day=np.arange(6), a=rng.random(6),
+                             b=rng.random(6)))
+
+
+def test_pandas_and_numpy_are_not_tables():
+    assert not is_table(pd.DataFrame(dict(a=[1.])))
+    assert not is_column(pd.Series([1.]))
+    assert not is_column(np.arange(3))
+
+
+def test_arrow_stream_objects_are_tables():
+    assert is_table(ArrowStream())
+
+
+def test_other_values_pass_through_as_array():
+    values = np.arange(3.)
+
+    assert as_array(values) is values
+
+
+def test_arrow_stream_without_pyarrow_raises(monkeypatch):
+    monkeypatch.setitem(__import__('sys').modules, 'pyarrow', None)
+
+    with pytest.raises(ImportError, match='requires pyarrow'):
+        as_table(ArrowStream())
+
+
+def test_pyarrow_columns_are_views(frame):
+    pa = pytest.importorskip('pyarrow')
+    column = pa.array(frame['a'].to_numpy())
+
+    values = as_array(column)
+
+    np.testing.assert_array_equal(values, frame['a'])
+    assert not values.flags.writeable
+
+
+@pytest.mark.parametrize('library', ['pyarrow', 'polars'])
+def test_line_chart_of_a_table_matches_pandas(frame, library):
+    module = pytest.importorskip(library)
+    table = (module.table(dict(frame.items())) if library == 'pyarrow'
+             else module.DataFrame(dict(frame.items())))
+
+    traces = line_chart(table, x='day', raw=True)
+    expected = line_chart(frame.set_index('day').T, raw=True)
+
+    assert [trace['name'] for trace in traces] == ['a', 'b']
+    for trace, other in zip(traces, expected):
+        np.testing.assert_array_equal(trace['x'], other['x'])
+        np.testing.assert_array_equal(trace['y'], other['y'])
+
+
+@pytest.mark.parametrize('library', ['pyarrow', 'polars'])
+def test_bar_chart_and_box_plot_of_a_table(frame, library):
+    module = pytest.importorskip(library)
+    table = (module.table(dict(frame.items())) if library == 'pyarrow'
+             else module.DataFrame(dict(frame.items())))
+
+    bars = bar_chart(table, x='day', raw=True)
+    boxes = box_plot(y=table, raw=True)
+
+    assert [trace['name'] for trace in bars] == ['a', 'b']
+    assert [trace['name'] for trace in boxes] == ['day', 'a', 'b']
+    assert boxes[1]['median'] == pytest.approx([np.median(frame['a'])])
+
+
+def test_histogram_and_scatter_chart_of_pyarrow_columns(frame):
+    pa = pytest.importorskip('pyarrow')
+    a, b = pa.array(frame['a'].to_numpy()), pa.array(frame['b'].to_numpy())
+
+    trace = histogram(x=a, raw=True)
+    traces = scatter_chart(dict(points=dict(x=a, y=b)), raw=True)
+
+    np.testing.assert_array_equal(trace['x'], frame['a'])
+    np.testing.assert_array_equal(traces[0]['x'], frame['a'])
@@ -0,0 +1,57 @@
+import contextlib
+import warnings
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as go
+import pytest
+
+from plotly_chart_generator import (
+    dot_chart, line_chart, profile, scatter_chart)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(np.random.default_rng(2).random((2, 50)),
+                        index=['a', 'b'])
+
+
+def test_line_chart_below_threshold_is_unchanged(frame):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        traces = line_chart(frame, webgl_threshold=100)
+
+    assert all(isinstance(trace, go.Scatter) for trace in traces)
+    assert traces[0].line.shape == 'spline'
+
+
+def test_line_chart_switches_to_webgl(frame):
+    with pytest.warns(UserWarning, match='spline'):
+        traces = line_chart(frame, webgl_threshold=99)
+
+    assert all(isinstance(trace, go.Scattergl) for trace in traces)
+    assert traces[0].line.shape == 'linear'
+    assert 'gradient' not in traces[0].marker.to_plotly_json()
+
+
+@pytest.mark.parametrize('context', [contextlib.nullcontext, profile])
+def test_webgl_warning_points_at_the_caller(frame, context):
+    with pytest.warns(UserWarning) as record, context():
+        line_chart(frame, webgl_threshold=99)
+
+    assert record[0].filename == __file__
+
+
+def test_webgl_can_be_disabled(frame):
+    traces = line_chart(frame.reindex(columns=range(50_000), fill_value=0),
+                        webgl_threshold=None)
+    assert isinstance(traces[0], go.Scatter)
+
+
+def test_scatter_and_dot_chart_thresholds(frame):
+    data = {'s': dict(x=np.arange(10), y=np.arange(10))}
+    assert isinstance(scatter_chart(data, webgl_threshold=9)[0], go.Scattergl)
+    assert isinstance(scatter_chart(data, webgl_threshold=10)[0], go.Scatter)
+
+    raw = dot_chart(frame, webgl_threshold=10, raw=True)
+    assert raw[0]['type'] == 'scattergl'